@@ -0,0 +1,214 @@
+"""
+Read models of the read-only JSON API.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Tuple
+
+import orjson
+from django.db.models import (
+    Case,
+    CharField,
+    Count,
+    ExpressionWrapper,
+    F,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+
+from .models import Budget, BudgetMonth, BudgetMonthSummary, ExpenseItem, Payment
+from .money import Money, MoneyField
+from .pagination import KeysetPage, KeysetPaginator
+
+
+class BudgetApiService:
+    """
+    Service building read models of the read-only JSON API.
+
+    Rows are selected with values(), with paid, remaining and status
+    computed in SQL, so no model instances are built, and the whole
+    response is encoded by orjson in a single call. Lists are paginated
+    with keyset cursors.
+    """
+
+    VERSION = 1
+    DEFAULT_LIMIT = 500
+    MAX_LIMIT = 10000
+
+    @classmethod
+    def get_summary(cls, budget: Budget) -> Dict[str, Any]:
+        """
+        Get dashboard summary: budget balance, most recent month and overdue items.
+
+        Args:
+            budget: Budget to summarize
+
+        Returns:
+            Dict[str, Any]: Summary, with month None when no month exists yet
+        """
+        balances = (
+            Budget.objects.with_balances(from_summaries=True)
+            .values("committed_total", "current_balance")
+            .get(pk=budget.pk)
+        )
+        month = cls.get_month_rows(budget.pk).order_by("-period").first()
+
+        overdue: Dict[str, Any] = {"count": 0, "amount": Money(0)}
+        if month:
+            overdue = (
+                ExpenseItem.objects.pending()
+                .filter(month__budget=budget, month__period__lt=month["period"])
+                .aggregate(
+                    count=Count("id"),
+                    amount=Coalesce(
+                        Sum(F("amount") - F("paid_total")),
+                        Value(0),
+                        output_field=MoneyField(),
+                    ),
+                )
+            )
+
+        return {
+            "budget": {
+                "id": budget.pk,
+                "name": budget.name,
+                "start_date": budget.start_date,
+                "initial_amount": budget.initial_amount,
+                **balances,
+            },
+            "month": month,
+            "overdue": overdue,
+        }
+
+    @classmethod
+    def get_month_rows(cls, budget_id: int):
+        """Get months of a budget with their summary totals, as values() rows."""
+        # Months without a summary row have no expense items yet
+        totals = {
+            name: Coalesce(
+                f"summary__{name}",
+                Value(0),
+                output_field=BudgetMonthSummary._meta.get_field(name).clone(),
+            )
+            for name in BudgetMonthSummary.SUMMARY_FIELDS
+        }
+        return BudgetMonth.objects.filter(budget_id=budget_id).values(
+            "id", "year", "month", "period", **totals
+        )
+
+    @classmethod
+    def get_item_rows(cls, budget_id: int):
+        """
+        Get expense items of a budget as values() rows.
+
+        Paid total and payment count come from the stored totals maintained
+        by Payment; remaining (negative = still owed) and status are
+        computed in SQL.
+        """
+        return ExpenseItem.objects.filter(expense__budget_id=budget_id).values(
+            "id",
+            "expense_id",
+            "due_date",
+            "amount",
+            "payment_count",
+            title=F("expense__title"),
+            payee=F("expense__payee__name"),
+            period=F("month__period"),
+            paid=F("paid_total"),
+            remaining=ExpressionWrapper(
+                F("paid_total") - F("amount"), output_field=MoneyField()
+            ),
+            status=Case(
+                When(paid_total__gte=F("amount"), then=Value(ExpenseItem.STATUS_PAID)),
+                default=Value(ExpenseItem.STATUS_PENDING),
+                output_field=CharField(),
+            ),
+        )
+
+    @classmethod
+    def get_payment_rows(cls, budget_id: int):
+        """Get payments of a budget as values() rows."""
+        return Payment.objects.filter(
+            expense_item__expense__budget_id=budget_id
+        ).values(
+            "id",
+            "expense_item_id",
+            "amount",
+            "payment_date",
+            "transaction_id",
+            expense_id=F("expense_item__expense_id"),
+            title=F("expense_item__expense__title"),
+            method=F("payment_method__name"),
+            period=F("expense_item__month__period"),
+        )
+
+    @classmethod
+    def get_months(cls, budget_id: int, params: Dict[str, Any]) -> KeysetPage:
+        """Get page of months, newest first."""
+        return cls._paginate(cls.get_month_rows(budget_id), ("-period",), params)
+
+    @classmethod
+    def get_items(cls, budget_id: int, params: Dict[str, Any]) -> KeysetPage:
+        """
+        Get page of expense items ordered by due date.
+
+        Supported filters: month=YYYY-MM and status=pending|paid.
+
+        Raises:
+            ValueError: If a filter value is invalid
+        """
+        rows = cls.get_item_rows(budget_id)
+        if params.get("month"):
+            rows = rows.filter(month__period=cls._parse_period(params["month"]))
+        status = params.get("status")
+        if status == ExpenseItem.STATUS_PENDING:
+            rows = rows.pending()
+        elif status == ExpenseItem.STATUS_PAID:
+            rows = rows.paid()
+        elif status:
+            raise ValueError(f"Unknown status: {status}")
+        return cls._paginate(rows, ("due_date", "id"), params)
+
+    @classmethod
+    def get_payments(cls, budget_id: int, params: Dict[str, Any]) -> KeysetPage:
+        """Get page of payments in the order they were recorded."""
+        return cls._paginate(cls.get_payment_rows(budget_id), ("id",), params)
+
+    @classmethod
+    def get_limit(cls, params: Dict[str, Any]) -> int:
+        """Read page size from "limit" parameter, clamped to MAX_LIMIT."""
+        try:
+            limit = int(params.get("limit", cls.DEFAULT_LIMIT))
+        except (TypeError, ValueError):
+            limit = cls.DEFAULT_LIMIT
+        return max(1, min(limit, cls.MAX_LIMIT))
+
+    @staticmethod
+    def dumps(data: Any) -> bytes:
+        """Encode data as JSON, with amounts as exact decimal strings."""
+        return orjson.dumps(data, default=_json_default)
+
+    @classmethod
+    def _paginate(
+        cls, rows: Any, ordering: Tuple[str, ...], params: Dict[str, Any]
+    ) -> KeysetPage:
+        return KeysetPaginator(rows, ordering, cls.get_limit(params)).get_page(params)
+
+    @staticmethod
+    def _parse_period(value: str) -> int:
+        try:
+            month = datetime.strptime(value, "%Y-%m")
+        except ValueError:
+            raise ValueError(f"Invalid month: {value} (expected YYYY-MM)")
+        return BudgetMonth.compute_period(month.year, month.month)
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values orjson does not handle natively."""
+    if isinstance(value, Decimal):
+        # Money and other decimals keep exact cents as strings, like exports
+        return str(value)
+    raise TypeError
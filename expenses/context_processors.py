@@ -1,6 +1,6 @@
 import os
 import sys
-from .models import Budget
+from . import request_cache
 from .services import VersionService
 
 
@@ -14,10 +14,8 @@ def current_budget(request):
     budget = None
 
     if budget_id:
-        try:
-            budget = Budget.objects.get(id=budget_id)
-        except Budget.DoesNotExist:
-            budget = None
+        # Shares the lookup with views using request_cache.get_budget_or_404()
+        budget = request_cache.get_budget(budget_id)
 
     return {"current_budget": budget, "current_budget_id": budget_id}
 
@@ -0,0 +1,399 @@
+"""
+Import of historical expenses and payments from CSV files.
+"""
+
+import csv
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+
+from .fields import SanitizedDecimalField
+from .models import (
+    Budget,
+    BudgetMonth,
+    BudgetMonthSummary,
+    Expense,
+    ExpenseItem,
+    Payee,
+    Payment,
+    PaymentMethod,
+)
+from .money import Money, to_cents
+from .search import ExpenseSearchService
+from .services import DataVersionService
+
+
+@dataclass(frozen=True)
+class CsvImportError:
+    """Problem found in a single row of an imported CSV file."""
+
+    line: int
+    message: str
+
+
+@dataclass
+class CsvImportResult:
+    """Outcome of a CSV import."""
+
+    rows: int = 0
+    expenses: int = 0
+    payments: int = 0
+    payees: int = 0
+    payment_methods: int = 0
+    error_count: int = 0
+    errors: List[CsvImportError] = field(default_factory=list)
+    dry_run: bool = False
+
+
+class CsvImportRow(NamedTuple):
+    """Parsed and validated row of an imported CSV file."""
+
+    line: int
+    title: str
+    payee: Optional[Payee]  # Not saved yet for payees new to the database
+    amount: int  # In cents, like all amounts here
+    due_date: date
+    month_id: int
+    notes: Optional[str]
+    paid_amount: Optional[int]  # None when the row has no payment
+    payment_date: Optional[datetime]
+    payment_method: Optional[PaymentMethod]
+    transaction_id: Optional[str]
+
+    @property
+    def is_paid(self) -> bool:
+        return self.paid_amount is not None and self.paid_amount >= self.amount
+
+
+class CsvExpenseImporter:
+    """
+    Importer of historical expenses and payments from CSV files into a budget.
+
+    Every row becomes a one-time expense with a single expense item in the
+    budget month of its due date, paid when the row has a payment date.
+    Amounts are parsed with the rules of SanitizedDecimalField, payees and
+    payment methods are resolved by name through in-memory maps (missing
+    ones are created), and valid rows are written in chunks, each inside its
+    own savepoint (rows of a failing chunk are retried one at a time).
+    Invalid rows are reported and skipped; they never abort the import.
+
+    Chunks are written with bulk_create(), which sets ids of new rows on
+    all supported databases (SQLite 3.35+ included). Month summaries and
+    the search index are refreshed once, after all chunks.
+
+    Columns (header names are case-insensitive):
+    - title, amount, due_date (YYYY-MM-DD): required
+    - payee, notes: optional
+    - payment_date (YYYY-MM-DD, optionally with time): marks the item paid
+    - paid_amount: paid amount if not the full amount
+    - payment_method, transaction_id: optional payment details
+    """
+
+    REQUIRED_COLUMNS = ("title", "amount", "due_date")
+    OPTIONAL_COLUMNS = (
+        "payee",
+        "notes",
+        "payment_date",
+        "paid_amount",
+        "payment_method",
+        "transaction_id",
+    )
+    CHUNK_SIZE = 2000
+    # Rows per INSERT statement of bulk_create()
+    BATCH_SIZE = 500
+    # Reported errors are capped, error_count still counts all of them
+    MAX_REPORTED_ERRORS = 1000
+    # SQLite page cache used while importing, in KiB; with the default 2 MB,
+    # index updates of large imports keep spilling pages to disk
+    SQLITE_CACHE_KIB = 65536
+
+    # Amounts without symbols or thousand separators (like 10.50 or 10,50)
+    # parse the same with or without SanitizedDecimalField
+    PLAIN_AMOUNT_RE = re.compile(r"(\d{1,11})(?:[.,](\d{1,2}))?")
+
+    def __init__(self, budget: Budget) -> None:
+        self.budget = budget
+        self.month_ids = {
+            (year, month): pk
+            for year, month, pk in BudgetMonth.objects.filter(
+                budget=budget
+            ).values_list("year", "month", "pk")
+        }
+        self.payees = {
+            payee.name.casefold(): payee for payee in Payee.objects.only("pk", "name")
+        }
+        self.payment_methods = {
+            method.name.casefold(): method
+            for method in PaymentMethod.objects.only("pk", "name")
+        }
+        self.amount_field = SanitizedDecimalField(
+            max_digits=13, decimal_places=2, min_value=Decimal("0.01")
+        )
+        self.title_max_length = Expense._meta.get_field("title").max_length
+        self.timezone = timezone.get_current_timezone()
+
+    def run(self, lines: Iterable[str], dry_run: bool = False) -> CsvImportResult:
+        """
+        Import rows of a CSV file.
+
+        Args:
+            lines: Text lines of the file, e.g. an open file object
+            dry_run: Validate and write rows, then roll everything back
+
+        Returns:
+            CsvImportResult: Created object counts and row errors
+
+        Raises:
+            ValueError: If the header lacks required columns
+        """
+        reader = csv.DictReader(lines)
+        reader.fieldnames = [
+            (name or "").strip().lower() for name in reader.fieldnames or []
+        ]
+        missing = [
+            name for name in self.REQUIRED_COLUMNS if name not in reader.fieldnames
+        ]
+        if missing:
+            raise ValueError(f"Missing required column(s): {', '.join(missing)}")
+
+        result = CsvImportResult(dry_run=dry_run)
+        month_ids: set = set()
+        expense_ids: List[int] = []
+        with self._sqlite_cache(), transaction.atomic():
+            chunk: List[CsvImportRow] = []
+            for row in reader:
+                result.rows += 1
+                try:
+                    chunk.append(self._parse_row(reader.line_num, row))
+                except ValidationError as e:
+                    self._add_error(result, reader.line_num, " ".join(e.messages))
+                    continue
+                if len(chunk) >= self.CHUNK_SIZE:
+                    month_ids.update(self._write_chunk(chunk, result, expense_ids))
+                    chunk = []
+            if chunk:
+                month_ids.update(self._write_chunk(chunk, result, expense_ids))
+
+            if dry_run:
+                transaction.set_rollback(True)
+            elif result.expenses:
+                # bulk_create() bypasses model saves, so refresh summaries
+                # and index new expenses once for the whole file
+                BudgetMonthSummary.refresh(month_ids)
+                ExpenseSearchService.index_expenses(expense_ids)
+                # Payee expense counts change with new expenses
+                DataVersionService.bump_payee_directory()
+                if result.payees or result.payment_methods:
+                    # New names are listed in dropdowns of all budgets
+                    DataVersionService.bump_global()
+        return result
+
+    @contextmanager
+    def _sqlite_cache(self) -> Iterator[None]:
+        """Enlarge SQLite page cache of the connection for the import."""
+        if connection.vendor != "sqlite":
+            yield
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA cache_size")
+            cache_size = cursor.fetchone()[0]
+            cursor.execute(f"PRAGMA cache_size = -{self.SQLITE_CACHE_KIB}")
+        try:
+            yield
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute(f"PRAGMA cache_size = {int(cache_size)}")
+
+    def _parse_row(self, line: int, row: Dict[str, Optional[str]]) -> CsvImportRow:
+        title = (row.get("title") or "").strip()
+        if not title:
+            raise ValidationError("Title is required.")
+        if len(title) > self.title_max_length:
+            raise ValidationError(
+                f"Title is longer than {self.title_max_length} characters."
+            )
+
+        amount = self._parse_amount(row.get("amount"), "amount")
+        due_date = self._parse_date(row.get("due_date"), "due_date").date()
+        month_id = self.month_ids.get((due_date.year, due_date.month))
+        if month_id is None:
+            raise ValidationError(f"Budget has no month {due_date:%Y-%m}.")
+
+        paid_amount = payment_date = None
+        if (row.get("payment_date") or "").strip():
+            paid_amount = amount
+            if (row.get("paid_amount") or "").strip():
+                paid_amount = self._parse_amount(row["paid_amount"], "paid_amount")
+                if paid_amount > amount:
+                    raise ValidationError("Paid amount exceeds the amount.")
+            payment_date = self._parse_date(row["payment_date"], "payment_date")
+            if timezone.is_naive(payment_date):
+                payment_date = timezone.make_aware(payment_date, self.timezone)
+        elif (row.get("paid_amount") or "").strip():
+            raise ValidationError("Paid amount requires a payment date.")
+
+        return CsvImportRow(
+            line=line,
+            title=title,
+            payee=self._resolve(self.payees, Payee, row.get("payee")),
+            amount=amount,
+            due_date=due_date,
+            month_id=month_id,
+            notes=(row.get("notes") or "").strip() or None,
+            paid_amount=paid_amount,
+            payment_date=payment_date,
+            payment_method=(
+                self._resolve(
+                    self.payment_methods, PaymentMethod, row.get("payment_method")
+                )
+                if payment_date
+                else None
+            ),
+            transaction_id=(
+                (row.get("transaction_id") or "").strip() or None
+                if payment_date
+                else None
+            ),
+        )
+
+    def _parse_amount(self, value: Optional[str], column: str) -> int:
+        """Parse amount into cents."""
+        value = (value or "").strip()
+        match = self.PLAIN_AMOUNT_RE.fullmatch(value)
+        if match:
+            cents = int(match[1]) * 100 + int((match[2] or "").ljust(2, "0"))
+            if cents:
+                return cents
+        try:
+            return to_cents(self.amount_field.clean(value))
+        except ValidationError as e:
+            raise ValidationError(f"Invalid {column}: {' '.join(e.messages)}")
+
+    @staticmethod
+    def _parse_date(value: Optional[str], column: str) -> datetime:
+        try:
+            return datetime.fromisoformat((value or "").strip())
+        except ValueError:
+            raise ValidationError(
+                f"Invalid {column} (expected YYYY-MM-DD): {value or 'empty'}"
+            )
+
+    @staticmethod
+    def _resolve(names: dict, model, name: Optional[str]):
+        """Find object by case-insensitive name, creating (unsaved) new ones."""
+        name = (name or "").strip()
+        if not name:
+            return None
+        obj = names.get(name.casefold())
+        if obj is None:
+            obj = names[name.casefold()] = model(name=name)
+        return obj
+
+    def _write_chunk(
+        self, chunk: List[CsvImportRow], result: CsvImportResult, expense_ids: list
+    ) -> set:
+        """
+        Write parsed rows in a savepoint, returning ids of affected months.
+
+        When the chunk fails, its rows are written again one at a time, each
+        in its own savepoint, so only rows failing on their own are reported.
+        Ids of new expenses are added to expense_ids.
+        """
+        payees = self._unsaved(row.payee for row in chunk)
+        methods = self._unsaved(row.payment_method for row in chunk)
+        try:
+            with transaction.atomic():
+                Payee.objects.bulk_create(payees)
+                PaymentMethod.objects.bulk_create(methods)
+                new_expense_ids, payments = self._insert_rows(chunk)
+        except DatabaseError as e:
+            # Objects rolled back with the savepoint are created again by
+            # the rows written next
+            for obj in (*payees, *methods):
+                obj.pk = None
+                obj._state.adding = True
+            if len(chunk) == 1:
+                self._add_error(result, chunk[0].line, f"Row not saved: {e}")
+                return set()
+            month_ids: set = set()
+            for row in chunk:
+                month_ids.update(self._write_chunk([row], result, expense_ids))
+            return month_ids
+
+        expense_ids.extend(new_expense_ids)
+        result.expenses += len(chunk)
+        result.payments += payments
+        result.payees += len(payees)
+        result.payment_methods += len(methods)
+        return {row.month_id for row in chunk}
+
+    def _insert_rows(self, chunk: List[CsvImportRow]) -> Tuple[List[int], int]:
+        """
+        Write rows with bulk_create().
+
+        Returns:
+            Tuple[List[int], int]: Ids of new expenses and number of payments
+        """
+        closed_at = timezone.now()
+        expenses = []
+        items = []
+        payments = []
+        for row in chunk:
+            expense = Expense(
+                budget=self.budget,
+                title=row.title,
+                payee=row.payee,
+                expense_type=Expense.TYPE_ONE_TIME,
+                amount=Money.from_cents(row.amount),
+                start_date=row.due_date,
+                day_of_month=row.due_date.day,
+                notes=row.notes,
+                closed_at=closed_at if row.is_paid else None,
+            )
+            item = ExpenseItem(
+                expense=expense,
+                month_id=row.month_id,
+                due_date=row.due_date,
+                amount=Money.from_cents(row.amount),
+                paid_total=Money.from_cents(row.paid_amount or 0),
+                payment_count=0 if row.paid_amount is None else 1,
+            )
+            expenses.append(expense)
+            items.append(item)
+            if row.paid_amount is not None:
+                payments.append(
+                    Payment(
+                        expense_item=item,
+                        amount=Money.from_cents(row.paid_amount),
+                        payment_date=row.payment_date,
+                        payment_method=row.payment_method,
+                        transaction_id=row.transaction_id,
+                    )
+                )
+
+        Expense.objects.bulk_create(expenses, batch_size=self.BATCH_SIZE)
+        ExpenseItem.objects.bulk_create(items, batch_size=self.BATCH_SIZE)
+        Payment.objects.bulk_create(payments, batch_size=self.BATCH_SIZE)
+        return [expense.pk for expense in expenses], len(payments)
+
+    @staticmethod
+    def _unsaved(objects: Iterable[Any]) -> list:
+        """Collect distinct not yet saved payees or payment methods."""
+        unsaved = {}
+        for obj in objects:
+            if obj is not None and obj.pk is None:
+                unsaved[id(obj)] = obj
+        return list(unsaved.values())
+
+    def _add_error(self, result: CsvImportResult, line: int, message: str) -> None:
+        result.error_count += 1
+        if len(result.errors) < self.MAX_REPORTED_ERRORS:
+            result.errors.append(CsvImportError(line, message))
@@ -0,0 +1,167 @@
+"""
+Streaming CSV and JSON lines export of budget data.
+"""
+
+import csv
+import io
+import json
+from datetime import date
+from decimal import Decimal
+from typing import Iterator, List
+
+from .models import Expense, ExpenseItem, Payment
+
+
+class BudgetExportService:
+    """
+    Service for streaming expenses, expense items and payments of a budget
+    as CSV or JSON lines.
+
+    Rows are read with queryset.iterator() and encoded one chunk at a time,
+    so memory use stays flat regardless of how long the budget history is.
+    """
+
+    FORMATS = {
+        "csv": "text/csv",
+        "jsonl": "application/x-ndjson",
+    }
+    CHUNK_SIZE = 2000
+
+    # Model, budget lookup and (column name, values_list() lookup) pairs
+    DATASETS = {
+        "expenses": (
+            Expense,
+            "budget_id",
+            (
+                ("id", "id"),
+                ("title", "title"),
+                ("expense_type", "expense_type"),
+                ("payee", "payee__name"),
+                ("amount", "amount"),
+                ("start_date", "start_date"),
+                ("day_of_month", "day_of_month"),
+                ("total_parts", "total_parts"),
+                ("skip_parts", "skip_parts"),
+                ("end_date", "end_date"),
+                ("closed_at", "closed_at"),
+                ("notes", "notes"),
+            ),
+        ),
+        "items": (
+            ExpenseItem,
+            "expense__budget_id",
+            (
+                ("id", "id"),
+                ("expense_id", "expense_id"),
+                ("expense", "expense__title"),
+                ("year", "month__year"),
+                ("month", "month__month"),
+                ("due_date", "due_date"),
+                ("amount", "amount"),
+                ("paid_total", "paid_total"),
+                ("payment_count", "payment_count"),
+            ),
+        ),
+        "payments": (
+            Payment,
+            "expense_item__expense__budget_id",
+            (
+                ("id", "id"),
+                ("expense_item_id", "expense_item_id"),
+                ("expense_id", "expense_item__expense_id"),
+                ("expense", "expense_item__expense__title"),
+                ("payment_date", "payment_date"),
+                ("amount", "amount"),
+                ("payment_method", "payment_method__name"),
+                ("transaction_id", "transaction_id"),
+            ),
+        ),
+    }
+
+    @classmethod
+    def get_columns(cls, dataset: str) -> List[str]:
+        """Get column names of a dataset."""
+        return [name for name, _lookup in cls.DATASETS[dataset][2]]
+
+    @classmethod
+    def get_rows(cls, budget_id: int, dataset: str) -> Iterator[tuple]:
+        """
+        Iterate over raw rows of a dataset, in primary key order.
+
+        Args:
+            budget_id: ID of the budget to export
+            dataset: One of DATASETS keys
+
+        Returns:
+            Iterator[tuple]: Row values in get_columns() order
+        """
+        model, budget_lookup, columns = cls.DATASETS[dataset]
+        queryset = (
+            model.objects.filter(**{budget_lookup: budget_id})
+            .order_by("pk")
+            .values_list(*[lookup for _name, lookup in columns])
+        )
+        return queryset.iterator(chunk_size=cls.CHUNK_SIZE)
+
+    @classmethod
+    def stream(cls, budget_id: int, dataset: str, fmt: str) -> Iterator[str]:
+        """
+        Encode a dataset as text chunks of up to CHUNK_SIZE rows each.
+
+        Args:
+            budget_id: ID of the budget to export
+            dataset: One of DATASETS keys
+            fmt: One of FORMATS keys
+
+        Returns:
+            Iterator[str]: Chunks of the exported file
+
+        Raises:
+            ValueError: If dataset or format is not supported
+        """
+        if dataset not in cls.DATASETS:
+            raise ValueError(f"Unsupported export dataset: {dataset}")
+        if fmt not in cls.FORMATS:
+            raise ValueError(f"Unsupported export format: {fmt}")
+        return cls._stream(budget_id, dataset, fmt)
+
+    @classmethod
+    def _stream(cls, budget_id: int, dataset: str, fmt: str) -> Iterator[str]:
+        columns = cls.get_columns(dataset)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if fmt == "csv":
+            writer.writerow(columns)
+
+        rows = 0
+        for row in cls.get_rows(budget_id, dataset):
+            values = [cls._export_value(value) for value in row]
+            if fmt == "csv":
+                writer.writerow(values)
+            else:
+                buffer.write(json.dumps(dict(zip(columns, values)), ensure_ascii=False))
+                buffer.write("\n")
+            rows += 1
+            if rows % cls.CHUNK_SIZE == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    @classmethod
+    def get_filename(
+        cls, budget_id: int, dataset: str, fmt: str, compressed: bool = False
+    ) -> str:
+        """Get download file name of an export."""
+        return f"budget-{budget_id}-{dataset}.{fmt}" + (".gz" if compressed else "")
+
+    @staticmethod
+    def _export_value(value):
+        """Convert a database value into a CSV and JSON friendly one."""
+        if isinstance(value, Decimal):
+            return str(value)
+        if isinstance(value, date):
+            return value.isoformat()
+        return value
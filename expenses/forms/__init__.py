@@ -9,6 +9,7 @@ from .payee import PayeeForm
 from .budget import BudgetForm
 from .payment_method import PaymentMethodForm
 from .quick_expense import QuickExpenseForm
+from .csv_import import CsvImportForm
 
 # Make all form classes available when importing from expenses.forms
 __all__ = [
@@ -19,4 +20,5 @@ __all__ = [
     "BudgetForm",
     "PaymentMethodForm",
     "QuickExpenseForm",
+    "CsvImportForm",
 ]
@@ -0,0 +1,13 @@
+from django import forms
+
+
+class CsvImportForm(forms.Form):
+    file = forms.FileField(
+        label="CSV file",
+        widget=forms.ClearableFileInput(attrs={"accept": ".csv,text/csv"}),
+        help_text="UTF-8 encoded, with a header row",
+    )
+    dry_run = forms.BooleanField(
+        required=False,
+        label="Only check the file, do not save anything",
+    )
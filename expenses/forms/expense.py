@@ -2,6 +2,7 @@ from django import forms
 from django.core.exceptions import ValidationError
 from datetime import date
 from ..models import Expense, BudgetMonth, Payee
+from ..services import PayeeDirectoryService
 from ..fields import SanitizedDecimalField
 
 
@@ -89,6 +90,11 @@ class ExpenseForm(forms.ModelForm):
             payee_field.required = False
         if hasattr(payee_field, "empty_label"):
             payee_field.empty_label = "Select payee (optional)"  # type: ignore[attr-defined]
+        # Render dropdown options from the cached payee directory
+        payee_field.choices = [  # type: ignore[attr-defined]
+            ("", "Select payee (optional)"),
+            *PayeeDirectoryService.get_choices(),
+        ]
 
         # Set default values for new expense creation
         if not self.instance.pk:  # Only for new expenses, not edits
@@ -200,7 +206,7 @@ class ExpenseForm(forms.ModelForm):
                     # For one-time expenses, allow moving back to the most recent month
                     if self.instance.expense_type == self.instance.TYPE_ONE_TIME:
                         most_recent_month = BudgetMonth.get_most_recent(
-                            budget=self.instance.budget
+                            budget=self.instance.budget_id
                         )
                         if most_recent_month:
                             # Allow dates from most recent month onward
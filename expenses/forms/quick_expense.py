@@ -1,6 +1,7 @@
 from django import forms
 from typing import cast
 from ..models import Payee
+from ..services import PayeeDirectoryService
 from ..fields import SanitizedDecimalField
 
 
@@ -52,3 +53,8 @@ class QuickExpenseForm(forms.Form):
         payee_field.queryset = Payee.objects.filter(hidden_at__isnull=True).order_by(
             "name"
         )
+        # Render dropdown options from the cached payee directory
+        payee_field.choices = [
+            ("", "Select payee (optional)"),
+            *PayeeDirectoryService.get_choices(),
+        ]
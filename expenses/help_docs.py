@@ -0,0 +1,429 @@
+"""
+Rendering and full-text search of the help pages in docs/*.md.
+"""
+
+import bisect
+import math
+import os
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import markdown
+from django.conf import settings
+from django.core.cache import cache
+
+
+@dataclass(frozen=True)
+class HelpDoc:
+    """Rendered documentation page."""
+
+    name: str
+    heading: Optional[str]  # Text of leading "# " heading, if any
+    html: str
+    text: str  # Markdown source
+    mtime_ns: int
+
+
+class HelpDocsService:
+    """
+    Service rendering docs/*.md pages once and serving them from memory.
+
+    Rendered pages are kept per process, keyed by file path and
+    modification time, and mirrored to the shared Django cache, so pages
+    rendered by other processes (or the warm_help_docs command at startup)
+    are reused. Editing a file changes its mtime, which makes it render
+    again.
+    """
+
+    CACHE_KEY = "help_doc"
+    CACHE_TIMEOUT = None  # Entries are keyed by mtime, so they never go stale
+    MARKDOWN_EXTENSIONS = ["extra", "codehilite", "toc"]
+
+    _docs: Dict[str, HelpDoc] = {}
+    _lock = threading.Lock()
+    _markdown: Optional[markdown.Markdown] = None
+
+    @classmethod
+    def get_docs_dir(cls) -> str:
+        """Get absolute path of documentation directory."""
+        return os.path.join(settings.BASE_DIR, "docs")
+
+    @classmethod
+    def get_doc(cls, name: str) -> HelpDoc:
+        """
+        Get rendered documentation page.
+
+        Args:
+            name: Page file name without .md extension
+
+        Returns:
+            HelpDoc: Rendered page
+
+        Raises:
+            OSError: When the file cannot be read
+            UnicodeDecodeError: When the file is not valid UTF-8
+        """
+        if os.sep in name or (os.altsep and os.altsep in name):
+            raise FileNotFoundError(f"Invalid documentation page name: {name}")
+
+        path = os.path.join(cls.get_docs_dir(), f"{name}.md")
+        mtime_ns = os.stat(path).st_mtime_ns
+
+        doc = cls._docs.get(path)
+        if doc is not None and doc.mtime_ns == mtime_ns:
+            return doc
+
+        key = f"{cls.CACHE_KEY}:{path}:{mtime_ns}"
+        doc = cache.get(key)
+        if doc is None:
+            doc = cls._render(name, path, mtime_ns)
+            cache.set(key, doc, cls.CACHE_TIMEOUT)
+        cls._docs[path] = doc
+        return doc
+
+    @classmethod
+    def list_names(cls) -> List[str]:
+        """
+        List names of all documentation pages.
+
+        Raises:
+            OSError: When the documentation directory cannot be read
+        """
+        docs_dir = cls.get_docs_dir()
+        return sorted(
+            filename[:-3]
+            for filename in os.listdir(docs_dir)
+            if filename.endswith(".md")
+            and os.path.isfile(os.path.join(docs_dir, filename))
+        )
+
+    @classmethod
+    def warm(cls) -> List[HelpDoc]:
+        """
+        Render all documentation pages that are not cached yet.
+
+        Returns:
+            List[HelpDoc]: All pages, in name order
+        """
+        return [cls.get_doc(name) for name in cls.list_names()]
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop pages cached by this process."""
+        with cls._lock:
+            cls._docs = {}
+
+    @classmethod
+    def _render(cls, name: str, path: str, mtime_ns: int) -> HelpDoc:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+
+        heading = None
+        if text.startswith("# "):
+            heading = text.split("\n")[0][2:].strip()
+
+        # Markdown instances are not thread safe, but are costly to create
+        with cls._lock:
+            if cls._markdown is None:
+                cls._markdown = markdown.Markdown(extensions=cls.MARKDOWN_EXTENSIONS)
+            html = cls._markdown.reset().convert(text)
+
+        return HelpDoc(
+            name=name, heading=heading, html=html, text=text, mtime_ns=mtime_ns
+        )
+
+
+@dataclass(frozen=True)
+class HelpSection:
+    """Part of a documentation page under a single heading."""
+
+    page_name: str
+    page_title: str
+    heading: str
+    anchor: str  # Id of heading element in rendered page, "" for page top
+    text: str  # Plain text of the section
+
+
+@dataclass(frozen=True)
+class HelpSearchHit:
+    """Section matching a search query."""
+
+    section: HelpSection
+    score: float
+    snippet: str
+
+
+@dataclass(frozen=True)
+class HelpSearchResult:
+    """Documentation page matching a search query, with its best sections."""
+
+    page_name: str
+    page_title: str
+    score: float
+    sections: Tuple[HelpSearchHit, ...]
+
+
+@dataclass(frozen=True)
+class HelpSearchIndex:
+    """Inverted index of documentation sections."""
+
+    signature: Tuple[Tuple[str, int], ...]  # (file name, mtime) of indexed pages
+    sections: Tuple[HelpSection, ...]
+    postings: Dict[str, Tuple[Tuple[int, float], ...]]  # term -> (section, weight)
+    terms: Tuple[str, ...]  # Sorted, for prefix lookups
+    lengths: Tuple[int, ...]
+    average_length: float
+
+
+class HelpSearchService:
+    """
+    Service for full-text search over docs/*.md pages.
+
+    Pages are split into sections at headings and indexed once into an
+    inverted index kept in memory. Each search only compares modification
+    times of the documentation files with the indexed ones (a directory
+    scan, no file reads) and rebuilds the index when anything changed.
+    Hits are ranked with BM25, with heading words weighted higher.
+    """
+
+    HEADING_WEIGHT = 3.0
+    BM25_K1 = 1.2
+    BM25_B = 0.75
+    MAX_SECTIONS_PER_PAGE = 3
+    SNIPPET_LENGTH = 160
+
+    TOKEN_RE = re.compile(r"[a-z0-9]+")
+    HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+    FENCE_RE = re.compile(r"^\s*(```|~~~)")
+    LINK_RE = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+    MARKUP_RE = re.compile(r"[`*_#>|]+|<[^>]+>")
+
+    _index: Optional[HelpSearchIndex] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def search(cls, query: str, limit: int = 10) -> List[HelpSearchResult]:
+        """
+        Search documentation pages.
+
+        All query words must appear in a page for it to match; each word
+        also matches longer words starting with it (e.g. "pay" matches
+        "payments").
+
+        Args:
+            query: Words to search for
+            limit: Maximum number of pages to return
+
+        Returns:
+            List[HelpSearchResult]: Matching pages, best first
+
+        Raises:
+            OSError: When the documentation directory cannot be read
+            UnicodeDecodeError: When a file is not valid UTF-8
+        """
+        words = list(dict.fromkeys(cls._tokenize(query)))
+        if not words:
+            return []
+
+        index = cls.get_index()
+        section_count = len(index.sections)
+        scores: Dict[int, float] = {}
+        pages_per_word = []
+        matched_terms = set()
+
+        for word in words:
+            pages = set()
+            start = bisect.bisect_left(index.terms, word)
+            for term in index.terms[start:]:
+                if not term.startswith(word):
+                    break
+                matched_terms.add(term)
+                postings = index.postings[term]
+                idf = math.log(
+                    1 + (section_count - len(postings) + 0.5) / (len(postings) + 0.5)
+                )
+                for section_id, weight in postings:
+                    norm = cls.BM25_K1 * (
+                        1
+                        - cls.BM25_B
+                        + cls.BM25_B * index.lengths[section_id] / index.average_length
+                    )
+                    scores[section_id] = scores.get(section_id, 0.0) + idf * (
+                        weight * (cls.BM25_K1 + 1) / (weight + norm)
+                    )
+                    pages.add(index.sections[section_id].page_name)
+            pages_per_word.append(pages)
+
+        matching_pages = set.intersection(*pages_per_word)
+        hits_by_page: Dict[str, List[HelpSearchHit]] = {}
+        for section_id, score in scores.items():
+            section = index.sections[section_id]
+            if section.page_name in matching_pages:
+                hits_by_page.setdefault(section.page_name, []).append(
+                    HelpSearchHit(
+                        section=section,
+                        score=score,
+                        snippet=cls._snippet(section.text, matched_terms),
+                    )
+                )
+
+        results = []
+        for page_name, hits in hits_by_page.items():
+            hits.sort(key=lambda hit: -hit.score)
+            results.append(
+                HelpSearchResult(
+                    page_name=page_name,
+                    page_title=hits[0].section.page_title,
+                    score=sum(hit.score for hit in hits),
+                    sections=tuple(hits[: cls.MAX_SECTIONS_PER_PAGE]),
+                )
+            )
+        results.sort(key=lambda result: (-result.score, result.page_name))
+        return results[:limit]
+
+    @classmethod
+    def get_index(cls) -> HelpSearchIndex:
+        """
+        Get search index, building it again if any documentation file changed.
+
+        Raises:
+            OSError: When the documentation directory cannot be read
+            UnicodeDecodeError: When a file is not valid UTF-8
+        """
+        signature = cls._get_signature()
+        index = cls._index
+        if index is not None and index.signature == signature:
+            return index
+
+        with cls._lock:
+            index = cls._index
+            if index is None or index.signature != signature:
+                index = cls._build(signature)
+                cls._index = index
+        return index
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop index built by this process."""
+        with cls._lock:
+            cls._index = None
+
+    @classmethod
+    def _get_signature(cls) -> Tuple[Tuple[str, int], ...]:
+        with os.scandir(HelpDocsService.get_docs_dir()) as entries:
+            return tuple(
+                sorted(
+                    (entry.name, entry.stat().st_mtime_ns)
+                    for entry in entries
+                    if entry.name.endswith(".md") and entry.is_file()
+                )
+            )
+
+    @classmethod
+    def _build(cls, signature: Tuple[Tuple[str, int], ...]) -> HelpSearchIndex:
+        sections: List[HelpSection] = []
+        postings: Dict[str, List[Tuple[int, float]]] = {}
+        lengths: List[int] = []
+
+        # Page sources are shared with the help pages, read only when changed
+        for filename, _mtime_ns in signature:
+            doc = HelpDocsService.get_doc(filename[:-3])
+            for section in cls._split_sections(doc):
+                section_id = len(sections)
+                sections.append(section)
+
+                weights: Dict[str, float] = {}
+                heading_tokens = cls._tokenize(section.heading)
+                body_tokens = cls._tokenize(section.text)
+                for token in heading_tokens:
+                    weights[token] = weights.get(token, 0.0) + cls.HEADING_WEIGHT
+                for token in body_tokens:
+                    weights[token] = weights.get(token, 0.0) + 1.0
+                for token, weight in weights.items():
+                    postings.setdefault(token, []).append((section_id, weight))
+                lengths.append(len(heading_tokens) + len(body_tokens))
+
+        return HelpSearchIndex(
+            signature=signature,
+            sections=tuple(sections),
+            postings={term: tuple(items) for term, items in postings.items()},
+            terms=tuple(sorted(postings)),
+            lengths=tuple(lengths),
+            average_length=(sum(lengths) / len(lengths)) if lengths else 1.0,
+        )
+
+    @classmethod
+    def _split_sections(cls, doc: HelpDoc) -> List[HelpSection]:
+        """Split page at headings, giving sections the ids the toc extension uses."""
+        from markdown.extensions.toc import slugify, unique
+
+        page_title = doc.heading or doc.name.replace("_", " ").replace("-", " ").title()
+        used_ids: set = set()
+        sections = []
+        heading, anchor, lines = page_title, "", []
+        in_fence = False
+
+        def add_section():
+            text = cls._plain_text("\n".join(lines))
+            if text or anchor:
+                sections.append(
+                    HelpSection(
+                        page_name=doc.name,
+                        page_title=page_title,
+                        heading=heading,
+                        anchor=anchor,
+                        text=text,
+                    )
+                )
+
+        for line in doc.text.splitlines():
+            if cls.FENCE_RE.match(line):
+                in_fence = not in_fence
+                continue
+            match = None if in_fence else cls.HEADING_RE.match(line)
+            if match is None:
+                lines.append(line)
+                continue
+
+            add_section()
+            heading = cls._plain_text(match.group(2))
+            anchor = unique(slugify(heading, "-"), used_ids)
+            lines = []
+        add_section()
+
+        return sections
+
+    @classmethod
+    def _plain_text(cls, text: str) -> str:
+        text = cls.LINK_RE.sub(r"\1", text)
+        text = cls.MARKUP_RE.sub(" ", text)
+        return " ".join(text.split())
+
+    @classmethod
+    def _tokenize(cls, text: str) -> List[str]:
+        return cls.TOKEN_RE.findall(text.lower())
+
+    @classmethod
+    def _snippet(cls, text: str, terms: Iterable[str]) -> str:
+        """Cut part of section text around the first matched word."""
+        lowered = text.lower()
+        positions = []
+        for term in terms:
+            match = re.search(rf"\b{re.escape(term)}\b", lowered)
+            if match:
+                positions.append(match.start())
+        start = max(min(positions, default=0) - cls.SNIPPET_LENGTH // 4, 0)
+        if start > 0:
+            # Start at word boundary
+            space = text.find(" ", start)
+            start = space + 1 if 0 <= space < start + 20 else start
+
+        end = start + cls.SNIPPET_LENGTH
+        snippet = text[start:end]
+        if start > 0:
+            snippet = "…" + snippet
+        if end < len(text):
+            snippet = snippet.rstrip() + "…"
+        return snippet
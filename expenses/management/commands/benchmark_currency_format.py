@@ -0,0 +1,74 @@
+import timeit
+from decimal import Decimal
+from babel.numbers import format_currency
+from django.core.management.base import BaseCommand
+from expenses.services import CurrencyFormatter
+
+
+class Command(BaseCommand):
+    help = "Compares babel currency formatting with compiled and cached formatters"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=10000,
+            help="Number of amounts to format per variant (default: 10000)",
+        )
+        parser.add_argument("--currency", default="USD", help="Currency code")
+        parser.add_argument("--locale", default="en_US", help="Locale identifier")
+        parser.add_argument(
+            "--distinct",
+            type=int,
+            default=200,
+            help="Number of distinct amounts, as on a typical page (default: 200)",
+        )
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        currency = options["currency"]
+        locale = options["locale"]
+        distinct = max(1, options["distinct"])
+        amounts = [Decimal(index * 37 % 100000) / 100 for index in range(distinct)] * (
+            iterations // distinct + 1
+        )
+        amounts = amounts[:iterations]
+
+        compiled = CurrencyFormatter(currency, locale, "standard")
+        cached = CurrencyFormatter(currency, locale, "standard", cache_size=1024)
+
+        variants = [
+            (
+                "babel format_currency",
+                lambda: [
+                    format_currency(amount, currency, locale=locale)
+                    for amount in amounts
+                ],
+            ),
+            (
+                "compiled formatter",
+                lambda: [compiled.format(amount) for amount in amounts],
+            ),
+            (
+                "compiled formatter + LRU",
+                lambda: [cached.format(amount) for amount in amounts],
+            ),
+        ]
+
+        baseline = None
+        for name, run in variants:
+            seconds = min(timeit.repeat(run, number=1, repeat=3))
+            if baseline is None:
+                baseline = seconds
+            per_call = seconds / max(1, iterations) * 1_000_000
+            speedup = baseline / seconds if seconds else float("inf")
+            self.stdout.write(
+                f"{name:<26} {seconds * 1000:9.2f} ms  {per_call:7.2f} us/call  "
+                f"{speedup:5.1f}x"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Formatted {iterations} amount(s) ({distinct} distinct) as {currency}/{locale}"
+            )
+        )
@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand
+from datetime import date
+from expenses.models import Budget
+from expenses.services import process_months_until
+
+
+class Command(BaseCommand):
+    help = "Creates all missing months (and their expense items) up to given month"
+
+    def add_arguments(self, parser):
+        today = date.today()
+        parser.add_argument(
+            "--budget",
+            type=int,
+            help="ID of the budget to catch up (default: all budgets)",
+        )
+        parser.add_argument(
+            "--year",
+            type=int,
+            default=today.year,
+            help="Target year (default: current year)",
+        )
+        parser.add_argument(
+            "--month",
+            type=int,
+            default=today.month,
+            help="Target month, inclusive (default: current month)",
+        )
+
+    def handle(self, *args, **options):
+        year = options["year"]
+        month = options["month"]
+
+        budgets = Budget.objects.all()
+        if options["budget"] is not None:
+            budgets = budgets.filter(pk=options["budget"])
+            if not budgets.exists():
+                self.stdout.write(
+                    self.style.ERROR(f"Budget {options['budget']} does not exist")
+                )
+                return
+
+        for budget in budgets:
+            try:
+                months = process_months_until(budget, year, month)
+            except ValueError as e:
+                self.stdout.write(self.style.ERROR(str(e)))
+                return
+
+            if months:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f'Budget "{budget}": created {len(months)} month(s) ({months[0]} to {months[-1]})'
+                    )
+                )
+            else:
+                self.stdout.write(f'Budget "{budget}": already up to date')
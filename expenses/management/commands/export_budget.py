@@ -0,0 +1,68 @@
+from django.core.management.base import BaseCommand
+from django.utils.text import compress_sequence
+from expenses.models import Budget
+from expenses.export import BudgetExportService
+
+
+class Command(BaseCommand):
+    help = (
+        "Exports expenses, expense items or payments of a budget as CSV or JSON lines"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("budget", type=int, help="ID of the budget to export")
+        parser.add_argument(
+            "--dataset",
+            choices=list(BudgetExportService.DATASETS),
+            default="expenses",
+            help="Rows to export (default: expenses)",
+        )
+        parser.add_argument(
+            "--format",
+            choices=list(BudgetExportService.FORMATS),
+            default="csv",
+            help="Output format (default: csv)",
+        )
+        parser.add_argument(
+            "--output",
+            help="File to write to (default: standard output)",
+        )
+        parser.add_argument(
+            "--gzip",
+            action="store_true",
+            help="Compress output with gzip (requires --output)",
+        )
+
+    def handle(self, *args, **options):
+        budget_id = options["budget"]
+        if not Budget.objects.filter(pk=budget_id).exists():
+            self.stdout.write(self.style.ERROR(f"Budget {budget_id} does not exist"))
+            return
+
+        output = options["output"]
+        if options["gzip"] and not output:
+            self.stdout.write(self.style.ERROR("--gzip requires --output"))
+            return
+
+        chunks = BudgetExportService.stream(
+            budget_id, options["dataset"], options["format"]
+        )
+        if not output:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+            return
+
+        if options["gzip"]:
+            with open(output, "wb") as file:
+                for data in compress_sequence(chunk.encode() for chunk in chunks):
+                    file.write(data)
+        else:
+            with open(output, "w", encoding="utf-8", newline="") as file:
+                for chunk in chunks:
+                    file.write(chunk)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported {options['dataset']} of budget {budget_id} to {output}"
+            )
+        )
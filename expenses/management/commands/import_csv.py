@@ -0,0 +1,51 @@
+import csv
+from django.core.management.base import BaseCommand
+from expenses.models import Budget
+from expenses.csv_import import CsvExpenseImporter
+
+
+class Command(BaseCommand):
+    help = "Imports historical expenses and payments of a budget from a CSV file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("budget", type=int, help="ID of the budget to import into")
+        parser.add_argument("file", help="CSV file with a header row (UTF-8)")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only check the file and report problems, do not save anything",
+        )
+
+    def handle(self, *args, **options):
+        budget = Budget.objects.filter(pk=options["budget"]).first()
+        if budget is None:
+            self.stdout.write(
+                self.style.ERROR(f"Budget {options['budget']} does not exist")
+            )
+            return
+
+        try:
+            with open(options["file"], encoding="utf-8-sig", newline="") as file:
+                result = CsvExpenseImporter(budget).run(
+                    file, dry_run=options["dry_run"]
+                )
+        except (OSError, ValueError, csv.Error) as e:
+            self.stdout.write(self.style.ERROR(str(e)))
+            return
+
+        for error in result.errors:
+            self.stdout.write(self.style.WARNING(f"Line {error.line}: {error.message}"))
+        if result.error_count > len(result.errors):
+            self.stdout.write(
+                self.style.WARNING(
+                    f"... {result.error_count - len(result.errors)} more problem(s)"
+                )
+            )
+
+        action = "Checked" if result.dry_run else "Imported"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{action} {result.expenses} expense(s) and {result.payments} "
+                f"payment(s) from {result.rows} row(s), skipped {result.error_count}"
+            )
+        )
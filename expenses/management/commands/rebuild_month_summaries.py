@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from expenses.models import BudgetMonth, BudgetMonthSummary
+
+
+class Command(BaseCommand):
+    help = "Verifies and rebuilds materialized per-month summaries"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report months with out-of-sync summaries, do not modify data",
+        )
+
+    def handle(self, *args, **options):
+        expected = BudgetMonthSummary.calculate()
+        stored = {
+            summary.month_id: summary for summary in BudgetMonthSummary.objects.all()
+        }
+
+        stale_months = []
+        for month in BudgetMonth.objects.order_by("budget_id", "period"):
+            summary = stored.get(month.pk)
+            values = expected.get(month.pk, {})
+            if summary is None or any(
+                getattr(summary, field) != values.get(field, 0)
+                for field in BudgetMonthSummary.SUMMARY_FIELDS
+            ):
+                stale_months.append(month)
+
+        if options["check"]:
+            if stale_months:
+                for month in stale_months:
+                    self.stdout.write(f"Out of sync: budget {month.budget_id}, {month}")
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Found {len(stale_months)} month(s) with out-of-sync summaries"
+                    )
+                )
+            else:
+                self.stdout.write(self.style.SUCCESS("All month summaries are in sync"))
+            return
+
+        with transaction.atomic():
+            rebuilt = BudgetMonthSummary.rebuild_all()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {rebuilt} month summary(ies) ({len(stale_months)} were out of sync)"
+            )
+        )
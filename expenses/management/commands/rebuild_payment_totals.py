@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum, Value
+from django.db.models.functions import Coalesce
+from expenses.models import ExpenseItem
+from expenses.money import MoneyField
+
+
+class Command(BaseCommand):
+    help = "Rebuilds denormalized paid_total and payment_count on expense items"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report expense items with out-of-sync totals, do not modify data",
+        )
+
+    def handle(self, *args, **options):
+        stale_items = ExpenseItem.objects.annotate(
+            actual_total=Coalesce(
+                Sum("payment__amount"),
+                Value(0),
+                output_field=MoneyField(),
+            ),
+            actual_count=Count("payment"),
+        ).filter(~Q(paid_total=F("actual_total")) | ~Q(payment_count=F("actual_count")))
+        stale_count = stale_items.count()
+
+        if options["check"]:
+            if stale_count:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Found {stale_count} expense item(s) with out-of-sync payment totals"
+                    )
+                )
+            else:
+                self.stdout.write(self.style.SUCCESS("All payment totals are in sync"))
+            return
+
+        with transaction.atomic():
+            updated = ExpenseItem.refresh_payment_totals()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt payment totals for {updated} expense item(s) ({stale_count} were out of sync)"
+            )
+        )
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from expenses.search import ExpenseSearchService
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the full-text expense search index (SQLite only)"
+
+    def handle(self, *args, **options):
+        if not ExpenseSearchService.is_available():
+            self.stdout.write(
+                self.style.WARNING(
+                    "Full-text search index is not available on this database, "
+                    "search uses plain lookups"
+                )
+            )
+            return
+
+        indexed = ExpenseSearchService.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} expense(s)"))
@@ -0,0 +1,27 @@
+import time
+from django.core.management.base import BaseCommand
+from expenses.help_docs import HelpDocsService
+
+
+class Command(BaseCommand):
+    help = (
+        "Renders all help documentation pages into the shared cache, so the "
+        "web server does not render them on first request. Run at startup"
+    )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            docs = HelpDocsService.warm()
+        except (OSError, UnicodeDecodeError) as e:
+            self.stdout.write(self.style.ERROR(f"Error reading documentation: {e}"))
+            return
+
+        for doc in docs:
+            self.stdout.write(f"Cached: {doc.name} ({doc.heading or 'no title'})")
+        elapsed = (time.perf_counter() - started) * 1000
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Cached {len(docs)} documentation page(s) in {elapsed:.0f} ms"
+            )
+        )
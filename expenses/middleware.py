@@ -0,0 +1,15 @@
+from . import request_cache
+
+
+class RequestCacheMiddleware:
+    """Give every request its own memoization cache (see request_cache)."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = request_cache.activate()
+        try:
+            return self.get_response(request)
+        finally:
+            request_cache.deactivate(token)
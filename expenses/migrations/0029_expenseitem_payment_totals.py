@@ -0,0 +1,52 @@
+# Generated by Django 5.2.1 on 2026-10-16 23:58
+
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_payment_totals(apps, schema_editor):
+    """Populate denormalized paid_total and payment_count from Payment records."""
+    ExpenseItem = apps.get_model("expenses", "ExpenseItem")
+    Payment = apps.get_model("expenses", "Payment")
+
+    payments = (
+        Payment.objects.filter(expense_item=OuterRef("pk"))
+        .order_by()
+        .values("expense_item")
+    )
+    ExpenseItem.objects.update(
+        paid_total=Coalesce(
+            Subquery(payments.annotate(total=Sum("amount")).values("total")[:1]),
+            Value(Decimal("0.00")),
+            output_field=models.DecimalField(max_digits=13, decimal_places=2),
+        ),
+        payment_count=Coalesce(
+            Subquery(payments.annotate(cnt=Count("pk")).values("cnt")[:1]),
+            Value(0),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("expenses", "0028_auto_20250622_2125"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="expenseitem",
+            name="paid_total",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), editable=False, max_digits=13
+            ),
+        ),
+        migrations.AddField(
+            model_name="expenseitem",
+            name="payment_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_payment_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-17 00:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("expenses", "0029_expenseitem_payment_totals"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="expenseitem",
+            index=models.Index(
+                condition=models.Q(("paid_total__lt", models.F("amount"))),
+                fields=["month", "due_date"],
+                name="expenseitem_pending_idx",
+            ),
+        ),
+    ]
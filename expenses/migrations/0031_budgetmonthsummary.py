@@ -0,0 +1,116 @@
+# Generated by Django 5.2.1 on 2026-10-17 00:05
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+
+
+def populate_month_summaries(apps, schema_editor):
+    """
+    Calculate summaries of all existing months from their expense items.
+
+    Totals are added up in Python from Decimal amounts, as SQLite stores
+    decimals as REAL and would compare and sum them with float errors
+    (paid 0.10 + 0.20 would not cover 0.30).
+    """
+    BudgetMonth = apps.get_model("expenses", "BudgetMonth")
+    BudgetMonthSummary = apps.get_model("expenses", "BudgetMonthSummary")
+    ExpenseItem = apps.get_model("expenses", "ExpenseItem")
+
+    values = {}
+    items = ExpenseItem.objects.order_by().values_list(
+        "month_id", "amount", "paid_total"
+    )
+    for month_id, amount, paid_total in items.iterator(chunk_size=2000):
+        row = values.setdefault(
+            month_id,
+            {
+                "total_amount": Decimal("0.00"),
+                "paid_amount": Decimal("0.00"),
+                "pending_amount": Decimal("0.00"),
+                "item_count": 0,
+                "paid_count": 0,
+                "pending_count": 0,
+            },
+        )
+        row["total_amount"] += amount
+        row["paid_amount"] += paid_total
+        row["item_count"] += 1
+        if paid_total >= amount:
+            row["paid_count"] += 1
+        else:
+            row["pending_amount"] += amount - paid_total
+            row["pending_count"] += 1
+
+    BudgetMonthSummary.objects.bulk_create(
+        [
+            BudgetMonthSummary(month_id=month_id, **values.get(month_id, {}))
+            for month_id in BudgetMonth.objects.values_list("pk", flat=True)
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("expenses", "0030_expenseitem_pending_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BudgetMonthSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "total_amount",
+                    models.DecimalField(
+                        decimal_places=2, default=Decimal("0.00"), max_digits=15
+                    ),
+                ),
+                (
+                    "paid_amount",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=Decimal("0.00"),
+                        help_text="Sum of all payments recorded for expense items of the month",
+                        max_digits=15,
+                    ),
+                ),
+                (
+                    "pending_amount",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=Decimal("0.00"),
+                        help_text="Amount still owed on expense items that are not fully paid",
+                        max_digits=15,
+                    ),
+                ),
+                ("item_count", models.PositiveIntegerField(default=0)),
+                ("paid_count", models.PositiveIntegerField(default=0)),
+                ("pending_count", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "month",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="summary",
+                        to="expenses.budgetmonth",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Budget month summary",
+                "verbose_name_plural": "Budget month summaries",
+            },
+        ),
+        migrations.RunPython(populate_month_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.1 on 2026-10-17 01:00
+
+from django.db import migrations
+
+# Columns: title, notes, payee, transaction_ids, budget_id (filter only)
+CREATE_TABLE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS expenses_expense_search USING fts5(
+    title, notes, payee, transaction_ids, budget_id UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3 4'
+)
+"""
+
+# Same rows as ExpenseSearchService indexes, kept here so the migration
+# does not change with the service
+FILL_TABLE = """
+INSERT INTO expenses_expense_search
+    (rowid, title, notes, payee, transaction_ids, budget_id)
+SELECT e.id, e.title, coalesce(e.notes, ''), coalesce(p.name, ''),
+    coalesce((
+        SELECT group_concat(pm.transaction_id, ' ')
+        FROM expenses_payment pm
+        JOIN expenses_expenseitem i ON i.id = pm.expense_item_id
+        WHERE i.expense_id = e.id AND pm.transaction_id IS NOT NULL
+    ), ''),
+    e.budget_id
+FROM expenses_expense e
+LEFT JOIN expenses_payee p ON p.id = e.payee_id
+"""
+
+
+def create_search_index(apps, schema_editor):
+    """
+    Create FTS5 expense search table and index existing expenses.
+
+    From then on, ExpenseSearchService keeps it in sync with expenses,
+    payees and payments.
+    """
+    if schema_editor.connection.vendor != "sqlite":
+        # Search falls back to plain lookups on other databases
+        return
+
+    schema_editor.execute(CREATE_TABLE)
+    schema_editor.execute(FILL_TABLE)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    schema_editor.execute("DROP TABLE IF EXISTS expenses_expense_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("expenses", "0031_budgetmonthsummary"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.1 on 2026-10-17 00:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("expenses", "0032_expense_search"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="expense",
+            name="budget",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="expenses.budget",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="expenseitem",
+            name="expense",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="expenses.expense",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="expenseitem",
+            name="month",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="expenses.budgetmonth",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="payment",
+            name="expense_item",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="expenses.expenseitem",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="expense",
+            index=models.Index(
+                fields=["budget", "start_date"], name="expense_budget_start_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="expenseitem",
+            index=models.Index(
+                fields=["month", "due_date"], name="expenseitem_month_due_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="expenseitem",
+            index=models.Index(
+                fields=["expense", "due_date"], name="expenseitem_expense_due_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="payee",
+            index=models.Index(
+                fields=["hidden_at", "name"], name="payee_hidden_name_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="payment",
+            index=models.Index(
+                fields=["expense_item", "payment_date"], name="payment_item_date_idx"
+            ),
+        ),
+    ]
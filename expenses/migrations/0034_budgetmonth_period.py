@@ -0,0 +1,41 @@
+# Generated by Django 5.2.1 on 2026-10-17 01:30
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def populate_periods(apps, schema_editor):
+    """Set period keys of all existing months."""
+    BudgetMonth = apps.get_model("expenses", "BudgetMonth")
+    BudgetMonth.objects.update(period=F("year") * 100 + F("month"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("expenses", "0033_composite_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="budgetmonth",
+            name="period",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Sortable month key (year * 100 + month), set on save",
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_periods, migrations.RunPython.noop),
+        migrations.AlterModelOptions(
+            name="budgetmonth",
+            options={"ordering": ["-period"]},
+        ),
+        migrations.AddIndex(
+            model_name="budgetmonth",
+            index=models.Index(
+                fields=["budget", "period"], name="budgetmonth_period_idx"
+            ),
+        ),
+    ]
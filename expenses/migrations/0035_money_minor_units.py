@@ -0,0 +1,167 @@
+# Generated by Django 5.2.1 on 2026-10-17 03:10
+
+from decimal import Decimal
+
+import django.core.validators
+import expenses.money
+from django.db import migrations, models
+from django.db.models import Case, Count, F, Q, Sum, Value, When
+from django.db.models.functions import Round
+
+# Amount columns converted from decimal major units to integer cents
+MONEY_FIELDS = {
+    "budget": ["initial_amount"],
+    "expense": ["amount"],
+    "expenseitem": ["amount", "paid_total"],
+    "payment": ["amount"],
+    "budgetmonthsummary": ["total_amount", "paid_amount", "pending_amount"],
+}
+
+
+def amounts_to_cents(apps, schema_editor):
+    """Scale stored amounts to minor units, still in widened decimal columns."""
+    for model_name, fields in MONEY_FIELDS.items():
+        model = apps.get_model("expenses", model_name)
+        model.objects.update(**{name: Round(F(name) * 100) for name in fields})
+
+
+def amounts_to_major_units(apps, schema_editor):
+    """Scale stored amounts back from minor units."""
+    for model_name, fields in MONEY_FIELDS.items():
+        model = apps.get_model("expenses", model_name)
+        rows = list(model.objects.only("pk", *fields))
+        for row in rows:
+            for name in fields:
+                setattr(row, name, getattr(row, name) / 100)
+        model.objects.bulk_update(rows, fields, batch_size=500)
+
+
+def widen(model_name, name):
+    """Decimal column wide enough to hold amounts scaled to cents."""
+    return migrations.AlterField(
+        model_name=model_name,
+        name=name,
+        field=models.DecimalField(
+            max_digits=20, decimal_places=2, default=Decimal("0.00")
+        ),
+        preserve_default=False,
+    )
+
+
+def recalculate_month_summaries(apps, schema_editor):
+    """
+    Recalculate month summaries from the converted integer cents columns.
+
+    Summaries stored so far may have been calculated on SQLite REAL values,
+    which could classify items paid in several parts as pending.
+    """
+    BudgetMonth = apps.get_model("expenses", "BudgetMonth")
+    BudgetMonthSummary = apps.get_model("expenses", "BudgetMonthSummary")
+    ExpenseItem = apps.get_model("expenses", "ExpenseItem")
+
+    # Aggregate plain cents, without MoneyField conversion
+    cents = models.BigIntegerField()
+    is_paid = Q(paid_total__gte=F("amount"))
+    rows = (
+        ExpenseItem.objects.order_by()
+        .values("month_id")
+        .annotate(
+            total_amount=Sum("amount", output_field=cents),
+            paid_amount=Sum("paid_total", output_field=cents),
+            pending_amount=Sum(
+                Case(
+                    When(is_paid, then=Value(0)),
+                    default=F("amount") - F("paid_total"),
+                    output_field=cents,
+                )
+            ),
+            item_count=Count("id"),
+            paid_count=Count("id", filter=is_paid),
+            pending_count=Count("id", filter=~is_paid),
+        )
+    )
+    values = {}
+    for row in rows:
+        month_id = row.pop("month_id")
+        for name in MONEY_FIELDS["budgetmonthsummary"]:
+            row[name] = Decimal(row[name] or 0).scaleb(-2)
+        values[month_id] = row
+
+    BudgetMonthSummary.objects.all().delete()
+    BudgetMonthSummary.objects.bulk_create(
+        [
+            BudgetMonthSummary(month_id=month_id, **values.get(month_id, {}))
+            for month_id in BudgetMonth.objects.values_list("pk", flat=True)
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("expenses", "0034_budgetmonth_period"),
+    ]
+
+    operations = [
+        *[
+            widen(model_name, name)
+            for model_name, fields in MONEY_FIELDS.items()
+            for name in fields
+        ],
+        migrations.RunPython(amounts_to_cents, amounts_to_major_units),
+        migrations.AlterField(
+            model_name="budget",
+            name="initial_amount",
+            field=expenses.money.MoneyField(default=Decimal("0.00")),
+        ),
+        migrations.AlterField(
+            model_name="expense",
+            name="amount",
+            field=expenses.money.MoneyField(
+                help_text="Per-installment amount for split payments, total amount for others",
+                validators=[django.core.validators.MinValueValidator(Decimal("0.01"))],
+            ),
+        ),
+        migrations.AlterField(
+            model_name="expenseitem",
+            name="amount",
+            field=expenses.money.MoneyField(
+                validators=[django.core.validators.MinValueValidator(Decimal("0.01"))]
+            ),
+        ),
+        migrations.AlterField(
+            model_name="expenseitem",
+            name="paid_total",
+            field=expenses.money.MoneyField(default=Decimal("0.00"), editable=False),
+        ),
+        migrations.AlterField(
+            model_name="payment",
+            name="amount",
+            field=expenses.money.MoneyField(
+                validators=[django.core.validators.MinValueValidator(Decimal("0.01"))]
+            ),
+        ),
+        migrations.AlterField(
+            model_name="budgetmonthsummary",
+            name="total_amount",
+            field=expenses.money.MoneyField(default=Decimal("0.00")),
+        ),
+        migrations.AlterField(
+            model_name="budgetmonthsummary",
+            name="paid_amount",
+            field=expenses.money.MoneyField(
+                default=Decimal("0.00"),
+                help_text="Sum of all payments recorded for expense items of the month",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="budgetmonthsummary",
+            name="pending_amount",
+            field=expenses.money.MoneyField(
+                default=Decimal("0.00"),
+                help_text="Amount still owed on expense items that are not fully paid",
+            ),
+        ),
+        migrations.RunPython(recalculate_month_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.1 on 2026-10-17 01:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("expenses", "0035_money_minor_units"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="budget",
+            name="data_version",
+            field=models.BigIntegerField(
+                default=0,
+                editable=False,
+                help_text="Version of budget data, see DataVersionService",
+            ),
+        ),
+        migrations.AddField(
+            model_name="settings",
+            name="data_version",
+            field=models.BigIntegerField(
+                default=0,
+                editable=False,
+                help_text="Version of data shown on all pages, see DataVersionService",
+            ),
+        ),
+        migrations.AddField(
+            model_name="settings",
+            name="payee_directory_version",
+            field=models.BigIntegerField(
+                default=0,
+                editable=False,
+                help_text="Version of the payee directory, see DataVersionService",
+            ),
+        ),
+    ]
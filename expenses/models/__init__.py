@@ -8,6 +8,7 @@ from .payee import Payee
 from .payment_method import PaymentMethod
 from .payment import Payment
 from .month import BudgetMonth
+from .month_summary import BudgetMonthSummary
 from .expense import Expense
 from .expense_item import ExpenseItem
 from .settings import Settings
@@ -19,6 +20,7 @@ __all__ = [
     "PaymentMethod",
     "Payment",
     "BudgetMonth",
+    "BudgetMonthSummary",
     "Expense",
     "ExpenseItem",
     "Settings",
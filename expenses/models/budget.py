@@ -1,7 +1,56 @@
 from django.db import models
-from django.db.models import Sum  # noqa: WPS458
+from django.db.models import (  # noqa: WPS458
+    Exists,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Coalesce
 from django.core.exceptions import ValidationError
 from decimal import Decimal
+from .. import request_cache
+from ..money import Money, MoneyField
+
+
+class BudgetQuerySet(models.QuerySet):
+    """QuerySet with SQL-side balance helpers."""
+
+    def with_balances(self, from_summaries: bool = False) -> "BudgetQuerySet":
+        """
+        Annotate each budget with committed total, current balance and month presence.
+
+        Budget.get_current_balance() and can_be_deleted() use these
+        annotations when present, so listing any number of budgets takes a
+        single query.
+
+        Args:
+            from_summaries: Sum the incrementally maintained BudgetMonthSummary
+                rows (one per month) instead of all expense items. Cheaper for
+                budgets with long histories.
+        """
+        # Import here to avoid circular imports
+        from .month import BudgetMonth
+
+        if from_summaries:
+            committed = Sum("budgetmonth__summary__total_amount")
+        else:
+            committed = Sum("expense__expenseitem__amount")
+
+        return self.annotate(
+            committed_total=Coalesce(
+                committed,
+                Value(0),
+                output_field=MoneyField(),
+            ),
+            has_months=Exists(BudgetMonth.objects.filter(budget=OuterRef("pk"))),
+        ).annotate(
+            # Integer arithmetic of two MoneyFields resolves to a plain integer
+            current_balance=ExpressionWrapper(
+                F("initial_amount") - F("committed_total"), output_field=MoneyField()
+            )
+        )
 
 
 class Budget(models.Model):
@@ -13,11 +62,18 @@ class Budget(models.Model):
 
     name = models.CharField(max_length=100)
     start_date = models.DateField()
-    initial_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    initial_amount = MoneyField(default=Money(0))
     currency = models.CharField(max_length=3, choices=CURRENCY_CHOICES, default="PLN")
+    data_version = models.BigIntegerField(
+        default=0,
+        editable=False,
+        help_text="Version of budget data, see DataVersionService",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = BudgetQuerySet.as_manager()
+
     def clean(self) -> None:
         # For existing budgets with months, start_date cannot be changed at all
         if hasattr(self, "pk") and self.pk and not self._state.adding:
@@ -30,8 +86,42 @@ class Budget(models.Model):
                     "Start date cannot be changed when budget has existing months"
                 )
 
+    def save(self, *args, **kwargs) -> None:
+        super().save(*args, **kwargs)
+        request_cache.invalidate(request_cache.BUDGET)
+        self._bump_data_version()
+
+    def delete(self, *args, **kwargs):
+        # Import here to avoid circular imports
+        from ..search import ExpenseSearchService
+        from ..services import DataVersionService
+
+        expense_ids = list(self.expense_set.values_list("pk", flat=True))
+        result = super().delete(*args, **kwargs)
+        if expense_ids:
+            # Drop search rows of expenses deleted by the cascade
+            ExpenseSearchService.index_expenses(expense_ids)
+            # and their payee expense counts
+            DataVersionService.bump_payee_directory()
+        # Deleting a budget cascades to its months
+        request_cache.invalidate(request_cache.BUDGET)
+        request_cache.invalidate(request_cache.MOST_RECENT_MONTH)
+        self._bump_data_version()
+        return result
+
+    def _bump_data_version(self) -> None:
+        # Import here to avoid circular imports
+        from ..services import DataVersionService
+
+        # Pages only show the name of their own budget, so other budgets
+        # and the global version are not affected
+        DataVersionService.bump_budget(self.pk)
+
     def can_be_deleted(self) -> bool:
         """Check if this budget can be deleted (no associated months)"""
+        has_months = getattr(self, "has_months", None)
+        if has_months is not None:
+            return not has_months
         return not self.budgetmonth_set.exists()
 
     def get_current_balance(self) -> Decimal:
@@ -41,13 +131,17 @@ class Budget(models.Model):
         Returns:
             Decimal: Current balance (positive = remaining, negative = overcommitted)
         """
+        annotated = getattr(self, "current_balance", None)
+        if annotated is not None:
+            return annotated
+
         # Import here to avoid circular imports
         from .expense_item import ExpenseItem
 
         # Calculate total committed from all expense items (paid + pending) in this budget
         total_committed = ExpenseItem.objects.filter(expense__budget=self).aggregate(
             total=Sum("amount")
-        )["total"] or Decimal("0.00")
+        )["total"] or Money(0)
 
         # Return initial amount minus total committed
         return self.initial_amount - total_committed
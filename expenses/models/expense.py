@@ -1,15 +1,53 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Exists, OuterRef
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
 from django.utils import timezone
+from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Optional, Tuple
+from ..money import Money, MoneyField
 
 import calendar
 
-# Type aliases for complex annotations
-EditRestrictions = Dict[str, Union[bool, List[str]]]
+
+@dataclass(frozen=True)
+class EditRestrictions:
+    """
+    Immutable result of evaluating what can be edited on an expense.
+
+    Supports dict-style access (restrictions["can_edit"]) for existing callers.
+    """
+
+    can_edit: bool
+    can_edit_amount: bool
+    can_edit_date: bool
+    has_paid_items: bool
+    reasons: Tuple[str, ...] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+
+class ExpenseQuerySet(models.QuerySet):
+    """QuerySet with SQL-side edit restriction helpers."""
+
+    def with_paid_items(self) -> "ExpenseQuerySet":
+        """
+        Annotate each expense with has_paid_items flag.
+
+        Expense.can_be_deleted() and Expense.get_edit_restrictions() use the
+        annotation instead of querying payments for every expense.
+        """
+        # Import here to avoid circular imports
+        from .payment import Payment
+
+        return self.annotate(
+            has_paid_items=Exists(
+                Payment.objects.filter(expense_item__expense=OuterRef("pk"))
+            )
+        )
 
 
 class Expense(models.Model):
@@ -77,16 +115,15 @@ class Expense(models.Model):
     }
 
     # Core expense information
-    budget = models.ForeignKey("Budget", on_delete=models.CASCADE)
+    # Indexed by expense_budget_start_idx, which leads with it
+    budget = models.ForeignKey("Budget", on_delete=models.CASCADE, db_index=False)
     payee = models.ForeignKey("Payee", on_delete=models.PROTECT, null=True, blank=True)
     title = models.CharField(max_length=255)
     expense_type = models.CharField(max_length=20, choices=EXPENSE_TYPES)
 
     # Core scheduling fields
-    amount = models.DecimalField(
-        max_digits=13,
-        decimal_places=2,
-        validators=[MinValueValidator(0.01)],
+    amount = MoneyField(
+        validators=[MinValueValidator(Money("0.01"))],
         help_text="Per-installment amount for split payments, total amount for others",
     )
     start_date = models.DateField(
@@ -122,6 +159,8 @@ class Expense(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ExpenseQuerySet.as_manager()
+
     def clean(self) -> None:
         """
         Validate expense data based on type-specific business rules.
@@ -184,7 +223,7 @@ class Expense(models.Model):
 
         # Validate start date is not earlier than current month for this budget
         if self.start_date and self.budget_id:
-            most_recent_month = BudgetMonth.get_most_recent(budget=self.budget)
+            most_recent_month = BudgetMonth.get_most_recent(budget=self.budget_id)
             if most_recent_month:
                 # Get first day of the most recent month
                 current_month_start = date(
@@ -221,11 +260,47 @@ class Expense(models.Model):
         """Get CSS class for expense type icon color."""
         return f'expense-type-icon-{self.expense_type.replace("_", "-")}'
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        # Restrictions depend on start date and type, so evaluate them again
+        self._edit_restrictions = None
+        from ..search import ExpenseSearchService
+        from ..services import DataVersionService
+
+        ExpenseSearchService.index_expenses([self.pk])
+        DataVersionService.bump_budget(self.budget_id)
+        # Payee expense counts (payee directory) depend on expenses, and
+        # edits may have cleared the payee
+        if self.payee_id is not None or not adding:
+            DataVersionService.bump_payee_directory()
+
+    def delete(self, *args: Any, **kwargs: Any) -> Tuple[int, Dict[str, int]]:
+        """Delete expense and refresh summaries of months its items belonged to."""
+        from .expense_item import ExpenseItem
+        from .month_summary import BudgetMonthSummary
+        from ..search import ExpenseSearchService
+        from ..services import DataVersionService
+
+        expense_id = self.pk
+        with transaction.atomic():
+            month_ids = list(
+                ExpenseItem.objects.filter(expense=self)
+                .order_by()
+                .values_list("month_id", flat=True)
+                .distinct()
+            )
+            result = super().delete(*args, **kwargs)
+            BudgetMonthSummary.refresh(month_ids)
+            ExpenseSearchService.index_expenses([expense_id])
+        DataVersionService.bump_budget(self.budget_id)
+        if self.payee_id is not None:
+            DataVersionService.bump_payee_directory()
+        return result
+
     def can_be_deleted(self) -> bool:
         """Check if this expense can be deleted (no paid expense items)"""
-        from .payment import Payment
-
-        return not Payment.objects.filter(expense_item__expense=self).exists()
+        return not self.get_edit_restrictions().has_paid_items
 
     def can_be_edited(self) -> bool:
         """Check if this expense can be edited at all"""
@@ -242,49 +317,11 @@ class Expense(models.Model):
 
     def can_edit_amount(self) -> bool:
         """Check if the amount field can be edited"""
-        # First check if expense can be edited at all
-        if not self.can_be_edited():
-            return False
-
-        # Cannot edit amount if any expense item is paid
-        from .payment import Payment
-
-        has_paid_items = Payment.objects.filter(expense_item__expense=self).exists()
-        if has_paid_items:
-            return False
-
-        return True
+        return self.get_edit_restrictions().can_edit_amount
 
     def can_edit_date(self) -> bool:
         """Check if the start date can be edited based on current date restrictions"""
-        # Import here to avoid circular imports
-        from .month import BudgetMonth
-
-        # First check if expense can be edited at all
-        if not self.can_be_edited():
-            return False
-
-        # For one-time expenses, allow editing dates back to the most recent month
-        if self.expense_type == self.TYPE_ONE_TIME:
-            return True
-
-        # For other expense types, check if current expense date is not earlier than next month
-        if self.start_date and self.budget_id:
-            most_recent_month = BudgetMonth.get_most_recent(budget=self.budget)
-            if most_recent_month:
-                # Calculate next month start date
-                if most_recent_month.month == 12:
-                    next_month_start = date(most_recent_month.year + 1, 1, 1)
-                else:
-                    next_month_start = date(
-                        most_recent_month.year, most_recent_month.month + 1, 1
-                    )
-
-                # Can only edit date if current expense date is not earlier than next month
-                if self.start_date < next_month_start:
-                    return False
-
-        return True
+        return self.get_edit_restrictions().can_edit_date
 
     def get_next_month_date(self) -> Optional[date]:
         """Calculate next month start date for this expense's budget"""
@@ -294,7 +331,7 @@ class Expense(models.Model):
         if not self.budget_id:
             return None
 
-        most_recent_month = BudgetMonth.get_most_recent(budget=self.budget)
+        most_recent_month = BudgetMonth.get_most_recent(budget=self.budget_id)
         if not most_recent_month:
             return None
 
@@ -305,40 +342,105 @@ class Expense(models.Model):
             return date(most_recent_month.year, most_recent_month.month + 1, 1)
 
     def get_edit_restrictions(self) -> EditRestrictions:
-        """Get detailed information about edit restrictions"""
-        restrictions: EditRestrictions = {
-            "can_edit": self.can_be_edited(),
-            "can_edit_amount": self.can_edit_amount(),
-            "can_edit_date": self.can_edit_date(),
-            "reasons": [],
-        }
+        """
+        Get detailed information about edit restrictions.
+
+        The result is evaluated once and cached on the instance until it is
+        saved again. Use evaluate_edit_restrictions() to evaluate many
+        expenses at once.
+        """
+        restrictions = getattr(self, "_edit_restrictions", None)
+        if restrictions is None:
+            restrictions = self.evaluate_edit_restrictions([self])[self.pk]
+        return restrictions  # type: ignore[no-any-return]
+
+    @classmethod
+    def evaluate_edit_restrictions(
+        cls, expenses: Iterable["Expense"]
+    ) -> Dict[Optional[int], EditRestrictions]:
+        """
+        Evaluate edit restrictions of many expenses in one pass.
+
+        Payments of all expenses not annotated by with_paid_items() are
+        checked with a single query, and the most recent month is looked up
+        once per budget. Results are cached on each expense instance.
+
+        Args:
+            expenses: Expenses to evaluate
+
+        Returns:
+            dict: Expense pk to its EditRestrictions
+        """
+        # Import here to avoid circular imports
+        from .payment import Payment
 
-        reasons_list = restrictions["reasons"]
-        assert isinstance(reasons_list, list)  # Type narrowing for mypy
+        expenses = list(expenses)
+        unknown_ids = [
+            expense.pk
+            for expense in expenses
+            if expense.pk and getattr(expense, "has_paid_items", None) is None
+        ]
+        paid_ids = set()
+        if unknown_ids:
+            paid_ids = set(
+                Payment.objects.filter(expense_item__expense_id__in=unknown_ids)
+                .order_by()
+                .values_list("expense_item__expense_id", flat=True)
+                .distinct()
+            )
 
+        next_month_dates: Dict[Optional[int], Optional[date]] = {}
+        results = {}
+        for expense in expenses:
+            has_paid_items = getattr(expense, "has_paid_items", None)
+            if has_paid_items is None:
+                has_paid_items = expense.pk in paid_ids
+            if expense.budget_id not in next_month_dates:
+                next_month_dates[expense.budget_id] = expense.get_next_month_date()
+            restrictions = expense._build_edit_restrictions(
+                bool(has_paid_items), next_month_dates[expense.budget_id]
+            )
+            expense._edit_restrictions = restrictions
+            results[expense.pk] = restrictions
+        return results
+
+    def _build_edit_restrictions(
+        self, has_paid_items: bool, next_month_start: Optional[date]
+    ) -> EditRestrictions:
+        """Build restrictions from already gathered facts."""
+        can_edit = self.can_be_edited()
+        can_edit_amount = can_edit and not has_paid_items
+        # One-time expenses can move dates back to the most recent month, other
+        # types can only edit dates not earlier than next month
+        can_edit_date = can_edit and (
+            self.expense_type == self.TYPE_ONE_TIME
+            or not self.start_date
+            or next_month_start is None
+            or self.start_date >= next_month_start
+        )
+
+        reasons = []
         if self.closed_at:
-            reasons_list.append("Expense is closed")
+            reasons.append("Expense is closed")
 
         if self.expense_type == self.TYPE_SPLIT_PAYMENT:
-            reasons_list.append("Split payment expenses cannot be edited")
+            reasons.append("Split payment expenses cannot be edited")
         elif self.expense_type == self.TYPE_RECURRING_WITH_END:
-            reasons_list.append("Recurring expenses with end date cannot be edited")
+            reasons.append("Recurring expenses with end date cannot be edited")
 
-        if restrictions["can_edit"] and not restrictions["can_edit_amount"]:
-            from .payment import Payment
+        if can_edit and not can_edit_amount:
+            reasons.append("Amount cannot be edited because expense has paid items")
 
-            has_paid_items = Payment.objects.filter(expense_item__expense=self).exists()
-            if has_paid_items:
-                reasons_list.append(
-                    "Amount cannot be edited because expense has paid items"
-                )
-
-        if restrictions["can_edit"] and not restrictions["can_edit_date"]:
-            reasons_list.append(
-                "Date cannot be edited for expenses earlier than next month"
-            )
+        if can_edit and not can_edit_date:
+            reasons.append("Date cannot be edited for expenses earlier than next month")
 
-        return restrictions
+        return EditRestrictions(
+            can_edit=can_edit,
+            can_edit_amount=can_edit_amount,
+            can_edit_date=can_edit_date,
+            has_paid_items=has_paid_items,
+            reasons=tuple(reasons),
+        )
 
     def get_due_date_for_month(self, year: int, month: int) -> date:
         """
@@ -401,3 +503,9 @@ class Expense(models.Model):
         """Meta configuration for Expense model."""
 
         ordering = ["-created_at"]
+        indexes = [
+            # Serves expense lookups of a budget (expense list, rollover, export)
+            models.Index(
+                fields=["budget", "start_date"], name="expense_budget_start_idx"
+            ),
+        ]
@@ -1,11 +1,60 @@
-from django.db import models
-from django.db.models import Sum  # noqa: WPS458
+from django.db import models, transaction
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)  # noqa: WPS458
+from django.db.models.functions import Coalesce
 from django.core.validators import MinValueValidator
 from django.core.exceptions import ValidationError
 from datetime import date
-from typing import Tuple
+from typing import Any, Dict, Optional, Tuple
 from decimal import Decimal
 import calendar
+from ..money import Money, MoneyField
+
+
+class ExpenseItemQuerySet(models.QuerySet):
+    """QuerySet with SQL-side payment aggregation helpers."""
+
+    def pending(self) -> "ExpenseItemQuerySet":
+        """Filter to items not fully paid yet, using stored payment totals."""
+        return self.filter(paid_total__lt=F("amount"))
+
+    def paid(self) -> "ExpenseItemQuerySet":
+        """Filter to fully paid items, using stored payment totals."""
+        return self.filter(paid_total__gte=F("amount"))
+
+    def with_payment_totals(self) -> "ExpenseItemQuerySet":
+        """
+        Annotate each item with payment total, payment count and status.
+
+        ExpenseItem.get_total_paid(), get_payment_count() and status use
+        these annotations when present, so rendering any number of rows
+        needs no per-row queries.
+        """
+        return self.annotate(
+            annotated_total_paid=Coalesce(
+                Sum("payment__amount"),
+                Value(0),
+                output_field=MoneyField(),
+            ),
+            annotated_payment_count=Count("payment"),
+        ).annotate(
+            annotated_status=Case(
+                When(
+                    annotated_total_paid__gte=F("amount"),
+                    then=Value(ExpenseItem.STATUS_PAID),
+                ),
+                default=Value(ExpenseItem.STATUS_PENDING),
+                output_field=models.CharField(),
+            ),
+        )
 
 
 class ExpenseItem(models.Model):
@@ -17,15 +66,115 @@ class ExpenseItem(models.Model):
         (STATUS_PAID, "Paid"),
     ]
 
-    expense = models.ForeignKey("Expense", on_delete=models.CASCADE)
-    month = models.ForeignKey("BudgetMonth", on_delete=models.CASCADE)
+    # Indexed by the composite indexes of Meta, which lead with them
+    expense = models.ForeignKey("Expense", on_delete=models.CASCADE, db_index=False)
+    month = models.ForeignKey("BudgetMonth", on_delete=models.CASCADE, db_index=False)
     due_date = models.DateField()
-    amount = models.DecimalField(
-        max_digits=13, decimal_places=2, validators=[MinValueValidator(0.01)]
-    )
+    amount = MoneyField(validators=[MinValueValidator(Money("0.01"))])
+    # Denormalized payment totals, maintained by Payment.save()/delete()
+    paid_total = MoneyField(default=Money(0), editable=False)
+    payment_count = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ExpenseItemQuerySet.as_manager()
+
+    PAYMENT_TOTAL_FIELDS = ("paid_total", "payment_count")
+    PAYMENT_ANNOTATIONS = (
+        "annotated_total_paid",
+        "annotated_payment_count",
+        "annotated_status",
+    )
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Save item without overwriting payment totals maintained by Payment,
+        and refresh summaries of affected months.
+        """
+        from .month_summary import BudgetMonthSummary
+
+        month_ids = {self.month_id}
+        with transaction.atomic():
+            if not self._state.adding and self.pk:
+                month_ids.add(
+                    ExpenseItem.objects.filter(pk=self.pk)
+                    .values_list("month_id", flat=True)
+                    .first()
+                )
+                if kwargs.get("update_fields") is None and not kwargs.get(
+                    "force_insert"
+                ):
+                    kwargs["update_fields"] = [
+                        field.attname
+                        for field in self._meta.concrete_fields
+                        if not field.primary_key
+                        and field.name not in self.PAYMENT_TOTAL_FIELDS
+                    ]
+            super().save(*args, **kwargs)
+            BudgetMonthSummary.refresh(month_ids)
+
+    def delete(self, *args: Any, **kwargs: Any) -> Tuple[int, Dict[str, int]]:
+        """Delete item and refresh summary of its month."""
+        from .month_summary import BudgetMonthSummary
+        from ..search import ExpenseSearchService
+
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            BudgetMonthSummary.refresh([self.month_id])
+            if self.payment_count:
+                # Transaction IDs of deleted payments are no longer searchable
+                ExpenseSearchService.index_expenses([self.expense_id])
+        return result
+
+    @classmethod
+    def refresh_payment_totals(cls, item_ids: Optional[Any] = None) -> int:
+        """
+        Recalculate paid_total and payment_count from Payment records,
+        together with summaries of affected months.
+
+        Args:
+            item_ids: Optional iterable of ExpenseItem ids to limit the update to.
+                When omitted, all expense items are recalculated.
+
+        Returns:
+            int: Number of expense items updated
+        """
+        # Import here to avoid circular imports
+        from .payment import Payment
+
+        payments = Payment.objects.filter(expense_item=OuterRef("pk")).order_by()
+        total_subquery = Subquery(
+            payments.values("expense_item")
+            .annotate(total=Sum("amount"))
+            .values("total")[:1]
+        )
+        count_subquery = Subquery(
+            payments.values("expense_item").annotate(cnt=Count("pk")).values("cnt")[:1]
+        )
+
+        queryset = cls.objects.all()
+        if item_ids is not None:
+            queryset = queryset.filter(pk__in=item_ids)
+        updated = queryset.update(
+            paid_total=Coalesce(
+                total_subquery,
+                Value(0),
+                output_field=MoneyField(),
+            ),
+            payment_count=Coalesce(count_subquery, Value(0)),
+        )
+
+        # Keep month summaries in sync with the new totals
+        from .month_summary import BudgetMonthSummary
+
+        if item_ids is None:
+            BudgetMonthSummary.rebuild_all()
+        else:
+            BudgetMonthSummary.refresh(
+                queryset.order_by().values_list("month_id", flat=True).distinct()
+            )
+        return updated
+
     def clean(self) -> None:
         # Import here to avoid circular imports
         from .month import BudgetMonth
@@ -39,7 +188,7 @@ class ExpenseItem(models.Model):
                 ).strftime("%B %Y")
                 if self.expense.expense_type == self.expense.TYPE_ONE_TIME:
                     most_recent_month = BudgetMonth.get_most_recent(
-                        budget=self.expense.budget
+                        budget=self.expense.budget_id
                     )
                     if most_recent_month and start_date < date(
                         self.expense.start_date.year, self.expense.start_date.month, 1
@@ -73,7 +222,9 @@ class ExpenseItem(models.Model):
         # For one-time expenses, allow moving as early as the most recent month in budget
         if self.expense.expense_type == self.expense.TYPE_ONE_TIME:
             # Get the most recent (active) month for this budget
-            most_recent_month = BudgetMonth.get_most_recent(budget=self.expense.budget)
+            most_recent_month = BudgetMonth.get_most_recent(
+                budget=self.expense.budget_id
+            )
             if most_recent_month:
                 # Start date is the earlier of: expense creation month or most recent month
                 active_month_start = date(
@@ -99,9 +250,11 @@ class ExpenseItem(models.Model):
         return delta
 
     def get_total_paid(self) -> Decimal:
-        """Calculate total amount paid from all Payment records"""
-        total = self.payment_set.aggregate(Sum("amount"))["amount__sum"]
-        return total or Decimal("0.00")
+        """Get total amount paid from all Payment records"""
+        annotated = getattr(self, "annotated_total_paid", None)
+        if annotated is not None:
+            return annotated
+        return self.paid_total or Money(0)
 
     def get_remaining_amount(self) -> Decimal:
         """Calculate remaining amount to be paid (negative = still owed, positive = overpaid)"""
@@ -109,16 +262,18 @@ class ExpenseItem(models.Model):
 
     def get_payment_count(self) -> int:
         """Get the number of payments made for this expense item"""
-        return self.payment_set.count()
+        annotated = getattr(self, "annotated_payment_count", None)
+        if annotated is not None:
+            return annotated
+        return self.payment_count
 
     @property
     def status(self) -> str:
-        """Calculate payment status based on total payments"""
-        return (
-            self.STATUS_PAID
-            if self.get_total_paid() >= self.amount
-            else self.STATUS_PENDING
-        )
+        """Payment status based on total payments"""
+        annotated = getattr(self, "annotated_status", None)
+        if annotated is not None:
+            return annotated
+        return self.STATUS_PAID if self.is_fully_paid() else self.STATUS_PENDING
 
     def is_fully_paid(self) -> bool:
         """Check if expense item is fully paid"""
@@ -144,8 +299,8 @@ class ExpenseItem(models.Model):
             return False
 
         # Must be from current (most recent) month
-        current_month = BudgetMonth.get_most_recent(budget=self.expense.budget)
-        if not current_month or self.month != current_month:
+        current_month = BudgetMonth.get_most_recent(budget=self.expense.budget_id)
+        if not current_month or self.month_id != current_month.pk:
             return False
 
         return True
@@ -157,3 +312,19 @@ class ExpenseItem(models.Model):
         """Meta configuration for ExpenseItem model."""
 
         ordering = ["due_date", "-created_at"]
+        indexes = [
+            # Serves month item lists ordered by due date (dashboard, month detail)
+            models.Index(
+                fields=["month", "due_date"], name="expenseitem_month_due_idx"
+            ),
+            # Serves expense detail item lists and per-expense item counts
+            models.Index(
+                fields=["expense", "due_date"], name="expenseitem_expense_due_idx"
+            ),
+            # Serves dashboard overdue lookup of unpaid items in past months
+            models.Index(
+                fields=["month", "due_date"],
+                condition=models.Q(paid_total__lt=models.F("amount")),
+                name="expenseitem_pending_idx",
+            ),
+        ]
@@ -1,6 +1,7 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from typing import Optional, Dict
+from .. import request_cache
 
 
 class BudgetMonth(models.Model):
@@ -11,6 +12,10 @@ class BudgetMonth(models.Model):
     month = models.PositiveSmallIntegerField(
         validators=[MinValueValidator(1), MaxValueValidator(12)]
     )
+    period = models.PositiveIntegerField(
+        editable=False,
+        help_text="Sortable month key (year * 100 + month), set on save",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -18,11 +23,41 @@ class BudgetMonth(models.Model):
         """Meta configuration for BudgetMonth model."""
 
         unique_together = ["budget", "year", "month"]
-        ordering = ["-year", "-month"]
+        ordering = ["-period"]
+        indexes = [
+            # Serves most recent month lookups and month range filters of a budget
+            models.Index(fields=["budget", "period"], name="budgetmonth_period_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.year}-{self.month:02d}"
 
+    @staticmethod
+    def compute_period(year: int, month: int) -> int:
+        """Get period key of given month (e.g. 202403 for March 2024)."""
+        return year * 100 + month
+
+    def save(self, *args, **kwargs) -> None:
+        self.period = self.compute_period(self.year, self.month)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"year", "month"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "period"}
+        super().save(*args, **kwargs)
+        request_cache.invalidate(request_cache.MOST_RECENT_MONTH)
+        self._bump_data_version()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        request_cache.invalidate(request_cache.MOST_RECENT_MONTH)
+        self._bump_data_version()
+        return result
+
+    def _bump_data_version(self) -> None:
+        # Import here to avoid circular imports
+        from ..services import DataVersionService
+
+        DataVersionService.bump_budget(self.budget_id)
+
     def has_paid_expenses(self) -> bool:
         """Check if this month has any paid expense items"""
         from .payment import Payment
@@ -35,10 +70,19 @@ class BudgetMonth(models.Model):
 
     @classmethod
     def get_most_recent(cls, budget=None) -> Optional["BudgetMonth"]:
-        """Get the most recent month in the system or for a specific budget"""
-        if budget:
-            return cls.objects.filter(budget=budget).first()
-        return cls.objects.first()  # Due to ordering, first() returns most recent
+        """
+        Get the most recent month in the system or for a specific budget.
+
+        The result is memoized for the duration of the current request.
+        """
+        budget_id = getattr(budget, "pk", budget)
+        queryset = cls.objects.all()
+        if budget_id:
+            queryset = queryset.filter(budget_id=budget_id)
+        # Due to ordering, first() returns most recent
+        return request_cache.get_or_set(
+            (request_cache.MOST_RECENT_MONTH, budget_id), queryset.first
+        )
 
     @classmethod
     def get_next_allowed_month(cls, budget=None) -> Optional[Dict[str, int]]:
@@ -0,0 +1,181 @@
+from django.db import models
+from django.db.models import Case, Count, F, Q, Sum, Value, When  # noqa: WPS458
+from django.db.models.functions import Coalesce
+from ..money import Money, MoneyField
+from typing import Iterable, Optional
+
+
+class BudgetMonthSummary(models.Model):
+    """
+    Materialized payment summary of a single BudgetMonth.
+
+    Rows are recalculated for affected months whenever expense items or
+    payments change, so pages can read month totals without aggregating
+    expense items on every request.
+    """
+
+    month = models.OneToOneField(
+        "BudgetMonth", on_delete=models.CASCADE, related_name="summary"
+    )
+    total_amount = MoneyField(default=Money(0))
+    paid_amount = MoneyField(
+        default=Money(0),
+        help_text="Sum of all payments recorded for expense items of the month",
+    )
+    pending_amount = MoneyField(
+        default=Money(0),
+        help_text="Amount still owed on expense items that are not fully paid",
+    )
+    item_count = models.PositiveIntegerField(default=0)
+    paid_count = models.PositiveIntegerField(default=0)
+    pending_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    SUMMARY_FIELDS = (
+        "total_amount",
+        "paid_amount",
+        "pending_amount",
+        "item_count",
+        "paid_count",
+        "pending_count",
+    )
+
+    def __str__(self) -> str:
+        return f"Summary of {self.month_id}"
+
+    @classmethod
+    def calculate(cls, month_ids: Optional[Iterable[int]] = None) -> dict:
+        """
+        Aggregate expense items into summary values, grouped by month.
+
+        Args:
+            month_ids: Optional BudgetMonth ids to limit calculation to
+
+        Returns:
+            dict: BudgetMonth id to dict of summary field values. Months
+            without expense items are not included.
+        """
+        # Import here to avoid circular imports
+        from .expense_item import ExpenseItem
+
+        # Sums run on integer cents and are converted to Money once per row
+        money_field = MoneyField()
+        zero = Value(0)
+        is_paid = Q(paid_total__gte=F("amount"))
+
+        items = ExpenseItem.objects.order_by()
+        if month_ids is not None:
+            items = items.filter(month_id__in=month_ids)
+
+        rows = (
+            items.values("month_id")
+            .annotate(
+                total_amount=Coalesce(Sum("amount"), zero, output_field=money_field),
+                paid_amount=Coalesce(Sum("paid_total"), zero, output_field=money_field),
+                pending_amount=Coalesce(
+                    Sum(
+                        Case(
+                            When(is_paid, then=zero),
+                            default=F("amount") - F("paid_total"),
+                            output_field=money_field,
+                        )
+                    ),
+                    zero,
+                    output_field=money_field,
+                ),
+                item_count=Count("id"),
+                paid_count=Count("id", filter=is_paid),
+                pending_count=Count("id", filter=~is_paid),
+            )
+            .values("month_id", *cls.SUMMARY_FIELDS)
+        )
+        return {row.pop("month_id"): row for row in rows}
+
+    @classmethod
+    def refresh(
+        cls, month_ids: Iterable[Optional[int]], data_changed: bool = True
+    ) -> None:
+        """
+        Recalculate and store summaries of given months.
+
+        Args:
+            month_ids: BudgetMonth ids whose summaries are out of date
+            data_changed: Whether underlying data changed, bumping data
+                versions of affected budgets
+        """
+        month_ids = {month_id for month_id in month_ids if month_id is not None}
+        if not month_ids:
+            return
+
+        # Import here to avoid circular imports
+        from .month import BudgetMonth
+
+        # Skip months deleted in the meantime (e.g. cascaded deletes)
+        existing = dict(
+            BudgetMonth.objects.filter(pk__in=month_ids).values_list("pk", "budget_id")
+        )
+        cls._store(existing, cls.calculate(month_ids))
+        if data_changed:
+            cls._bump_data_versions(existing.values())
+
+    @classmethod
+    def rebuild_all(cls) -> int:
+        """
+        Recalculate summaries of all months.
+
+        Returns:
+            int: Number of summaries written
+        """
+        # Import here to avoid circular imports
+        from .month import BudgetMonth
+
+        months = dict(BudgetMonth.objects.values_list("pk", "budget_id"))
+        cls._store(months, cls.calculate())
+        cls._bump_data_versions(months.values())
+        return len(months)
+
+    @staticmethod
+    def _bump_data_versions(budget_ids: Iterable[int]) -> None:
+        """
+        Mark data of given budgets as changed.
+
+        Summaries are refreshed on every change of expense items and their
+        payments, including bulk operations bypassing model save(), which
+        makes this the one place that sees all of them.
+        """
+        # Import here to avoid circular imports
+        from ..services import DataVersionService
+
+        DataVersionService.bump_budget(*budget_ids)
+
+    @classmethod
+    def _store(cls, month_ids: Iterable[int], values: dict) -> None:
+        """Upsert summaries of given months, zeroing months without items."""
+        summaries = [
+            cls(month_id=month_id, **values.get(month_id, {})) for month_id in month_ids
+        ]
+        cls.objects.bulk_create(
+            summaries,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["month"],
+            update_fields=[*cls.SUMMARY_FIELDS, "updated_at"],
+        )
+
+    @classmethod
+    def for_month(cls, month) -> "BudgetMonthSummary":
+        """Get summary of given month, calculating it first if missing."""
+        try:
+            return month.summary  # type: ignore[no-any-return]
+        except cls.DoesNotExist:
+            # Only the summary is missing, the data it describes is unchanged
+            cls.refresh([month.pk], data_changed=False)
+            summary = cls.objects.get(month=month)
+            month.summary = summary
+            return summary
+
+    class Meta:
+        """Meta configuration for BudgetMonthSummary model."""
+
+        verbose_name = "Budget month summary"
+        verbose_name_plural = "Budget month summaries"
@@ -1,4 +1,14 @@
 from django.db import models
+from django.db.models import Count
+from typing import Any, Dict, Tuple
+
+
+class PayeeQuerySet(models.QuerySet):
+    """QuerySet with SQL-side expense counting helpers."""
+
+    def with_expense_counts(self) -> "PayeeQuerySet":
+        """Annotate each payee with the number of its expenses."""
+        return self.annotate(expense_count=Count("expense"))
 
 
 class Payee(models.Model):
@@ -7,18 +17,58 @@ class Payee(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = PayeeQuerySet.as_manager()
+
     def __str__(self) -> str:
         return self.name
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        previous_name = None
+        if not self._state.adding and self.pk:
+            previous_name = (
+                Payee.objects.filter(pk=self.pk).values_list("name", flat=True).first()
+            )
+        super().save(*args, **kwargs)
+        # Import here to avoid circular imports
+        from ..search import ExpenseSearchService
+        from ..services import DataVersionService
+
+        if previous_name is not None and previous_name != self.name:
+            # Payee names are searchable on their expenses
+            ExpenseSearchService.index_expenses(
+                self.expense_set.values_list("pk", flat=True)
+            )
+        # Payee names are listed in dropdowns of all budgets
+        DataVersionService.bump_global()
+        DataVersionService.bump_payee_directory()
+
+    def delete(self, *args: Any, **kwargs: Any) -> Tuple[int, Dict[str, int]]:
+        result = super().delete(*args, **kwargs)
+        # Import here to avoid circular imports
+        from ..services import DataVersionService
+
+        DataVersionService.bump_global()
+        DataVersionService.bump_payee_directory()
+        return result
+
     @property
     def is_hidden(self) -> bool:
         return self.hidden_at is not None
 
     def can_be_deleted(self) -> bool:
         """Check if this payee can be deleted (no associated expenses and not hidden)"""
-        return not self.expense_set.exists() and not self.is_hidden
+        if self.is_hidden:
+            return False
+        expense_count = getattr(self, "expense_count", None)
+        if expense_count is not None:
+            return expense_count == 0
+        return not self.expense_set.exists()
 
     class Meta:
         """Meta configuration for Payee model."""
 
         ordering = ["name"]
+        indexes = [
+            # Serves visible payee listings ordered by name (dropdowns, payee list)
+            models.Index(fields=["hidden_at", "name"], name="payee_hidden_name_idx"),
+        ]
@@ -1,13 +1,16 @@
-from django.db import models
+from django.db import models, transaction
 from django.core.validators import MinValueValidator
 from django.core.exceptions import ValidationError
+from typing import Any, Dict, Tuple
+from ..money import Money, MoneyField
 
 
 class Payment(models.Model):
-    expense_item = models.ForeignKey("ExpenseItem", on_delete=models.CASCADE)
-    amount = models.DecimalField(
-        max_digits=13, decimal_places=2, validators=[MinValueValidator(0.01)]
+    # Indexed by payment_item_date_idx, which leads with it
+    expense_item = models.ForeignKey(
+        "ExpenseItem", on_delete=models.CASCADE, db_index=False
     )
+    amount = MoneyField(validators=[MinValueValidator(Money("0.01"))])
     payment_date = models.DateTimeField()
     payment_method = models.ForeignKey(
         "PaymentMethod", null=True, blank=True, on_delete=models.SET_NULL
@@ -35,6 +38,45 @@ class Payment(models.Model):
                     f"Payment amount ({self.amount}) cannot exceed remaining balance ({remaining})"
                 )
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Save payment and refresh paid totals of affected expense items."""
+        with transaction.atomic():
+            previous_item_id = None
+            if self.pk:
+                previous_item_id = (
+                    Payment.objects.filter(pk=self.pk)
+                    .values_list("expense_item_id", flat=True)
+                    .first()
+                )
+            super().save(*args, **kwargs)
+            self._refresh_expense_item_totals({self.expense_item_id, previous_item_id})
+
+    def delete(self, *args: Any, **kwargs: Any) -> Tuple[int, Dict[str, int]]:
+        """Delete payment and refresh paid totals of its expense item."""
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            self._refresh_expense_item_totals({self.expense_item_id})
+        return result
+
+    def _refresh_expense_item_totals(self, item_ids: set) -> None:
+        """Recalculate stored totals and sync the cached ExpenseItem instance."""
+        from .expense_item import ExpenseItem
+        from ..search import ExpenseSearchService
+
+        item_ids = [item_id for item_id in item_ids if item_id is not None]
+        ExpenseItem.refresh_payment_totals(item_ids)
+        # Transaction IDs are searchable on expenses
+        ExpenseSearchService.index_expenses(
+            ExpenseItem.objects.filter(pk__in=item_ids).values_list(
+                "expense_id", flat=True
+            )
+        )
+        if Payment.expense_item.is_cached(self):  # type: ignore[attr-defined]
+            self.expense_item.refresh_from_db(fields=ExpenseItem.PAYMENT_TOTAL_FIELDS)
+            # Drop query annotations that no longer reflect the stored totals
+            for attr in ExpenseItem.PAYMENT_ANNOTATIONS:
+                self.expense_item.__dict__.pop(attr, None)
+
     def __str__(self):
         return f"Payment {self.amount} for {self.expense_item.expense.title} on {self.payment_date.date()}"
 
@@ -42,3 +84,9 @@ class Payment(models.Model):
         """Meta configuration for Payment model."""
 
         ordering = ["-payment_date", "-created_at"]
+        indexes = [
+            # Serves payment lists and totals of an expense item
+            models.Index(
+                fields=["expense_item", "payment_date"], name="payment_item_date_idx"
+            ),
+        ]
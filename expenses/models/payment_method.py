@@ -1,4 +1,5 @@
 from django.db import models
+from typing import Any, Dict, Tuple
 
 
 class PaymentMethod(models.Model):
@@ -9,6 +10,21 @@ class PaymentMethod(models.Model):
     def __str__(self) -> str:
         return self.name
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        super().save(*args, **kwargs)
+        # Import here to avoid circular imports
+        from ..services import DataVersionService
+
+        DataVersionService.bump_global()
+
+    def delete(self, *args: Any, **kwargs: Any) -> Tuple[int, Dict[str, int]]:
+        result = super().delete(*args, **kwargs)
+        # Import here to avoid circular imports
+        from ..services import DataVersionService
+
+        DataVersionService.bump_global()
+        return result
+
     def can_be_deleted(self) -> bool:
         """Check if this payment method can be deleted (not used in any payments)"""
         return not self.payment_set.exists()
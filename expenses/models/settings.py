@@ -1,11 +1,12 @@
 from django.db import models
-from django.core.cache import cache
 from typing import Any, Tuple, Dict
 
 
 class Settings(models.Model):
     """Application-wide settings singleton model."""
 
+    SINGLETON_PK = 1
+
     currency = models.CharField(
         max_length=3, default="USD", help_text="ISO 4217 currency code"
     )
@@ -16,6 +17,18 @@ class Settings(models.Model):
         help_text="Locale identifier (e.g., en_US, fr_FR)",
     )
 
+    data_version = models.BigIntegerField(
+        default=0,
+        editable=False,
+        help_text="Version of data shown on all pages, see DataVersionService",
+    )
+
+    payee_directory_version = models.BigIntegerField(
+        default=0,
+        editable=False,
+        help_text="Version of the payee directory, see DataVersionService",
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -27,10 +40,13 @@ class Settings(models.Model):
 
     def save(self, *args: Any, **kwargs: Any) -> None:
         """Ensure only one Settings instance exists."""
-        self.pk = 1
+        self.pk = self.SINGLETON_PK
         super().save(*args, **kwargs)
-        # Clear cache when settings are saved
-        cache.delete("app_settings")
+        # Clear cached settings and compiled currency formatters
+        from ..services import DataVersionService, SettingsService
+
+        SettingsService.clear_cache()
+        DataVersionService.bump_global()
 
     def delete(self, *args: Any, **kwargs: Any) -> Tuple[int, Dict[str, int]]:
         """Prevent deletion of settings."""
@@ -39,5 +55,5 @@ class Settings(models.Model):
     @classmethod
     def load(cls) -> "Settings":
         """Load or create settings instance."""
-        obj, created = cls.objects.get_or_create(pk=1)
+        obj, created = cls.objects.get_or_create(pk=cls.SINGLETON_PK)
         return obj
@@ -0,0 +1,118 @@
+"""
+Money value type and model field storing amounts as integer minor units.
+
+Amounts live in the database as integer cents, so SUM() and comparisons
+run on plain integers. Python code keeps working with Money, a Decimal
+subclass exact to the cent, so forms, templates and currency formatting
+see the same major-unit values as before.
+"""
+
+from decimal import ROUND_HALF_EVEN, Decimal, InvalidOperation
+from typing import Any, Iterable, Optional, Union
+
+from django.core import exceptions
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from .fields import SanitizedDecimalField
+
+CENT = Decimal("0.01")
+
+
+class Money(Decimal):
+    """Amount in major currency units, always quantized to cents."""
+
+    __slots__ = ()
+
+    def __new__(cls, value: Any = "0") -> "Money":
+        if isinstance(value, float):
+            # Go through str() so 0.1 becomes 0.10, not its binary expansion
+            value = str(value)
+        return super().__new__(
+            cls, Decimal(value).quantize(CENT, rounding=ROUND_HALF_EVEN)
+        )
+
+    @classmethod
+    def from_cents(cls, cents: Union[int, Decimal]) -> "Money":
+        """Create Money from integer minor units."""
+        # "<cents>E-2" is exact to the cent already, so skip quantize(); this
+        # runs for every amount read from the database
+        return Decimal.__new__(cls, f"{int(cents)}E-2")
+
+    @property
+    def cents(self) -> int:
+        """Amount in integer minor units."""
+        return int(self.scaleb(2))
+
+    @classmethod
+    def sum(cls, values: Iterable[Any]) -> "Money":
+        """Sum amounts as integer cents, without intermediate Decimal objects."""
+        return cls.from_cents(sum(to_cents(value) for value in values))
+
+
+def to_cents(value: Any) -> int:
+    """
+    Convert major-unit amount (Money, Decimal, int, float or str) to cents.
+
+    Sub-cent fractions are rounded half to even, like Money() does.
+    """
+    if isinstance(value, Money):
+        return value.cents
+    return Money(value).cents
+
+
+class MoneyField(models.BigIntegerField):
+    """
+    Amount stored as integer cents and exposed as Money.
+
+    Values assigned to model instances, query lookups and form input use
+    major units (e.g. Decimal("12.34")); only the database sees cents.
+    """
+
+    description = _("Amount of money stored as integer minor units")
+
+    default_error_messages = {
+        "invalid": _("“%(value)s” value must be a decimal number."),
+    }
+
+    def from_db_value(
+        self, value: Optional[Union[int, Decimal]], expression: Any, connection: Any
+    ) -> Optional[Money]:
+        if value is None:
+            return value
+        return Money.from_cents(value)
+
+    def to_python(self, value: Any) -> Optional[Money]:
+        if value is None or isinstance(value, Money):
+            return value
+        try:
+            return Money(value)
+        except (InvalidOperation, TypeError, ValueError):
+            raise exceptions.ValidationError(
+                self.error_messages["invalid"],
+                code="invalid",
+                params={"value": value},
+            )
+
+    def get_prep_value(self, value: Any) -> Optional[int]:
+        value = models.Field.get_prep_value(self, value)
+        if value is None:
+            return None
+        return to_cents(self.to_python(value))
+
+    @property
+    def validators(self) -> list:
+        # Range validators of BigIntegerField would compare major units with
+        # limits expressed in cents, so only explicit validators apply
+        return [*self.default_validators, *self._validators]
+
+    def formfield(self, **kwargs: Any) -> Any:
+        # Skip IntegerField.formfield(), which would render an integer input
+        return models.Field.formfield(
+            self,
+            **{
+                "form_class": SanitizedDecimalField,
+                "decimal_places": 2,
+                **kwargs,
+            },
+        )
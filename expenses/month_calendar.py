@@ -0,0 +1,112 @@
+"""
+Precomputed month calendar grids for the dashboard.
+
+Grids are immutable and cached per (year, month, today), so rendering a
+calendar neither rebuilds weeks nor creates date objects per request, and
+nothing here touches the process-global state of the calendar module
+(calendar.setfirstweekday() races under threaded servers).
+"""
+
+import calendar
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import Tuple
+
+# Weeks start on Monday; a private instance keeps global calendar state intact
+_calendar = calendar.Calendar(firstweekday=calendar.MONDAY)
+
+WEEKEND_DAYS = (calendar.SATURDAY, calendar.SUNDAY)
+
+
+@dataclass(frozen=True)
+class CalendarDay:
+    """Single cell of a month calendar grid."""
+
+    date: date
+    day: int  # Day of month, 0 for padding cells of adjacent months
+    is_padding: bool
+    is_weekend: bool
+    is_today: bool
+    is_past: bool
+    is_future: bool
+    css_class: str  # Modifier classes of calendar-day element
+
+
+@dataclass(frozen=True)
+class MonthGrid:
+    """Monday-first calendar of a month, relative to a given day."""
+
+    year: int
+    month: int
+    month_name: str
+    today: date
+    weeks: Tuple[Tuple[CalendarDay, ...], ...]
+
+    @property
+    def is_current_month(self) -> bool:
+        return (self.year, self.month) == (self.today.year, self.today.month)
+
+
+@lru_cache(maxsize=256)
+def _month_dates(year: int, month: int) -> Tuple[Tuple[date, ...], ...]:
+    return tuple(tuple(week) for week in _calendar.monthdatescalendar(year, month))
+
+
+@lru_cache(maxsize=64)
+def get_month_grid(year: int, month: int, today: date) -> MonthGrid:
+    """
+    Get calendar grid of a month.
+
+    Args:
+        year: Year of the month
+        month: Month number (1-12)
+        today: Day to flag cells as today, past or future against
+
+    Returns:
+        MonthGrid: Cached, immutable grid (safe to share between threads)
+    """
+    weeks = []
+    for week in _month_dates(year, month):
+        days = []
+        for day_date in week:
+            is_padding = day_date.month != month
+            is_weekend = day_date.weekday() in WEEKEND_DAYS
+            is_today = day_date == today
+            is_past = day_date < today
+            is_future = day_date > today
+
+            classes = []
+            if is_padding:
+                classes.append("calendar-day--empty")
+            else:
+                if is_today:
+                    classes.append("calendar-day--today")
+                if is_past:
+                    classes.append("calendar-day--past")
+                if is_future:
+                    classes.append("calendar-day--future")
+                if is_weekend:
+                    classes.append("calendar-day--weekend")
+
+            days.append(
+                CalendarDay(
+                    date=day_date,
+                    day=0 if is_padding else day_date.day,
+                    is_padding=is_padding,
+                    is_weekend=is_weekend,
+                    is_today=is_today,
+                    is_past=is_past,
+                    is_future=is_future,
+                    css_class=" ".join(classes),
+                )
+            )
+        weeks.append(tuple(days))
+
+    return MonthGrid(
+        year=year,
+        month=month,
+        month_name=calendar.month_name[month],
+        today=today,
+        weeks=tuple(weeks),
+    )
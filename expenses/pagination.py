@@ -0,0 +1,203 @@
+"""
+Keyset (cursor) pagination for long budget lists.
+
+Pages are fetched by seeking past the sort key of the row at the page
+edge, instead of counting rows off with OFFSET. Every page costs one
+index seek plus a page worth of rows, however deep into the list it is,
+and rows added or removed meanwhile do not shift later pages.
+
+Cursors are opaque URL-safe strings encoding that sort key, passed as
+the "after" (next page) or "before" (previous page) GET parameter.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Generic, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.db.models import Q
+from django.http import QueryDict
+
+# Model instances, or dicts of values() querysets
+T = TypeVar("T")
+
+AFTER_PARAM = "after"
+BEFORE_PARAM = "before"
+
+
+@dataclass(frozen=True)
+class KeysetPage(Generic[T]):
+    """Single page of rows with cursors of its neighbouring pages."""
+
+    items: List[T]
+    next_cursor: Optional[str]
+    previous_cursor: Optional[str]
+    params: str = ""  # Other GET parameters (filters) kept by page links
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    @property
+    def has_other_pages(self) -> bool:
+        return self.has_next or self.has_previous
+
+    @property
+    def next_query(self) -> str:
+        """Query string linking to the next page."""
+        return self._query(AFTER_PARAM, self.next_cursor)
+
+    @property
+    def previous_query(self) -> str:
+        """Query string linking to the previous page."""
+        return self._query(BEFORE_PARAM, self.previous_cursor)
+
+    def _query(self, param: str, cursor: Optional[str]) -> str:
+        if cursor is None:
+            return ""
+        params = f"{self.params}&" if self.params else ""
+        return f"?{params}{param}={cursor}"
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class KeysetPaginator(Generic[T]):
+    """
+    Paginate a queryset by a unique sort key.
+
+    Ordering must end with a unique field (usually "id"), so every row has
+    a distinct position; it should match an index for pages to be seeks.
+    values() querysets work as well, as long as they select the sort keys.
+
+    Args:
+        queryset: Rows to paginate, any ordering of it is replaced
+        ordering: Field names, "-" prefixed for descending order
+        per_page: Maximum number of rows on a page
+    """
+
+    def __init__(
+        self, queryset: models.QuerySet, ordering: Sequence[str], per_page: int
+    ):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.keys: List[Tuple[str, bool]] = [
+            (name.lstrip("-"), name.startswith("-")) for name in ordering
+        ]
+        self.fields = [queryset.model._meta.get_field(name) for name, _ in self.keys]
+
+    def get_page(self, params: Optional[Mapping[str, Any]] = None) -> KeysetPage[T]:
+        """
+        Get page selected by "after" or "before" cursor of GET parameters.
+
+        Missing or invalid cursors select the first page.
+        """
+        params = params if params is not None else {}
+        before = self.decode(params.get(BEFORE_PARAM))
+        after = None if before else self.decode(params.get(AFTER_PARAM))
+
+        if before is not None:
+            rows = list(
+                self.queryset.filter(self._seek(before, forward=False)).order_by(
+                    *self._ordering(reverse=True)
+                )[: self.per_page + 1]
+            )
+            if len(rows) <= self.per_page:
+                # Reached the start of the list, so show a full first page
+                return self.get_page(self._link_params(params))
+            items = rows[: self.per_page][::-1]
+            has_previous, has_next = True, True
+        else:
+            queryset = self.queryset
+            if after is not None:
+                queryset = queryset.filter(self._seek(after, forward=True))
+            rows = list(queryset.order_by(*self._ordering())[: self.per_page + 1])
+            items = rows[: self.per_page]
+            has_previous, has_next = after is not None, len(rows) > self.per_page
+
+        return KeysetPage(
+            items=items,
+            next_cursor=self.encode(items[-1]) if has_next and items else None,
+            previous_cursor=self.encode(items[0]) if has_previous and items else None,
+            params=self._link_params(params).urlencode(),
+        )
+
+    def preceding(self, item: T) -> models.QuerySet:
+        """Get rows ordered before given row, nearest first."""
+        return self.queryset.filter(
+            self._seek(self._key(item), forward=False)
+        ).order_by(*self._ordering(reverse=True))
+
+    def encode(self, item: T) -> str:
+        """Get cursor pointing at given row."""
+        values = [
+            value.isoformat() if isinstance(value, date) else str(value)
+            for value in self._key(item)
+        ]
+        data = json.dumps(values, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+    def decode(self, cursor: Optional[str]) -> Optional[List[Any]]:
+        """Get sort key values of a cursor, None when it is missing or invalid."""
+        if not cursor:
+            return None
+        try:
+            data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(data)
+            if not isinstance(values, list) or len(values) != len(self.fields):
+                return None
+            key = [field.to_python(value) for field, value in zip(self.fields, values)]
+        except (binascii.Error, ValueError, TypeError, ValidationError):
+            return None
+        return None if None in key else key
+
+    def _key(self, item: T) -> List[Any]:
+        if isinstance(item, dict):
+            return [item[name] for name, _ in self.keys]
+        return [getattr(item, field.attname) for field in self.fields]
+
+    def _ordering(self, reverse: bool = False) -> List[str]:
+        return [
+            f"-{name}" if descending != reverse else name
+            for name, descending in self.keys
+        ]
+
+    def _seek(self, key: Sequence[Any], forward: bool) -> Q:
+        """
+        Condition matching rows after (forward) or before given sort key.
+
+        Expands the row comparison (a, b, c) > (x, y, z) into
+        a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z),
+        and repeats a >= x as a plain range the index can seek to.
+        """
+        (first_name, first_descending), first_value = self.keys[0], key[0]
+        condition = Q()
+        for position, ((name, descending), value) in enumerate(zip(self.keys, key)):
+            lookup = "lt" if descending == forward else "gt"
+            equal = {n: v for (n, _), v in zip(self.keys[:position], key)}
+            condition |= Q(**equal, **{f"{name}__{lookup}": value})
+        bound = "lte" if first_descending == forward else "gte"
+        return Q(**{f"{first_name}__{bound}": first_value}) & condition
+
+    @staticmethod
+    def _link_params(params: Mapping[str, Any]) -> QueryDict:
+        query = QueryDict(mutable=True)
+        if isinstance(params, QueryDict):
+            query.update(params)
+        else:
+            for name, value in params.items():
+                query[name] = value
+        for name in (AFTER_PARAM, BEFORE_PARAM):
+            query.pop(name, None)
+        return query
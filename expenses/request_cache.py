@@ -0,0 +1,95 @@
+"""
+Request-scoped memoization.
+
+Values stored here live only for the duration of a single request handled
+by RequestCacheMiddleware, so facts like the most recent month of a budget
+are fetched at most once per request no matter how many model methods,
+forms and template rows ask for them. Outside of a request (management
+commands, shell, tests calling models directly) nothing is cached and every
+lookup goes straight to the database.
+"""
+
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from django.http import Http404
+
+_store: ContextVar[Optional[Dict[Hashable, Any]]] = ContextVar(
+    "request_cache", default=None
+)
+
+MOST_RECENT_MONTH = "most_recent_month"
+BUDGET = "budget"
+
+
+def activate() -> Token:
+    """Start a new, empty request cache. Returns token for deactivate()."""
+    return _store.set({})
+
+
+def deactivate(token: Token) -> None:
+    """Drop the request cache started by matching activate() call."""
+    _store.reset(token)
+
+
+def is_active() -> bool:
+    """Check if a request cache is currently active."""
+    return _store.get() is not None
+
+
+def get_or_set(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """
+    Get cached value for key, calling factory to produce it on first use.
+
+    Args:
+        key: Hashable cache key, usually a (namespace, id) tuple
+        factory: Callable producing the value when it is not cached yet
+
+    Returns:
+        Cached or freshly produced value. If no request cache is active,
+        factory is always called.
+    """
+    store = _store.get()
+    if store is None:
+        return factory()
+    if key not in store:
+        store[key] = factory()
+    return store[key]
+
+
+def invalidate(namespace: str) -> None:
+    """
+    Drop all cached values of given namespace.
+
+    Args:
+        namespace: Namespace key, or first element of (namespace, ...) tuple keys
+    """
+    store = _store.get()
+    if not store:
+        return
+    for key in list(store):
+        if key == namespace or (isinstance(key, tuple) and key[0] == namespace):
+            del store[key]
+
+
+def get_budget(budget_id) -> Optional[Any]:
+    """Get Budget by id once per request. Returns None if it does not exist."""
+    # Import here to avoid circular imports
+    from .models import Budget
+
+    def fetch():
+        return Budget.objects.filter(pk=budget_id).first()
+
+    try:
+        budget_id = int(budget_id)
+    except (TypeError, ValueError):
+        return None
+    return get_or_set((BUDGET, budget_id), fetch)
+
+
+def get_budget_or_404(budget_id) -> Any:
+    """Get Budget by id once per request, raising Http404 if it does not exist."""
+    budget = get_budget(budget_id)
+    if budget is None:
+        raise Http404("No Budget matches the given query.")
+    return budget
@@ -0,0 +1,185 @@
+"""
+Full-text search of expenses.
+
+On SQLite, expenses are indexed in an FTS5 table ranked with bm25();
+other databases fall back to icontains lookups.
+"""
+
+import re
+from typing import Iterable, List, Optional, Union
+
+from django.db import connection, transaction
+from django.db.models import Q
+
+from .models import Expense
+
+
+class ExpenseSearchService:
+    """
+    Service for full-text search of expenses across all budgets.
+
+    On SQLite, expenses are indexed in the expenses_expense_search FTS5
+    table (created by migration 0032). Expense, Payee and Payment models
+    keep it in sync through index_expenses() when saved or deleted; bulk
+    writes bypassing them must call it as well. Other databases fall back
+    to icontains lookups.
+    """
+
+    TABLE = "expenses_expense_search"
+    # bm25() weights of title, notes, payee and transaction_ids columns
+    RANK_WEIGHTS = (10.0, 2.0, 5.0, 5.0)
+    DEFAULT_LIMIT = 50
+    # Expenses indexed per statement, SQLite limits query parameters
+    BATCH_SIZE = 500
+
+    WORD_RE = re.compile(r"\w+")
+
+    _available: Optional[bool] = None
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Check whether the FTS5 search table can be used."""
+        if cls._available is None:
+            cls._available = (
+                connection.vendor == "sqlite"
+                and cls.TABLE in connection.introspection.table_names()
+            )
+        return cls._available
+
+    @classmethod
+    def build_match_query(cls, query: str) -> str:
+        """
+        Convert user input into FTS5 query matching all words by prefix.
+
+        Words are quoted, so FTS5 operators typed by users are searched for
+        as plain text.
+        """
+        return " ".join(f'"{word}"*' for word in cls.WORD_RE.findall(query.lower()))
+
+    @classmethod
+    def search(
+        cls, query: str, budget_id: Optional[int] = None, limit: int = DEFAULT_LIMIT
+    ) -> List[Expense]:
+        """
+        Find expenses by title, notes, payee name or payment transaction ID.
+
+        Every word of the query must match the start of a word in any of
+        those fields.
+
+        Args:
+            query: Words to search for
+            budget_id: Limit results to this budget
+            limit: Maximum number of expenses to return
+
+        Returns:
+            List[Expense]: Matching expenses (with budget and payee loaded),
+                best matches first, each with a search_rank attribute
+                (lower is better, None when falling back to lookups)
+        """
+        match = cls.build_match_query(query)
+        if not match:
+            return []
+        if not cls.is_available():
+            return cls._search_fallback(query, budget_id, limit)
+
+        weights = ", ".join(str(weight) for weight in cls.RANK_WEIGHTS)
+        sql = (
+            f"SELECT rowid, bm25({cls.TABLE}, {weights}) AS rank "
+            f"FROM {cls.TABLE} WHERE {cls.TABLE} MATCH %s"
+        )
+        params: List[Union[str, int]] = [match]
+        if budget_id is not None:
+            sql += " AND budget_id = %s"
+            params.append(budget_id)
+        sql += " ORDER BY rank LIMIT %s"
+        params.append(limit)
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            ranks = dict(cursor.fetchall())
+
+        expenses = Expense.objects.select_related("budget", "payee").in_bulk(ranks)
+        results = []
+        for expense_id, rank in ranks.items():
+            expense = expenses.get(expense_id)
+            if expense is not None:
+                expense.search_rank = rank
+                results.append(expense)
+        return results
+
+    @classmethod
+    def rebuild(cls) -> int:
+        """
+        Rebuild search table from scratch.
+
+        Returns:
+            int: Number of indexed expenses
+        """
+        if not cls.is_available():
+            return 0
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {cls.TABLE}")
+            cursor.execute(cls._index_sql("1 = 1"))
+            cursor.execute(f"INSERT INTO {cls.TABLE}({cls.TABLE}) VALUES ('optimize')")
+            cursor.execute(f"SELECT count(*) FROM {cls.TABLE}")
+            return int(cursor.fetchone()[0])
+
+    @classmethod
+    def index_expenses(cls, expense_ids: Iterable[int]) -> None:
+        """
+        Refresh search rows of given expenses from their current data.
+
+        Rows of expenses that no longer exist are dropped.
+        """
+        if not cls.is_available():
+            return
+
+        ids = sorted(set(expense_ids))
+        with connection.cursor() as cursor:
+            for start in range(0, len(ids), cls.BATCH_SIZE):
+                end = start + cls.BATCH_SIZE
+                batch = ids[start:end]
+                placeholders = ", ".join(["%s"] * len(batch))
+                cursor.execute(
+                    f"DELETE FROM {cls.TABLE} WHERE rowid IN ({placeholders})", batch
+                )
+                cursor.execute(cls._index_sql(f"e.id IN ({placeholders})"), batch)
+
+    @classmethod
+    def _index_sql(cls, where: str) -> str:
+        return f"""
+            INSERT INTO {cls.TABLE}
+                (rowid, title, notes, payee, transaction_ids, budget_id)
+            SELECT e.id, e.title, coalesce(e.notes, ''), coalesce(p.name, ''),
+                coalesce((
+                    SELECT group_concat(pm.transaction_id, ' ')
+                    FROM expenses_payment pm
+                    JOIN expenses_expenseitem i ON i.id = pm.expense_item_id
+                    WHERE i.expense_id = e.id AND pm.transaction_id IS NOT NULL
+                ), ''),
+                e.budget_id
+            FROM expenses_expense e
+            LEFT JOIN expenses_payee p ON p.id = e.payee_id
+            WHERE {where}
+            """
+
+    @classmethod
+    def _search_fallback(
+        cls, query: str, budget_id: Optional[int], limit: int
+    ) -> List[Expense]:
+        queryset = Expense.objects.select_related("budget", "payee")
+        if budget_id is not None:
+            queryset = queryset.filter(budget_id=budget_id)
+        for word in cls.WORD_RE.findall(query):
+            queryset = queryset.filter(
+                Q(title__icontains=word)
+                | Q(notes__icontains=word)
+                | Q(payee__name__icontains=word)
+                | Q(expenseitem__payment__transaction_id__icontains=word)
+            )
+
+        results = list(queryset.distinct().order_by("-start_date", "-pk")[:limit])
+        for expense in results:
+            expense.search_rank = None
+        return results
@@ -2,11 +2,34 @@ from django.utils import timezone
 from django.db import transaction
 from django.core.cache import cache
 from django.conf import settings
+from django.db.models import Count, F, Value
+from django.db.models.functions import Greatest
 from decimal import Decimal
 from datetime import date
-from typing import List, Optional, Union
-from babel.numbers import format_currency as babel_format_currency
-from .models import Expense, ExpenseItem, BudgetMonth, Settings, Budget
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from babel import Locale
+from functools import lru_cache
+from . import request_cache
+from .models import (
+    Expense,
+    ExpenseItem,
+    BudgetMonth,
+    BudgetMonthSummary,
+    Payee,
+    Settings,
+    Budget,
+)
+
+import calendar
+import threading
 
 
 def process_new_month(year: int, month: int, budget: Budget) -> BudgetMonth:
@@ -41,9 +64,7 @@ def process_new_month(year: int, month: int, budget: Budget) -> BudgetMonth:
             active_expenses = Expense.objects.filter(
                 closed_at__isnull=True, budget=budget
             )
-
-            for expense in active_expenses:
-                create_expense_items_for_month(expense, month_obj)
+            create_expense_items_for_month_batch(active_expenses, month_obj)
 
         return month_obj
 
@@ -60,72 +81,222 @@ def create_expense_items_for_month(
     - one_time: Create single item only in start month
     - recurring_with_end: Create one item per month until end date month
     """
-    items: List[ExpenseItem] = []
-    expense_start_date = expense.start_date
+    return create_expense_items_for_month_batch([expense], month)
 
-    # Check if the expense is relevant for this month
-    # For other expense types (not one-time), check start date
-    import calendar
 
-    last_day = calendar.monthrange(month.year, month.month)[1]
-    month_end_date = date(month.year, month.month, last_day)
+def create_expense_items_for_month_batch(
+    expenses: Iterable[Expense], month: BudgetMonth
+) -> List[ExpenseItem]:
+    """
+    Generate expense items for many expenses in given month at once.
 
-    if expense.expense_type != expense.TYPE_ONE_TIME:
-        # For other expense types, check if start date is after this month
-        if expense_start_date > month_end_date:
-            return items
+    Applies the same business rules as create_expense_items_for_month(), but
+    fetches existing item counts of all expenses with a single grouped query
+    and inserts all new items with a single bulk_create().
 
-    if expense.expense_type == expense.TYPE_ENDLESS_RECURRING:
-        # Create one item per month
-        due_date = expense.get_due_date_for_month(month.year, month.month)
+    Args:
+        expenses: Expenses to generate items for
+        month: The month to generate items in
 
-        item = ExpenseItem.objects.create(
-            expense=expense, month=month, due_date=due_date, amount=expense.amount
-        )
-        items.append(item)
+    Returns:
+        List[ExpenseItem]: Created expense items
+    """
+    expenses = list(expenses)
+    existing_counts = get_existing_item_counts(expenses)
+    items = build_expense_items_for_month(expenses, month, existing_counts)
+
+    if items:
+        items = ExpenseItem.objects.bulk_create(items)
+    # bulk_create() bypasses ExpenseItem.save(), so refresh the summary here
+    BudgetMonthSummary.refresh([month.pk])
+    return items
 
-    elif expense.expense_type == expense.TYPE_RECURRING_WITH_END:
-        # Create one item per month until end date month (inclusive)
-        if expense.end_date is not None:
-            target_date = date(month.year, month.month, 1)
-            end_month_date = date(expense.end_date.year, expense.end_date.month, 1)
-
-            if target_date <= end_month_date:
-                due_date = expense.get_due_date_for_month(month.year, month.month)
-
-                item = ExpenseItem.objects.create(
-                    expense=expense,
-                    month=month,
-                    due_date=due_date,
-                    amount=expense.amount,
+
+def process_months_until(budget: Budget, year: int, month: int) -> List[BudgetMonth]:
+    """
+    Create all missing months up to given month and generate their expense items.
+
+    Months are created sequentially after the most recent month of the budget
+    (or starting from the budget start date when no months exist yet). All
+    months and expense items are inserted in one transaction, with existing
+    item counts fetched once and tracked in memory between months.
+
+    Args:
+        budget: The budget to create months in
+        year: Target year (2020-2099)
+        month: Target month (1-12), inclusive
+
+    Returns:
+        List[BudgetMonth]: Created months in chronological order, empty when
+        the budget already reaches the target month
+
+    Raises:
+        ValueError: If invalid year/month
+    """
+    if not (2020 <= year <= 2099):
+        raise ValueError("Year must be between 2020 and 2099")
+
+    if not (1 <= month <= 12):
+        raise ValueError("Month must be between 1 and 12")
+
+    with transaction.atomic():
+        next_allowed = BudgetMonth.get_next_allowed_month(budget=budget)
+        if next_allowed:
+            current_year, current_month = next_allowed["year"], next_allowed["month"]
+        else:
+            current_year, current_month = (
+                budget.start_date.year,
+                budget.start_date.month,
+            )
+
+        new_months = []
+        while (current_year, current_month) <= (year, month):
+            new_months.append(
+                BudgetMonth(
+                    budget=budget,
+                    year=current_year,
+                    month=current_month,
+                    # bulk_create() bypasses BudgetMonth.save(), which sets it
+                    period=BudgetMonth.compute_period(current_year, current_month),
                 )
-                items.append(item)
+            )
+            if current_month == 12:
+                current_year, current_month = current_year + 1, 1
+            else:
+                current_month += 1
 
-    elif expense.expense_type == expense.TYPE_SPLIT_PAYMENT:
-        # Check how many items we've already created
-        existing_count = ExpenseItem.objects.filter(expense=expense).count()
-        remaining_installments = expense.total_parts - expense.skip_parts
+        if not new_months:
+            return []
 
-        if existing_count < remaining_installments:
-            due_date = expense.get_due_date_for_month(month.year, month.month)
+        months = BudgetMonth.objects.bulk_create(new_months)
+        # bulk_create() bypasses BudgetMonth.save(), so drop memoized lookups here
+        request_cache.invalidate(request_cache.MOST_RECENT_MONTH)
 
-            item = ExpenseItem.objects.create(
-                expense=expense, month=month, due_date=due_date, amount=expense.amount
+        active_expenses = list(
+            Expense.objects.filter(closed_at__isnull=True, budget=budget)
+        )
+        existing_counts = get_existing_item_counts(active_expenses)
+        items: List[ExpenseItem] = []
+        for month_obj in months:
+            # Counts are updated in place, so later months see earlier items
+            items.extend(
+                build_expense_items_for_month(
+                    active_expenses, month_obj, existing_counts
+                )
             )
+        ExpenseItem.objects.bulk_create(items, batch_size=500)
+        BudgetMonthSummary.refresh(month_obj.pk for month_obj in months)
+
+        return months
+
+
+def get_existing_item_counts(expenses: Iterable[Expense]) -> Dict[int, int]:
+    """
+    Count already created items of expenses whose item generation depends on it.
+
+    Only split payment and one-time expenses are counted, using one grouped query.
+
+    Returns:
+        Dict[int, int]: Expense id to number of existing expense items
+    """
+    counted_ids = [
+        expense.pk
+        for expense in expenses
+        if expense.expense_type in (Expense.TYPE_SPLIT_PAYMENT, Expense.TYPE_ONE_TIME)
+    ]
+    if not counted_ids:
+        return {}
+    return dict(
+        ExpenseItem.objects.filter(expense_id__in=counted_ids)
+        .order_by()
+        .values("expense_id")
+        .annotate(item_count=Count("id"))
+        .values_list("expense_id", "item_count")
+    )
+
+
+def build_expense_items_for_month(
+    expenses: Iterable[Expense], month: BudgetMonth, existing_counts: Dict[int, int]
+) -> List[ExpenseItem]:
+    """
+    Build (without saving) expense items due in given month.
+
+    Args:
+        expenses: Expenses to build items for
+        month: The month items would belong to
+        existing_counts: Expense id to number of existing items, updated in
+            place with the items built here
+
+    Returns:
+        List[ExpenseItem]: Unsaved expense items
+    """
+    items = []
+    for expense in expenses:
+        item = build_expense_item_for_month(
+            expense, month, existing_counts.get(expense.pk, 0)
+        )
+        if item is not None:
             items.append(item)
+            existing_counts[expense.pk] = existing_counts.get(expense.pk, 0) + 1
+    return items
+
+
+def build_expense_item_for_month(
+    expense: Expense, month: BudgetMonth, existing_count: int
+) -> Optional[ExpenseItem]:
+    """
+    Build (without saving) the expense item due for given expense and month.
+
+    Args:
+        expense: The expense to build item for
+        month: The month the item would belong to
+        existing_count: Number of items already created for this expense
+
+    Returns:
+        Optional[ExpenseItem]: Unsaved item, or None if nothing is due
+    """
+    last_day = calendar.monthrange(month.year, month.month)[1]
+    month_end_date = date(month.year, month.month, last_day)
+
+    # For other expense types (not one-time), check if start date is after this month
+    if expense.expense_type != expense.TYPE_ONE_TIME:
+        if expense.start_date > month_end_date:
+            return None
+
+    if expense.expense_type == expense.TYPE_RECURRING_WITH_END:
+        # Create one item per month until end date month (inclusive)
+        if expense.end_date is None:
+            return None
+        target_date = date(month.year, month.month, 1)
+        end_month_date = date(expense.end_date.year, expense.end_date.month, 1)
+        if target_date > end_month_date:
+            return None
+
+    elif expense.expense_type == expense.TYPE_SPLIT_PAYMENT:
+        # Create items until all remaining installments exist
+        remaining_installments = expense.total_parts - expense.skip_parts
+        if existing_count >= remaining_installments:
+            return None
 
     elif expense.expense_type == expense.TYPE_ONE_TIME:
         # For one-time expenses, create item if no items exist yet
         # The month being processed determines the due_date
-        if not ExpenseItem.objects.filter(expense=expense).exists():
-            due_date = expense.get_due_date_for_month(month.year, month.month)
+        if existing_count > 0:
+            return None
 
-            item = ExpenseItem.objects.create(
-                expense=expense, month=month, due_date=due_date, amount=expense.amount
-            )
-            items.append(item)
+    elif expense.expense_type != expense.TYPE_ENDLESS_RECURRING:
+        return None
+
+    return ExpenseItem(
+        expense=expense,
+        month=month,
+        due_date=expense.get_due_date_for_month(month.year, month.month),
+        amount=expense.amount,
+    )
 
-    return items
+
+# Expense types closed automatically once their items are paid
+COMPLETABLE_EXPENSE_TYPES = (Expense.TYPE_ONE_TIME, Expense.TYPE_SPLIT_PAYMENT)
 
 
 def check_expense_completion(expense: Expense) -> bool:
@@ -141,30 +312,88 @@ def check_expense_completion(expense: Expense) -> bool:
     if expense.closed_at:
         return True  # Already completed
 
+    if expense.expense_type not in COMPLETABLE_EXPENSE_TYPES:
+        # endless_recurring and recurring_with_end expenses are only manually completed
+        return False
+
+    paid_items = ExpenseItem.objects.filter(expense=expense).paid().count()
+    if is_expense_complete(expense, paid_items):
+        expense.closed_at = timezone.now()
+        expense.save()
+        return True
+
+    return False
+
+
+def check_expenses_completion(expenses: Iterable[Expense]) -> List[Expense]:
+    """
+    Batch variant of check_expense_completion() for many expenses at once.
+
+    Paid items of all given expenses are counted with a single aggregate
+    query and completed expenses are closed with a single update, which
+    makes it suitable for imports and bulk payments.
+
+    Args:
+        expenses: Expenses to check
+
+    Returns:
+        List[Expense]: Expenses closed by this call
+    """
+    candidates = [
+        expense
+        for expense in expenses
+        if not expense.closed_at and expense.expense_type in COMPLETABLE_EXPENSE_TYPES
+    ]
+    if not candidates:
+        return []
+
+    paid_counts = dict(
+        ExpenseItem.objects.filter(expense__in=candidates)
+        .paid()
+        .order_by()
+        .values("expense_id")
+        .annotate(paid_items=Count("id"))
+        .values_list("expense_id", "paid_items")
+    )
+    completed = [
+        expense
+        for expense in candidates
+        if is_expense_complete(expense, paid_counts.get(expense.pk, 0))
+    ]
+    if not completed:
+        return []
+
+    closed_at = timezone.now()
+    # update() bypasses Expense.save(), which only matters for cached state
+    # kept on the instances themselves, so mirror the change on them here
+    Expense.objects.filter(pk__in=[expense.pk for expense in completed]).update(
+        closed_at=closed_at, updated_at=closed_at
+    )
+    for expense in completed:
+        expense.closed_at = closed_at
+        expense.updated_at = closed_at
+        expense._edit_restrictions = None
+    DataVersionService.bump_budget(*(expense.budget_id for expense in completed))
+    return completed
+
+
+def is_expense_complete(expense: Expense, paid_items: int) -> bool:
+    """
+    Check if given number of fully paid items completes the expense.
+
+    Args:
+        expense: One-time or split payment expense
+        paid_items: Number of fully paid items of the expense
+
+    Returns:
+        bool: True if the expense should be closed
+    """
     if expense.expense_type == expense.TYPE_ONE_TIME:
         # Complete when the single item is paid (has Payment records totaling full amount)
-        expense_items = ExpenseItem.objects.filter(expense=expense)
-        paid_items = sum(
-            1 for item in expense_items if item.status == ExpenseItem.STATUS_PAID
-        )
-        if paid_items > 0:
-            expense.closed_at = timezone.now()
-            expense.save()
-            return True
-
-    elif expense.expense_type == expense.TYPE_SPLIT_PAYMENT:
+        return paid_items > 0
+    if expense.expense_type == expense.TYPE_SPLIT_PAYMENT:
         # Complete when all remaining installments are paid
-        expense_items = ExpenseItem.objects.filter(expense=expense)
-        paid_items = sum(
-            1 for item in expense_items if item.status == ExpenseItem.STATUS_PAID
-        )
-        remaining_installments = expense.total_parts - expense.skip_parts
-        if paid_items >= remaining_installments:
-            expense.closed_at = timezone.now()
-            expense.save()
-            return True
-
-    # endless_recurring and recurring_with_end expenses are only manually completed
+        return paid_items >= expense.total_parts - expense.skip_parts
     return False
 
 
@@ -177,9 +406,7 @@ def handle_new_expense(expense: Expense, budget: Budget) -> None:
         budget: The budget to use for finding the most recent month (should match expense.budget)
     """
     most_recent_month = (
-        BudgetMonth.objects.filter(budget=expense.budget)
-        .order_by("-year", "-month")
-        .first()
+        BudgetMonth.objects.filter(budget=expense.budget).order_by("-period").first()
     )
     if not most_recent_month:
         return  # No months exist yet in this budget
@@ -193,8 +420,6 @@ def handle_new_expense(expense: Expense, budget: Budget) -> None:
 
         current_month_start = date(most_recent_month.year, most_recent_month.month, 1)
 
-        import calendar
-
         last_day = calendar.monthrange(most_recent_month.year, most_recent_month.month)[
             1
         ]
@@ -207,15 +432,68 @@ def handle_new_expense(expense: Expense, budget: Budget) -> None:
             create_expense_items_for_month(expense, most_recent_month)
 
 
+class CurrencyFormatter:
+    """
+    Currency formatter compiled once for a (currency, locale, format_type) set.
+
+    Resolving the locale and parsing its currency pattern is the costly part
+    of babel's format_currency(), so it is done here once and the compiled
+    pattern is reused for every amount. Formatted values can additionally be
+    kept in a bounded LRU cache.
+    """
+
+    def __init__(
+        self, currency: str, locale: str, format_type: str, cache_size: int = 0
+    ) -> None:
+        self.currency = currency
+        self.locale_name = locale
+        self.format_type = format_type
+        try:
+            self.locale: Optional[Locale] = Locale.parse(locale)
+            self.pattern = self.locale.currency_formats[format_type]
+        except Exception:
+            # Unknown locale or format, use fallback formatting
+            self.locale = None
+            self.pattern = None
+
+        self._format_value: Callable[[Decimal, bool], str] = self._apply
+        if cache_size > 0:
+            self._format_value = lru_cache(maxsize=cache_size)(self._apply)
+
+    def format(self, amount: Decimal) -> str:
+        """Format Decimal amount."""
+        # Sign is part of the key as -0 and 0 are equal but formatted differently
+        return self._format_value(amount, amount.is_signed())
+
+    def _apply(self, amount: Decimal, is_signed: bool) -> str:
+        if self.pattern is not None:
+            try:
+                return self.pattern.apply(  # type: ignore[no-any-return]
+                    amount, self.locale, currency=self.currency
+                )
+            except Exception:
+                pass
+        # Fallback to basic formatting if babel fails
+        return f"{self.currency} {amount:.2f}"
+
+
 class SettingsService:
     """Service for managing application settings and currency formatting."""
 
     CACHE_KEY = "app_settings"
     CACHE_TIMEOUT = 3600  # 1 hour
 
+    # Compiled formatters, cached per process
+    _formatters: Dict[Tuple[str, str, str], CurrencyFormatter] = {}
+    _formatters_lock = threading.Lock()
+
     @classmethod
     def get_settings(cls) -> Settings:
-        """Get cached settings or load from database."""
+        """Get cached settings or load from database, once per request."""
+        return request_cache.get_or_set(cls.CACHE_KEY, cls._load_settings)
+
+    @classmethod
+    def _load_settings(cls) -> Settings:
         settings = cache.get(cls.CACHE_KEY)
         if settings is None:
             settings = Settings.load()
@@ -232,6 +510,36 @@ class SettingsService:
         """Get current locale."""
         return cls.get_settings().locale
 
+    @classmethod
+    def get_formatter(
+        cls, currency: str, locale: str, format_type: str
+    ) -> CurrencyFormatter:
+        """
+        Get compiled currency formatter, creating it on first use.
+
+        Args:
+            currency: ISO 4217 currency code
+            locale: Locale identifier
+            format_type: Babel currency format type ("standard" or "accounting")
+
+        Returns:
+            CurrencyFormatter: Formatter shared by all threads of the process
+        """
+        key = (currency, locale, format_type)
+        formatter = cls._formatters.get(key)
+        if formatter is None:
+            with cls._formatters_lock:
+                formatter = cls._formatters.get(key)
+                if formatter is None:
+                    formatter = CurrencyFormatter(
+                        currency,
+                        locale,
+                        format_type,
+                        cache_size=getattr(settings, "CURRENCY_FORMAT_CACHE_SIZE", 0),
+                    )
+                    cls._formatters[key] = formatter
+        return formatter
+
     @classmethod
     def format_currency(
         cls, amount: Optional[Union[Decimal, float, int]], include_symbol: bool = True
@@ -249,29 +557,147 @@ class SettingsService:
         if amount is None:
             return ""
 
-        settings = cls.get_settings()
+        app_settings = cls.get_settings()
 
         # Ensure amount is Decimal
         if not isinstance(amount, Decimal):
             amount = Decimal(str(amount))
 
-        # Format using babel
-        try:
-            formatted = babel_format_currency(
-                amount,
-                settings.currency,
-                locale=settings.locale,
-                format_type="standard" if include_symbol else "accounting",
-            )
-            return formatted
-        except Exception:
-            # Fallback to basic formatting if babel fails
-            return f"{settings.currency} {amount:.2f}"
+        formatter = cls.get_formatter(
+            app_settings.currency,
+            app_settings.locale,
+            "standard" if include_symbol else "accounting",
+        )
+        return formatter.format(amount)
 
     @classmethod
     def clear_cache(cls) -> None:
-        """Clear settings cache."""
+        """Clear settings cache and compiled formatters."""
         cache.delete(cls.CACHE_KEY)
+        request_cache.invalidate(cls.CACHE_KEY)
+        with cls._formatters_lock:
+            cls._formatters = {}
+
+
+class DataVersionService:
+    """
+    Service tracking data versions used for conditional GET responses.
+
+    Every budget has its own version that changes whenever its expenses,
+    expense items, payments, months or name change. A global version covers
+    data shown on pages of all budgets (payee and payment method names,
+    settings). The payee directory version covers the payee listing with
+    expense counts, which changes with expenses of any budget. Versions are
+    millisecond timestamps of the last change, so they can be used as
+    Last-Modified values as well.
+
+    Versions are stored in the version columns of Budget and Settings rows,
+    so all application processes and management commands see the same
+    versions, and bumps made in a transaction become visible together with
+    the data they cover.
+    """
+
+    @classmethod
+    def get_budget_version(cls, budget_id: int) -> int:
+        """Get current data version of given budget."""
+        version = (
+            Budget.objects.filter(pk=budget_id)
+            .values_list("data_version", flat=True)
+            .first()
+        )
+        return version or 0
+
+    @classmethod
+    def get_global_version(cls) -> int:
+        """Get current version of data shared by all pages."""
+        return cls._get_settings_version("data_version")
+
+    @classmethod
+    def get_payee_directory_version(cls) -> int:
+        """Get current version of the payee directory."""
+        return cls._get_settings_version("payee_directory_version")
+
+    @classmethod
+    def bump_budget(cls, *budget_ids: Optional[int]) -> None:
+        """Mark data of given budgets as changed."""
+        ids = {budget_id for budget_id in budget_ids if budget_id is not None}
+        if ids:
+            Budget.objects.filter(pk__in=ids).update(data_version=cls._next_version())
+
+    @classmethod
+    def bump_global(cls) -> None:
+        """Mark data shared by all pages as changed."""
+        cls._bump_settings_version("data_version")
+
+    @classmethod
+    def bump_payee_directory(cls) -> None:
+        """Mark payees or their expense counts as changed."""
+        cls._bump_settings_version("payee_directory_version")
+
+    @staticmethod
+    def _get_settings_version(field: str) -> int:
+        version = (
+            Settings.objects.filter(pk=Settings.SINGLETON_PK)
+            .values_list(field, flat=True)
+            .first()
+        )
+        return version or 0
+
+    @classmethod
+    def _bump_settings_version(cls, field: str) -> None:
+        updated = Settings.objects.filter(pk=Settings.SINGLETON_PK).update(
+            **{field: cls._next_version(field)}
+        )
+        if not updated:
+            # Saving the new settings row bumps its versions
+            Settings.load()
+
+    @staticmethod
+    def _next_version(field: str = "data_version") -> Greatest:
+        # Time based, so versions never repeat, even if a row is saved
+        # with a version read before later bumps
+        now = int(timezone.now().timestamp() * 1000)
+        return Greatest(F(field) + 1, Value(now))
+
+
+class PayeeDirectoryService:
+    """
+    Service providing cached payee listings shared by payee list and dropdowns.
+
+    Cached entries are keyed by the payee directory version of
+    DataVersionService, which payee and expense changes bump, so stale
+    entries are never read.
+    """
+
+    CACHE_KEY = "payee_directory"
+    CACHE_TIMEOUT = 3600  # 1 hour
+
+    @classmethod
+    def get_payees(cls, include_hidden: bool = False) -> List[Payee]:
+        """
+        Get payees annotated with expense_count, ordered by name.
+
+        Args:
+            include_hidden: Whether to include hidden payees
+
+        Returns:
+            List[Payee]: Cached payee instances
+        """
+        version = DataVersionService.get_payee_directory_version()
+        key = f"{cls.CACHE_KEY}:{version}:{int(include_hidden)}"
+        payees = cache.get(key)
+        if payees is None:
+            queryset = Payee.objects.with_expense_counts()
+            if not include_hidden:
+                queryset = queryset.filter(hidden_at__isnull=True)
+            payees = list(queryset.order_by("name"))
+            cache.set(key, payees, cls.CACHE_TIMEOUT)
+        return payees  # type: ignore[no-any-return]
+
+    @classmethod
+    def get_choices(cls) -> List[Tuple[int, str]]:
+        """Get (id, name) choices of visible payees for dropdowns."""
+        return [(payee.pk, payee.name) for payee in cls.get_payees()]
 
 
 class VersionService:
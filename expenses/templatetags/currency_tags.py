@@ -7,6 +7,7 @@ into a single library that can be loaded with {% load currency_tags %}.
 from django import template
 from decimal import InvalidOperation
 from django.utils.safestring import mark_safe
+from ..models import ExpenseItem
 from ..services import SettingsService
 
 # Import all individual tag modules
@@ -36,12 +37,15 @@ def paid_amount_display(expense_item):
 
     For pending items: shows remaining amount
     For paid items: shows full due amount with strikethrough
+
+    Items fetched with ExpenseItem.objects.with_payment_totals() are
+    rendered from their annotations without additional queries.
     """
     if not expense_item:
         return ""
 
     try:
-        if expense_item.status == "paid":
+        if expense_item.status == ExpenseItem.STATUS_PAID:
             # For paid items, show the full due amount with strikethrough
             amount = expense_item.amount
             formatted_currency = SettingsService.format_currency(amount)
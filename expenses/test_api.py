@@ -0,0 +1,226 @@
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import patch
+import json
+from .models import (
+    Budget,
+    BudgetMonth,
+    Expense,
+    ExpenseItem,
+    Payee,
+    Payment,
+    PaymentMethod,
+)
+from .api import BudgetApiService
+
+
+class BudgetApiTest(TestCase):
+    """Test read-only JSON API of a budget."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget",
+            start_date=date(2024, 1, 1),
+            initial_amount=Decimal("1000.00"),
+        )
+        self.january = BudgetMonth.objects.create(
+            budget=self.budget, year=2024, month=1
+        )
+        self.february = BudgetMonth.objects.create(
+            budget=self.budget, year=2024, month=2
+        )
+        self.expense = Expense.objects.create(
+            budget=self.budget,
+            title="Rent",
+            payee=Payee.objects.create(name="Landlord"),
+            expense_type=Expense.TYPE_ENDLESS_RECURRING,
+            amount=Decimal("100.35"),
+            start_date=date(2024, 1, 1),
+            day_of_month=10,
+        )
+        self.old_item = ExpenseItem.objects.create(
+            expense=self.expense,
+            month=self.january,
+            due_date=date(2024, 1, 10),
+            amount=Decimal("100.35"),
+        )
+        self.item = ExpenseItem.objects.create(
+            expense=self.expense,
+            month=self.february,
+            due_date=date(2024, 2, 10),
+            amount=Decimal("100.35"),
+        )
+        self.payment = Payment.objects.create(
+            expense_item=self.item,
+            amount=Decimal("100.35"),
+            payment_date=timezone.make_aware(datetime(2024, 2, 9, 12, 30)),
+            payment_method=PaymentMethod.objects.create(name="Card"),
+            transaction_id="TX-1",
+        )
+        Payment.objects.create(
+            expense_item=self.old_item,
+            amount=Decimal("40.00"),
+            payment_date=timezone.make_aware(datetime(2024, 1, 9, 12, 30)),
+        )
+
+    def get(self, name, **params):
+        response = self.client.get(reverse(name, args=[self.budget.pk]), params)
+        self.assertEqual(response["Content-Type"], "application/json")
+        return response, json.loads(response.content)
+
+    def test_summary(self):
+        """Test summary of balance, most recent month and overdue items"""
+        response, data = self.get("api_summary")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data["budget"]["name"], "Test Budget")
+        self.assertEqual(data["budget"]["initial_amount"], "1000.00")
+        self.assertEqual(data["budget"]["committed_total"], "200.70")
+        self.assertEqual(data["budget"]["current_balance"], "799.30")
+        self.assertEqual(data["month"]["period"], 202402)
+        self.assertEqual(data["month"]["paid_amount"], "100.35")
+        self.assertEqual(data["month"]["pending_count"], 0)
+        self.assertEqual(data["overdue"], {"count": 1, "amount": "60.35"})
+
+    def test_summary_without_months(self):
+        """Test summary of a budget without months"""
+        budget = Budget.objects.create(name="Empty", start_date=date(2024, 1, 1))
+
+        data = json.loads(
+            self.client.get(reverse("api_summary", args=[budget.pk])).content
+        )
+
+        self.assertIsNone(data["month"])
+        self.assertEqual(data["overdue"], {"count": 0, "amount": "0.00"})
+
+    def test_months(self):
+        """Test that months are listed newest first with totals"""
+        BudgetMonth.objects.create(budget=self.budget, year=2024, month=3)
+
+        _response, data = self.get("api_months")
+
+        self.assertEqual(
+            [m["period"] for m in data["results"]], [202403, 202402, 202401]
+        )
+        self.assertEqual(data["results"][0]["total_amount"], "0.00")
+        self.assertEqual(data["results"][2]["pending_amount"], "60.35")
+        self.assertIsNone(data["next"])
+
+    def test_items(self):
+        """Test that items carry precomputed paid, remaining and status"""
+        _response, data = self.get("api_items")
+
+        self.assertEqual(
+            data["results"],
+            [
+                {
+                    "id": self.old_item.pk,
+                    "expense_id": self.expense.pk,
+                    "due_date": "2024-01-10",
+                    "amount": "100.35",
+                    "payment_count": 1,
+                    "title": "Rent",
+                    "payee": "Landlord",
+                    "period": 202401,
+                    "paid": "40.00",
+                    "remaining": "-60.35",
+                    "status": "pending",
+                },
+                {
+                    "id": self.item.pk,
+                    "expense_id": self.expense.pk,
+                    "due_date": "2024-02-10",
+                    "amount": "100.35",
+                    "payment_count": 1,
+                    "title": "Rent",
+                    "payee": "Landlord",
+                    "period": 202402,
+                    "paid": "100.35",
+                    "remaining": "0.00",
+                    "status": "paid",
+                },
+            ],
+        )
+
+    def test_items_filters(self):
+        """Test month and status filters of items"""
+        _response, data = self.get("api_items", month="2024-02")
+        self.assertEqual([item["id"] for item in data["results"]], [self.item.pk])
+
+        _response, data = self.get("api_items", status="pending")
+        self.assertEqual([item["id"] for item in data["results"]], [self.old_item.pk])
+
+        for params in ({"month": "02/2024"}, {"status": "late"}):
+            response, data = self.get("api_items", **params)
+            self.assertEqual(response.status_code, 400)
+            self.assertIn("error", data)
+
+    def test_items_paginated(self):
+        """Test that next and previous links walk through keyset pages"""
+        response, first = self.get("api_items", limit=1)
+
+        self.assertIsNone(first["previous"])
+        self.assertTrue(first["next"].startswith(response.wsgi_request.path))
+        self.assertIn("limit=1", first["next"])
+
+        second = json.loads(self.client.get(first["next"]).content)
+        self.assertEqual([item["id"] for item in second["results"]], [self.item.pk])
+        self.assertIsNone(second["next"])
+
+        back = json.loads(self.client.get(second["previous"]).content)
+        self.assertEqual(back["results"], first["results"])
+
+    def test_payments(self):
+        """Test that payments are listed in recorded order"""
+        _response, data = self.get("api_payments")
+
+        payment = data["results"][0]
+        self.assertEqual(len(data["results"]), 2)
+        self.assertEqual(payment["id"], self.payment.pk)
+        self.assertEqual(payment["amount"], "100.35")
+        self.assertEqual(payment["method"], "Card")
+        self.assertEqual(payment["transaction_id"], "TX-1")
+        self.assertEqual(payment["period"], 202402)
+        self.assertTrue(payment["payment_date"].startswith("2024-02-09T"))
+
+    def test_scoped_to_budget(self):
+        """Test that other budgets' rows are not listed and unknown budgets 404"""
+        other = Budget.objects.create(name="Other", start_date=date(2024, 1, 1))
+
+        for name in ("api_months", "api_items", "api_payments"):
+            data = json.loads(self.client.get(reverse(name, args=[other.pk])).content)
+            self.assertEqual(data["results"], [])
+        response = self.client.get(reverse("api_items", args=[9999]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_conditional_get(self):
+        """Test that unchanged responses are answered with 304"""
+        response, _data = self.get("api_items")
+
+        response = self.client.get(
+            reverse("api_items", args=[self.budget.pk]),
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_limit_clamped(self):
+        """Test that page size falls back to defaults and is capped"""
+        with patch.object(BudgetApiService, "MAX_LIMIT", 5):
+            self.assertEqual(BudgetApiService.get_limit({"limit": "50"}), 5)
+        self.assertEqual(BudgetApiService.get_limit({"limit": "0"}), 1)
+        self.assertEqual(
+            BudgetApiService.get_limit({"limit": "x"}), BudgetApiService.DEFAULT_LIMIT
+        )
+
+    def test_dumps_amounts_as_strings(self):
+        """Test that decimals keep exact cents and other types are rejected"""
+        self.assertEqual(
+            BudgetApiService.dumps({"a": Decimal("0.10"), "d": date(2024, 1, 2)}),
+            b'{"a":"0.10","d":"2024-01-02"}',
+        )
+        with self.assertRaises(TypeError):
+            BudgetApiService.dumps({"a": object()})
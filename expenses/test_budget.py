@@ -1,5 +1,7 @@
 from django.test import TestCase
-from django.db import IntegrityError
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 from django.utils import timezone
 from decimal import Decimal
 from datetime import date
@@ -662,3 +664,65 @@ class BudgetListViewTest(TestCase):
         self.assertIn("amount-negative", rendered)
         # Should not have positive styling for negative balance
         self.assertNotIn("amount-positive", rendered)
+
+    def _create_budget_with_expense(self, name, amount):
+        budget = Budget.objects.create(
+            name=name, start_date=date(2024, 1, 1), initial_amount=Decimal("500.00")
+        )
+        month = BudgetMonth.objects.create(year=2024, month=1, budget=budget)
+        expense = Expense.objects.create(
+            title=f"{name} expense",
+            amount=amount,
+            expense_type="one_time",
+            start_date=date(2024, 1, 15),
+            day_of_month=15,
+            budget=budget,
+        )
+        create_paid_expense_item(
+            expense=expense, month=month, due_date=date(2024, 1, 15), amount=amount
+        )
+        return budget
+
+    def test_with_balances_matches_get_current_balance(self):
+        """Test that annotated balances match per-budget calculation."""
+        self._create_budget_with_expense("Second", Decimal("120.00"))
+        self._create_budget_with_expense("Third", Decimal("650.00"))
+
+        expected = {
+            budget.pk: budget.get_current_balance() for budget in Budget.objects.all()
+        }
+        for from_summaries in (False, True):
+            with self.assertNumQueries(1):
+                budgets = list(Budget.objects.with_balances(from_summaries))
+            self.assertEqual(
+                {budget.pk: budget.get_current_balance() for budget in budgets},
+                expected,
+            )
+        self.assertEqual(
+            sorted(expected.values()),
+            [Decimal("-150.00"), Decimal("380.00"), Decimal("1000.00")],
+        )
+
+    def test_with_balances_annotates_can_be_deleted(self):
+        """Test that month presence is annotated for can_be_deleted()."""
+        self._create_budget_with_expense("With months", Decimal("10.00"))
+
+        budgets = {budget.name: budget for budget in Budget.objects.with_balances()}
+
+        with self.assertNumQueries(0):
+            self.assertTrue(budgets["Test Budget"].can_be_deleted())
+            self.assertFalse(budgets["With months"].can_be_deleted())
+
+    def test_budget_list_query_count_does_not_grow_with_budgets(self):
+        """Test that budget list costs the same queries for any budget count."""
+        url = reverse("budget_list")
+        self.client.get(url)  # Warm up settings cache
+        with CaptureQueriesContext(connection) as few_budgets:
+            self.client.get(url)
+
+        for index in range(5):
+            self._create_budget_with_expense(f"Budget {index}", Decimal("10.00"))
+
+        with self.assertNumQueries(len(few_budgets.captured_queries)):
+            response = self.client.get(url)
+        self.assertContains(response, "$490.00", count=5)
@@ -0,0 +1,182 @@
+from django.test import TestCase
+from django.contrib.messages import constants, get_messages
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.urls import reverse
+from django.utils import timezone
+from datetime import date
+from decimal import Decimal
+from .models import Budget, BudgetMonth, Expense, ExpenseItem, Payee, Payment
+from .services import DataVersionService, process_months_until
+
+
+class ConditionalGetTest(TestCase):
+    """Test 304 responses of budget-scoped pages driven by data versions."""
+
+    def setUp(self):
+        """Set up test data"""
+        cache.clear()
+        self.budget = Budget.objects.create(
+            name="Test Budget",
+            start_date=date(2024, 1, 1),
+            initial_amount=Decimal("1000.00"),
+        )
+        self.other_budget = Budget.objects.create(
+            name="Other Budget", start_date=date(2024, 1, 1)
+        )
+        self.month = BudgetMonth.objects.create(budget=self.budget, year=2024, month=1)
+        self.expense = Expense.objects.create(
+            budget=self.budget,
+            title="Rent",
+            expense_type=Expense.TYPE_ENDLESS_RECURRING,
+            amount=Decimal("100.00"),
+            start_date=date(2024, 1, 1),
+            day_of_month=10,
+        )
+        self.item = ExpenseItem.objects.create(
+            expense=self.expense,
+            month=self.month,
+            due_date=date(2024, 1, 10),
+            amount=Decimal("100.00"),
+        )
+        self.urls = [
+            reverse("dashboard", args=[self.budget.id]),
+            reverse("expense_list", args=[self.budget.id]),
+            reverse("month_list", args=[self.budget.id]),
+            reverse("month_detail", args=[self.budget.id, 2024, 1]),
+        ]
+        self.url = self.urls[0]
+
+    def _etag(self, url=None):
+        return self.client.get(url or self.url)["ETag"]
+
+    def _assert_not_modified(self, etag, url=None):
+        response = self.client.get(url or self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def _assert_modified(self, etag, url=None):
+        response = self.client.get(url or self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_pages_send_validators(self):
+        """Test that budget pages send ETag, Last-Modified and no-cache"""
+        for url in self.urls:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.has_header("ETag"))
+            self.assertTrue(response.has_header("Last-Modified"))
+            self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_unchanged_pages_answered_from_versions(self):
+        """Test that unchanged pages are answered with 304 from versions only"""
+        for url in self.urls:
+            etag = self._etag(url)
+            # Budget and settings version lookups
+            with self.assertNumQueries(2):
+                self._assert_not_modified(etag, url)
+
+    def test_if_modified_since(self):
+        """Test that Last-Modified is honoured as well"""
+        last_modified = self.client.get(self.url)["Last-Modified"]
+
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_payment_changes_version(self):
+        """Test that recording a payment invalidates pages of its budget"""
+        etag = self._etag()
+
+        Payment.objects.create(
+            expense_item=self.item, amount=Decimal("50.00"), payment_date=timezone.now()
+        )
+
+        self._assert_modified(etag)
+
+    def test_expense_changes_version(self):
+        """Test that editing an expense invalidates pages of its budget"""
+        etag = self._etag(self.urls[1])
+
+        self.expense.title = "New rent"
+        self.expense.save()
+
+        self._assert_modified(etag, self.urls[1])
+
+    def test_month_processing_changes_version(self):
+        """Test that creating months in bulk invalidates pages of the budget"""
+        etag = self._etag(self.urls[2])
+
+        process_months_until(self.budget, 2024, 3)
+
+        self._assert_modified(etag, self.urls[2])
+
+    def test_other_budget_changes_keep_version(self):
+        """Test that changes of another budget do not invalidate pages"""
+        other_expense = Expense.objects.create(
+            budget=self.other_budget,
+            title="Groceries",
+            payee=Payee.objects.create(name="Market"),
+            expense_type=Expense.TYPE_ONE_TIME,
+            amount=Decimal("20.00"),
+            start_date=date(2024, 1, 1),
+            day_of_month=5,
+        )
+        etag = self._etag()
+
+        BudgetMonth.objects.create(budget=self.other_budget, year=2024, month=1)
+        self.other_budget.name = "Renamed Budget"
+        self.other_budget.save()
+        other_expense.title = "Food"
+        other_expense.save()
+
+        self._assert_not_modified(etag)
+
+    def test_shared_data_changes_version(self):
+        """Test that payee changes invalidate pages of all budgets"""
+        etag = self._etag()
+
+        Payee.objects.create(name="Landlord")
+
+        self._assert_modified(etag)
+
+    def test_versions_do_not_depend_on_cache(self):
+        """Test that versions are shared through the database, not the cache"""
+        etag = self._etag()
+        cache.clear()
+
+        self._assert_not_modified(etag)
+
+        # Changes made by another process reach pages through the database
+        version = DataVersionService.get_budget_version(self.budget.pk)
+        Budget.objects.filter(pk=self.budget.pk).update(data_version=version + 1)
+        self._assert_modified(etag)
+
+    def test_bump_is_monotonic(self):
+        """Test that each bump yields a new version"""
+        versions = set()
+        for _ in range(5):
+            DataVersionService.bump_budget(self.budget.pk)
+            versions.add(DataVersionService.get_budget_version(self.budget.pk))
+
+        self.assertEqual(len(versions), 5)
+
+    def test_pending_messages_disable_conditional_response(self):
+        """Test that pages with pending flash messages are always rendered"""
+        etag = self._etag()
+        request = HttpRequest()
+        storage = CookieStorage(request)
+        storage.add(constants.SUCCESS, "Payment recorded")
+        response = self.client.get(self.url)
+        storage.update(response)
+        self.client.cookies[storage.cookie_name] = response.cookies[
+            storage.cookie_name
+        ].value
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            ["Payment recorded"],
+        )
@@ -0,0 +1,363 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.test import TestCase
+from django.urls import reverse
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import patch
+import os
+import tempfile
+from .models import (
+    Budget,
+    BudgetMonth,
+    BudgetMonthSummary,
+    Expense,
+    ExpenseItem,
+    Payee,
+    Payment,
+    PaymentMethod,
+)
+from .csv_import import CsvExpenseImporter
+from .search import ExpenseSearchService
+
+HEADER = "title,payee,amount,due_date,payment_date,paid_amount,payment_method,transaction_id,notes\n"
+
+
+class CsvExpenseImporterTest(TestCase):
+    """Test bulk import of expenses and payments from CSV files."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget", start_date=date(2024, 1, 1)
+        )
+        self.january = BudgetMonth.objects.create(
+            budget=self.budget, year=2024, month=1
+        )
+        self.february = BudgetMonth.objects.create(
+            budget=self.budget, year=2024, month=2
+        )
+        self.landlord = Payee.objects.create(name="Landlord")
+
+    def run_import(self, rows, **kwargs):
+        return CsvExpenseImporter(self.budget).run(StringIO(HEADER + rows), **kwargs)
+
+    def test_import_rows(self):
+        """Test that rows become one-time expenses, items and payments"""
+        result = self.run_import(
+            "Rent,landlord,1000.00,2024-01-10,2024-01-09,,Bank Transfer,TX-1,\n"
+            "Phone,Telco,49.99,2024-02-05,2024-02-06 18:30,20,,,Half paid\n"
+            "Gift,,25,2024-02-14,,,,,\n"
+        )
+
+        self.assertEqual(result.rows, 3)
+        self.assertEqual(result.expenses, 3)
+        self.assertEqual(result.payments, 2)
+        self.assertEqual(result.payees, 1)
+        self.assertEqual(result.payment_methods, 1)
+        self.assertEqual(result.error_count, 0)
+
+        rent = Expense.objects.get(title="Rent")
+        self.assertEqual(rent.payee, self.landlord)
+        self.assertEqual(rent.expense_type, Expense.TYPE_ONE_TIME)
+        self.assertEqual(rent.day_of_month, 10)
+        self.assertIsNotNone(rent.closed_at)
+        item = ExpenseItem.objects.get(expense=rent)
+        self.assertEqual(item.month, self.january)
+        self.assertEqual(item.paid_total, Decimal("1000.00"))
+        self.assertEqual(item.payment_count, 1)
+        payment = Payment.objects.get(expense_item=item)
+        self.assertEqual(payment.payment_method.name, "Bank Transfer")
+        self.assertEqual(payment.transaction_id, "TX-1")
+
+        phone = Expense.objects.get(title="Phone")
+        self.assertEqual(phone.payee.name, "Telco")
+        self.assertEqual(phone.notes, "Half paid")
+        self.assertIsNone(phone.closed_at)
+        phone_item = ExpenseItem.objects.get(expense=phone)
+        self.assertEqual(phone_item.get_remaining_amount(), Decimal("-29.99"))
+        self.assertEqual(phone_item.payment_set.get().payment_date.hour, 18)
+
+        gift = ExpenseItem.objects.get(expense__title="Gift")
+        self.assertEqual(gift.status, ExpenseItem.STATUS_PENDING)
+        self.assertIsNone(gift.expense.payee)
+
+    def test_month_summaries_refreshed(self):
+        """Test that month summaries include imported items"""
+        self.run_import(
+            "Rent,,1000.00,2024-01-10,2024-01-09,,,,\n" "Phone,,49.99,2024-01-05,,,,,\n"
+        )
+
+        summary = BudgetMonthSummary.objects.get(month=self.january)
+        self.assertEqual(summary.total_amount, Decimal("1049.99"))
+        self.assertEqual(summary.paid_amount, Decimal("1000.00"))
+        self.assertEqual(summary.pending_count, 1)
+
+    def test_amounts_parsed_like_forms(self):
+        """Test that amounts follow SanitizedDecimalField rules"""
+        self.run_import(
+            'A,,"1 234,56",2024-01-01,,,,,\n'
+            "B,,$10.50,2024-01-01,,,,,\n"
+            'C,,"12,5",2024-01-01,,,,,\n'
+            "D,,7,2024-01-01,,,,,\n"
+        )
+
+        self.assertEqual(
+            dict(Expense.objects.values_list("title", "amount")),
+            {
+                "A": Decimal("1234.56"),
+                "B": Decimal("10.50"),
+                "C": Decimal("12.50"),
+                "D": Decimal("7.00"),
+            },
+        )
+
+    def test_invalid_rows_reported_and_skipped(self):
+        """Test that invalid rows are reported by line and do not stop the import"""
+        result = self.run_import(
+            ",,10,2024-01-01,,,,,\n"
+            "Bad amount,,ten,2024-01-01,,,,,\n"
+            "Zero,,0.00,2024-01-01,,,,,\n"
+            "Bad date,,10,01/02/2024,,,,,\n"
+            "No month,,10,2023-12-01,,,,,\n"
+            "Overpaid,,10,2024-01-01,2024-01-01,11,,,\n"
+            "No date,,10,2024-01-01,,5,,,\n"
+            "Valid,,10,2024-01-01,,,,,\n"
+        )
+
+        self.assertEqual(result.rows, 8)
+        self.assertEqual(result.expenses, 1)
+        self.assertEqual(result.error_count, 7)
+        self.assertEqual([error.line for error in result.errors], list(range(2, 9)))
+        messages = [error.message for error in result.errors]
+        self.assertIn("Title is required.", messages[0])
+        self.assertIn("Invalid amount", messages[1])
+        self.assertIn("Invalid amount", messages[2])
+        self.assertIn("Invalid due_date", messages[3])
+        self.assertIn("no month 2023-12", messages[4])
+        self.assertIn("exceeds", messages[5])
+        self.assertIn("requires a payment date", messages[6])
+        self.assertEqual(
+            list(Expense.objects.values_list("title", flat=True)), ["Valid"]
+        )
+
+    def test_missing_columns_rejected(self):
+        """Test that files without required columns are rejected"""
+        with self.assertRaisesMessage(ValueError, "amount, due_date"):
+            CsvExpenseImporter(self.budget).run(StringIO("Title,Payee\nRent,X\n"))
+
+    def test_header_is_case_insensitive(self):
+        """Test that header names are matched case-insensitively"""
+        result = CsvExpenseImporter(self.budget).run(
+            StringIO(" Title ,AMOUNT,Due_Date\nRent,10,2024-01-01\n")
+        )
+
+        self.assertEqual(result.expenses, 1)
+
+    def test_dry_run_saves_nothing(self):
+        """Test that dry run reports results without keeping any rows"""
+        result = self.run_import(
+            "Rent,New Payee,10,2024-01-01,2024-01-01,,Cash,,\n", dry_run=True
+        )
+
+        self.assertTrue(result.dry_run)
+        self.assertEqual(result.expenses, 1)
+        self.assertFalse(Expense.objects.exists())
+        self.assertFalse(Payment.objects.exists())
+        self.assertFalse(Payee.objects.filter(name="New Payee").exists())
+        self.assertFalse(PaymentMethod.objects.exists())
+
+    def test_rows_written_in_chunks(self):
+        """Test that rows are written chunk by chunk"""
+        rows = "".join(
+            f"Item {i},Payee {i % 2},10,2024-01-0{i},2024-01-0{i},,,TX-{i},\n"
+            for i in range(1, 6)
+        )
+        with patch.object(CsvExpenseImporter, "CHUNK_SIZE", 2):
+            with patch.object(
+                CsvExpenseImporter,
+                "_write_chunk",
+                autospec=True,
+                side_effect=CsvExpenseImporter._write_chunk,
+            ) as write_chunk:
+                result = self.run_import(rows)
+
+        self.assertEqual(write_chunk.call_count, 3)
+        self.assertEqual(result.expenses, 5)
+        self.assertEqual(result.payees, 2)
+        self.assertEqual(Payee.objects.filter(name__startswith="Payee").count(), 2)
+        transaction_ids = {
+            payment.expense_item.expense.title: payment.transaction_id
+            for payment in Payment.objects.select_related("expense_item__expense")
+        }
+        self.assertEqual(transaction_ids["Item 4"], "TX-4")
+
+    def test_failed_chunk_rolled_back(self):
+        """Test that a failing chunk is reported without losing other chunks"""
+        original = CsvExpenseImporter._insert_rows
+        calls = []
+
+        def insert_rows(importer, chunk):
+            calls.append(chunk)
+            if len(calls) == 1:
+                raise DatabaseError("disk full")
+            return original(importer, chunk)
+
+        rows = "A,Shared,10,2024-01-01,,,,,\n" "B,Shared,10,2024-01-02,,,,,\n"
+        with patch.object(CsvExpenseImporter, "CHUNK_SIZE", 1):
+            with patch.object(
+                CsvExpenseImporter,
+                "_insert_rows",
+                autospec=True,
+                side_effect=insert_rows,
+            ):
+                result = self.run_import(rows)
+
+        self.assertEqual(result.expenses, 1)
+        self.assertEqual(result.error_count, 1)
+        self.assertEqual(result.errors[0].line, 2)
+        self.assertIn("disk full", result.errors[0].message)
+        # Payee rolled back with the first chunk is created again for the second
+        self.assertEqual(Expense.objects.get().payee.name, "Shared")
+
+    def test_failed_chunk_retried_row_by_row(self):
+        """Test that only rows failing on their own are reported"""
+        original = CsvExpenseImporter._insert_rows
+
+        def insert_rows(importer, chunk):
+            if any(row.title == "Bad" for row in chunk):
+                raise DatabaseError("constraint failed")
+            return original(importer, chunk)
+
+        rows = (
+            "A,Shared,10,2024-01-01,,,,,\n"
+            "Bad,Other,10,2024-01-02,,,,,\n"
+            "C,Shared,10,2024-01-03,,,,,\n"
+        )
+        with patch.object(
+            CsvExpenseImporter, "_insert_rows", autospec=True, side_effect=insert_rows
+        ):
+            result = self.run_import(rows)
+
+        self.assertEqual(result.expenses, 2)
+        self.assertEqual(result.error_count, 1)
+        self.assertEqual(result.errors[0].line, 3)
+        self.assertIn("constraint failed", result.errors[0].message)
+        self.assertEqual(
+            sorted(Expense.objects.values_list("title", "payee__name")),
+            [("A", "Shared"), ("C", "Shared")],
+        )
+        # The payee of the failed row is rolled back with it
+        self.assertEqual(result.payees, 1)
+        self.assertFalse(Payee.objects.filter(name="Other").exists())
+
+    def test_imported_expenses_searchable(self):
+        """Test that imported expenses are indexed once for the whole file"""
+        if not ExpenseSearchService.is_available():
+            self.skipTest("Full-text search requires SQLite FTS5")
+
+        rows = (
+            "Rent,Landlord,10,2024-01-01,2024-01-01,,,TX-99,\n"
+            "Phone,,10,2024-01-02,,,,,\n"
+        )
+        with patch.object(CsvExpenseImporter, "CHUNK_SIZE", 1):
+            with patch.object(
+                ExpenseSearchService,
+                "index_expenses",
+                wraps=ExpenseSearchService.index_expenses,
+            ) as index_expenses:
+                self.run_import(rows)
+
+        self.assertEqual(index_expenses.call_count, 1)
+        self.assertEqual(
+            [expense.title for expense in ExpenseSearchService.search("TX-99")],
+            ["Rent"],
+        )
+        self.assertEqual(
+            [expense.title for expense in ExpenseSearchService.search("phone")],
+            ["Phone"],
+        )
+
+
+class CsvImportViewTest(TestCase):
+    """Test CSV upload page and management command."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget", start_date=date(2024, 1, 1)
+        )
+        BudgetMonth.objects.create(budget=self.budget, year=2024, month=1)
+        self.url = reverse("expense_import", args=[self.budget.pk])
+
+    def upload(self, content, **data):
+        return self.client.post(
+            self.url,
+            {"file": SimpleUploadedFile("history.csv", content), **data},
+        )
+
+    def test_get(self):
+        """Test that upload page renders"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'enctype="multipart/form-data"')
+
+    def test_upload(self):
+        """Test that uploaded file is imported and problems are listed"""
+        content = (
+            HEADER + "Rent,,10,2024-01-01,,,,,\nBad,,x,2024-01-01,,,,,\n"
+        ).encode("utf-8-sig")
+        response = self.upload(content)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["result"].expenses, 1)
+        self.assertContains(response, "Invalid amount")
+        self.assertTrue(Expense.objects.filter(title="Rent").exists())
+
+    def test_upload_dry_run(self):
+        """Test that dry run upload saves nothing"""
+        response = self.upload(
+            (HEADER + "Rent,,10,2024-01-01,,,,,\n").encode(), dry_run="on"
+        )
+
+        self.assertTrue(response.context["result"].dry_run)
+        self.assertFalse(Expense.objects.exists())
+
+    def test_upload_invalid_file(self):
+        """Test that files without required columns or not in UTF-8 are rejected"""
+        for content in (
+            b"name,value\nRent,10\n",
+            HEADER.encode() + b"Caf\xe9,,1,2024-01-01\n",
+        ):
+            response = self.upload(content)
+
+            self.assertIsNone(response.context["result"])
+            self.assertTrue(response.context["form"].errors["file"])
+        self.assertFalse(Expense.objects.exists())
+
+    def test_command(self):
+        """Test that import command imports a file and reports problems"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "history.csv")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(
+                    HEADER + "Rent,,10,2024-01-01,,,,,\nBad,,x,2024-01-01,,,,,\n"
+                )
+            out = StringIO()
+            call_command("import_csv", self.budget.pk, path, stdout=out)
+
+        self.assertIn("Line 3: Invalid amount", out.getvalue())
+        self.assertIn("Imported 1 expense(s)", out.getvalue())
+        self.assertEqual(Expense.objects.count(), 1)
+
+    def test_command_missing_file(self):
+        """Test that import command reports unreadable files"""
+        out = StringIO()
+        call_command(
+            "import_csv", self.budget.pk, "/nonexistent/history.csv", stdout=out
+        )
+
+        self.assertIn("No such file", out.getvalue())
@@ -0,0 +1,85 @@
+from django.test import TestCase
+from django.core.management import call_command
+from decimal import Decimal
+from io import StringIO
+from babel.numbers import format_currency
+from .models import Settings
+from .services import CurrencyFormatter, SettingsService
+
+
+class CurrencyFormatterTest(TestCase):
+    """Test compiled and cached currency formatters."""
+
+    def setUp(self):
+        """Set up test data"""
+        SettingsService.clear_cache()
+        self.amounts = [
+            Decimal("0"),
+            Decimal("-0.00"),
+            Decimal("1.5"),
+            Decimal("-1234.567"),
+            Decimal("1234567.89"),
+        ]
+
+    def test_matches_babel_output(self):
+        """Test that compiled formatter gives the same output as babel"""
+        for currency, locale in [("USD", "en_US"), ("PLN", "pl_PL"), ("EUR", "de_DE")]:
+            for format_type in ["standard", "accounting"]:
+                formatter = CurrencyFormatter(currency, locale, format_type, 16)
+                for amount in self.amounts:
+                    self.assertEqual(
+                        formatter.format(amount),
+                        format_currency(
+                            amount, currency, locale=locale, format_type=format_type
+                        ),
+                    )
+
+    def test_lru_keeps_signed_zero_apart(self):
+        """Test that cached values of 0 and -0 are not mixed up"""
+        formatter = CurrencyFormatter("USD", "en_US", "standard", cache_size=16)
+
+        self.assertEqual(formatter.format(Decimal("0")), "$0.00")
+        self.assertEqual(formatter.format(Decimal("-0")), "-$0.00")
+
+    def test_unknown_locale_falls_back(self):
+        """Test that unknown locale uses basic formatting"""
+        formatter = CurrencyFormatter("USD", "xx_INVALID", "standard")
+
+        self.assertEqual(formatter.format(Decimal("12.5")), "USD 12.50")
+
+    def test_formatters_are_shared(self):
+        """Test that formatter is compiled once per settings combination"""
+        first = SettingsService.get_formatter("USD", "en_US", "standard")
+
+        self.assertIs(SettingsService.get_formatter("USD", "en_US", "standard"), first)
+        self.assertIsNot(
+            SettingsService.get_formatter("USD", "en_US", "accounting"), first
+        )
+
+    def test_settings_save_invalidates_formatters(self):
+        """Test that saving settings switches formatting immediately"""
+        settings = Settings.load()
+        settings.currency = "USD"
+        settings.locale = "en_US"
+        settings.save()
+        self.assertEqual(SettingsService.format_currency(Decimal("10")), "$10.00")
+        old_formatter = SettingsService.get_formatter("USD", "en_US", "standard")
+
+        settings.currency = "EUR"
+        settings.locale = "de_DE"
+        settings.save()
+
+        self.assertEqual(SettingsService.format_currency(Decimal("10")), "10,00\xa0€")
+        self.assertIsNot(
+            SettingsService.get_formatter("USD", "en_US", "standard"), old_formatter
+        )
+
+    def test_benchmark_command(self):
+        """Test that benchmark command reports all variants"""
+        out = StringIO()
+        call_command("benchmark_currency_format", "--iterations", "20", stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("babel format_currency", output)
+        self.assertIn("compiled formatter + LRU", output)
+        self.assertIn("Formatted 20 amount(s)", output)
@@ -0,0 +1,112 @@
+from django.test import Client, TestCase
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+from .models import Budget, BudgetMonth, Expense, ExpenseItem, Payment
+from .views.decorators import CSRF_PLACEHOLDER
+
+
+class DashboardResponseCacheTest(TestCase):
+    """Test server-side caching of rendered dashboard responses."""
+
+    def setUp(self):
+        """Set up test data"""
+        cache.clear()
+        self.budget = Budget.objects.create(
+            name="Test Budget",
+            start_date=date(2024, 1, 1),
+            initial_amount=Decimal("1000.00"),
+        )
+        self.month = BudgetMonth.objects.create(budget=self.budget, year=2024, month=1)
+        self.expense = Expense.objects.create(
+            budget=self.budget,
+            title="Rent",
+            expense_type=Expense.TYPE_ENDLESS_RECURRING,
+            amount=Decimal("100.00"),
+            start_date=date(2024, 1, 1),
+            day_of_month=10,
+        )
+        self.item = ExpenseItem.objects.create(
+            expense=self.expense,
+            month=self.month,
+            due_date=date(2024, 1, 10),
+            amount=Decimal("100.00"),
+        )
+        self.url = reverse("dashboard", args=[self.budget.id])
+
+    def test_render_is_shared(self):
+        """Test that repeated requests are served without running the view"""
+        first = self.client.get(self.url)
+
+        # Budget and settings version lookups
+        with self.assertNumQueries(2):
+            second = Client().get(self.url)
+
+        self.assertEqual(second.status_code, 200)
+        self.assertIn("Rent", second.content.decode())
+        self.assertEqual(second["Content-Type"], first["Content-Type"])
+
+    def test_cached_page_gets_request_csrf_token(self):
+        """Test that cached pages carry a valid token of each browser"""
+        today = date.today()
+        BudgetMonth.objects.create(
+            budget=self.budget, year=today.year, month=today.month
+        )
+        self.client.get(self.url)
+        browser = Client(enforce_csrf_checks=True)
+
+        with self.assertNumQueries(2):
+            response = browser.get(self.url)
+
+        self.assertNotIn(CSRF_PLACEHOLDER, response.content)
+        token = (
+            response.content.decode()
+            .split('name="csrfmiddlewaretoken" value="')[1]
+            .split('"')[0]
+        )
+        response = browser.post(
+            self.url,
+            {"csrfmiddlewaretoken": token, "title": "Coffee", "amount": "5.00"},
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(Expense.objects.filter(title="Coffee").exists())
+
+    def test_payment_invalidates_cached_page(self):
+        """Test that recording a payment renders the dashboard again"""
+        self.client.get(self.url)
+
+        Payment.objects.create(
+            expense_item=self.item,
+            amount=Decimal("100.00"),
+            payment_date=timezone.now(),
+        )
+
+        response = self.client.get(self.url)
+        self.assertIsNotNone(response.context)
+        self.assertEqual(response.context["dashboard_summary"]["paid_count"], 1)
+
+    def test_date_change_invalidates_cached_page(self):
+        """Test that a new day renders the dashboard again"""
+        self.client.get(self.url)
+
+        with patch("expenses.views.decorators.date") as mock_date:
+            mock_date.today.return_value = date(2099, 1, 1)
+            response = self.client.get(self.url)
+
+        self.assertIsNotNone(response.context)
+
+    def test_post_is_not_cached(self):
+        """Test that quick expense submissions always reach the view"""
+        today = date.today()
+        BudgetMonth.objects.create(
+            budget=self.budget, year=today.year, month=today.month
+        )
+        self.client.get(self.url)
+
+        response = self.client.post(self.url, {"title": "Coffee", "amount": "5.00"})
+
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(Expense.objects.filter(title="Coffee").exists())
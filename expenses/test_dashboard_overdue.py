@@ -0,0 +1,93 @@
+from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from datetime import date
+from decimal import Decimal
+from .models import Budget, BudgetMonth, Expense, ExpenseItem, Payment
+from .services import DataVersionService
+
+
+class DashboardOverdueTest(TestCase):
+    """Test SQL-side selection of overdue items on the dashboard."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget",
+            start_date=date(2023, 1, 1),
+            initial_amount=Decimal("1000.00"),
+        )
+        self.expense = Expense.objects.create(
+            budget=self.budget,
+            title="Rent",
+            expense_type=Expense.TYPE_ENDLESS_RECURRING,
+            amount=Decimal("100.00"),
+            start_date=date(2023, 1, 1),
+            day_of_month=10,
+        )
+        self.months = []
+        for month_number in range(1, 13):
+            self.months.append(
+                BudgetMonth.objects.create(
+                    budget=self.budget, year=2023, month=month_number
+                )
+            )
+        self.current_month = BudgetMonth.objects.create(
+            budget=self.budget, year=2024, month=1
+        )
+        self.url = reverse("dashboard", args=[self.budget.id])
+
+    def _create_item(self, month, paid_amount=None):
+        item = ExpenseItem.objects.create(
+            expense=self.expense,
+            month=month,
+            due_date=date(month.year, month.month, 10),
+            amount=Decimal("100.00"),
+        )
+        if paid_amount:
+            Payment.objects.create(
+                expense_item=item,
+                amount=Decimal(paid_amount),
+                payment_date=timezone.now(),
+            )
+        return item
+
+    def test_pending_queryset_excludes_fully_paid_items(self):
+        """Test that pending() keeps unpaid and partially paid items only"""
+        unpaid = self._create_item(self.months[0])
+        partial = self._create_item(self.months[1], "40.00")
+        self._create_item(self.months[2], "100.00")
+
+        pending_ids = set(ExpenseItem.objects.pending().values_list("pk", flat=True))
+
+        self.assertEqual(pending_ids, {unpaid.pk, partial.pk})
+
+    def test_dashboard_lists_only_pending_past_items(self):
+        """Test that dashboard groups only unpaid items from past months"""
+        self._create_item(self.months[0], "100.00")
+        overdue = self._create_item(self.months[5], "40.00")
+        self._create_item(self.current_month)
+
+        response = self.client.get(self.url)
+
+        grouped = response.context["grouped_expense_items"]
+        self.assertEqual(list(grouped.keys()), ["2024-01", "2023-06"])
+        self.assertEqual(grouped["2023-06"], [overdue])
+        self.assertEqual(response.context["month_totals"]["2023-06"], Decimal("-60.00"))
+
+    def test_dashboard_query_count_does_not_grow_with_paid_history(self):
+        """Test that paid history does not add dashboard queries"""
+        self._create_item(self.current_month)
+        self.client.get(self.url)  # Warm up settings cache
+        # Measure a full render, not the cached dashboard response
+        DataVersionService.bump_budget(self.budget.pk)
+        with CaptureQueriesContext(connection) as short_history:
+            self.client.get(self.url)
+
+        for month in self.months:
+            self._create_item(month, "100.00")
+
+        with self.assertNumQueries(len(short_history.captured_queries)):
+            self.client.get(self.url)
@@ -0,0 +1,128 @@
+from django.test import TestCase
+from django.utils import timezone
+from datetime import date
+from decimal import Decimal
+from .models import Budget, BudgetMonth, Expense, ExpenseItem, Payment
+from .services import check_expense_completion, check_expenses_completion
+
+
+class ExpenseCompletionTest(TestCase):
+    """Test aggregate-based expense completion checks."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget",
+            start_date=date(2024, 1, 1),
+            initial_amount=Decimal("1000.00"),
+        )
+        self.months = [
+            BudgetMonth.objects.create(budget=self.budget, year=2024, month=number)
+            for number in range(1, 13)
+        ]
+
+    def _create_expense(self, expense_type, parts=0, paid=0, partially_paid=0):
+        expense = Expense.objects.create(
+            budget=self.budget,
+            title=expense_type,
+            expense_type=expense_type,
+            amount=Decimal("100.00"),
+            start_date=date(2024, 1, 1),
+            day_of_month=10,
+            total_parts=parts,
+        )
+        item_count = max(parts, 1)
+        for index, month in enumerate(self.months[:item_count]):
+            item = ExpenseItem.objects.create(
+                expense=expense,
+                month=month,
+                due_date=date(2024, month.month, 10),
+                amount=Decimal("100.00"),
+            )
+            if index < paid + partially_paid:
+                Payment.objects.create(
+                    expense_item=item,
+                    amount=Decimal("100.00") if index < paid else Decimal("50.00"),
+                    payment_date=timezone.now(),
+                )
+        return expense
+
+    def test_paid_queryset_keeps_fully_paid_items(self):
+        """Test that paid() excludes unpaid and partially paid items"""
+        expense = self._create_expense(
+            Expense.TYPE_SPLIT_PAYMENT, parts=4, paid=2, partially_paid=1
+        )
+
+        self.assertEqual(ExpenseItem.objects.filter(expense=expense).paid().count(), 2)
+
+    def test_split_payment_completion_costs_fixed_queries(self):
+        """Test that completion check does not load items one by one"""
+        short = self._create_expense(Expense.TYPE_SPLIT_PAYMENT, parts=2, paid=1)
+        long = self._create_expense(Expense.TYPE_SPLIT_PAYMENT, parts=12, paid=11)
+
+        # Paid items count only, nothing to close
+        with self.assertNumQueries(1):
+            self.assertFalse(check_expense_completion(short))
+        with self.assertNumQueries(1):
+            self.assertFalse(check_expense_completion(long))
+
+    def test_partially_paid_items_do_not_complete(self):
+        """Test that partial payments do not count as paid items"""
+        expense = self._create_expense(
+            Expense.TYPE_SPLIT_PAYMENT, parts=3, paid=2, partially_paid=1
+        )
+
+        self.assertFalse(check_expense_completion(expense))
+        self.assertIsNone(expense.closed_at)
+
+    def test_batch_closes_completed_expenses(self):
+        """Test that batch check closes only completed expenses"""
+        done_split = self._create_expense(Expense.TYPE_SPLIT_PAYMENT, parts=3, paid=3)
+        open_split = self._create_expense(Expense.TYPE_SPLIT_PAYMENT, parts=3, paid=2)
+        done_one_time = self._create_expense(Expense.TYPE_ONE_TIME, paid=1)
+        open_one_time = self._create_expense(Expense.TYPE_ONE_TIME)
+        endless = self._create_expense(Expense.TYPE_ENDLESS_RECURRING, paid=1)
+        expenses = [done_split, open_split, done_one_time, open_one_time, endless]
+
+        # Paid items count, closing update and budget data version bump
+        with self.assertNumQueries(3):
+            closed = check_expenses_completion(expenses)
+
+        self.assertEqual(closed, [done_split, done_one_time])
+        self.assertIsNotNone(done_split.closed_at)
+        self.assertEqual(
+            set(
+                Expense.objects.filter(closed_at__isnull=False).values_list(
+                    "pk", flat=True
+                )
+            ),
+            {done_split.pk, done_one_time.pk},
+        )
+
+    def test_batch_matches_single_checks(self):
+        """Test that batch check agrees with one by one checks"""
+        specs = [
+            (Expense.TYPE_SPLIT_PAYMENT, 4, 4, 0),
+            (Expense.TYPE_SPLIT_PAYMENT, 4, 3, 1),
+            (Expense.TYPE_ONE_TIME, 0, 1, 0),
+            (Expense.TYPE_ONE_TIME, 0, 0, 1),
+            (Expense.TYPE_RECURRING_WITH_END, 0, 1, 0),
+        ]
+        batch = [self._create_expense(*spec) for spec in specs]
+        closed_ids = {expense.pk for expense in check_expenses_completion(batch)}
+
+        single_ids = set()
+        for expense in Expense.objects.filter(pk__in=[e.pk for e in batch]):
+            expense.closed_at = None
+            if check_expense_completion(expense):
+                single_ids.add(expense.pk)
+
+        self.assertEqual(closed_ids, single_ids)
+
+    def test_batch_skips_closed_expenses(self):
+        """Test that already closed expenses are not queried again"""
+        expense = self._create_expense(Expense.TYPE_ONE_TIME, paid=1)
+        check_expense_completion(expense)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(check_expenses_completion([expense]), [])
@@ -0,0 +1,140 @@
+from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from dataclasses import FrozenInstanceError
+from datetime import date
+from decimal import Decimal
+from .models import Budget, BudgetMonth, Expense, ExpenseItem, Payment
+
+
+class ExpenseEditRestrictionsTest(TestCase):
+    """Test one-pass evaluation of expense edit restrictions."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget",
+            start_date=date(2024, 1, 1),
+            initial_amount=Decimal("1000.00"),
+        )
+        self.month = BudgetMonth.objects.create(budget=self.budget, year=2024, month=1)
+
+    def _create_expense(self, title, paid=False, **kwargs):
+        defaults = {
+            "budget": self.budget,
+            "title": title,
+            "expense_type": Expense.TYPE_ENDLESS_RECURRING,
+            "amount": Decimal("100.00"),
+            "start_date": date(2024, 1, 1),
+            "day_of_month": 10,
+        }
+        defaults.update(kwargs)
+        expense = Expense.objects.create(**defaults)
+        item = ExpenseItem.objects.create(
+            expense=expense,
+            month=self.month,
+            due_date=date(2024, 1, 10),
+            amount=expense.amount,
+        )
+        if paid:
+            Payment.objects.create(
+                expense_item=item,
+                amount=expense.amount,
+                payment_date=timezone.now(),
+            )
+        return expense
+
+    def test_restrictions_are_evaluated_once(self):
+        """Test that restriction checks share a single evaluation"""
+        expense = self._create_expense("Rent", paid=True)
+        expense = Expense.objects.get(pk=expense.pk)
+
+        # Payments check and most recent month lookup
+        with self.assertNumQueries(2):
+            restrictions = expense.get_edit_restrictions()
+            self.assertIs(expense.get_edit_restrictions(), restrictions)
+            self.assertTrue(expense.can_be_edited())
+            self.assertFalse(expense.can_edit_amount())
+            self.assertFalse(expense.can_edit_date())
+            self.assertFalse(expense.can_be_deleted())
+
+        self.assertEqual(
+            restrictions.reasons,
+            (
+                "Amount cannot be edited because expense has paid items",
+                "Date cannot be edited for expenses earlier than next month",
+            ),
+        )
+
+    def test_restrictions_are_immutable(self):
+        """Test that restrictions object cannot be modified"""
+        restrictions = self._create_expense("Rent").get_edit_restrictions()
+
+        with self.assertRaises(FrozenInstanceError):
+            restrictions.can_edit_amount = False
+
+    def test_restrictions_support_dict_access(self):
+        """Test that restrictions keep dict-style access"""
+        restrictions = self._create_expense("Rent").get_edit_restrictions()
+
+        self.assertTrue(restrictions["can_edit_amount"])
+        self.assertEqual(restrictions["reasons"], restrictions.reasons)
+
+    def test_save_drops_cached_restrictions(self):
+        """Test that saving an expense evaluates restrictions again"""
+        expense = self._create_expense("Rent")
+        self.assertFalse(expense.can_edit_date())
+
+        expense.start_date = date(2024, 2, 1)
+        expense.save()
+
+        self.assertTrue(expense.can_edit_date())
+
+    def test_bulk_evaluation_matches_single_evaluation(self):
+        """Test that bulk evaluation gives the same results as one by one"""
+        self._create_expense("Unpaid")
+        self._create_expense("Paid", paid=True)
+        self._create_expense(
+            "Split", expense_type=Expense.TYPE_SPLIT_PAYMENT, total_parts=3
+        )
+        self._create_expense(
+            "Future", expense_type=Expense.TYPE_ONE_TIME, start_date=date(2024, 3, 5)
+        )
+        self._create_expense("Closed", closed_at=timezone.now())
+
+        expenses = list(Expense.objects.all())
+        with self.assertNumQueries(2):
+            bulk = Expense.evaluate_edit_restrictions(expenses)
+
+        for expense in Expense.objects.all():
+            self.assertEqual(bulk[expense.pk], expense.get_edit_restrictions())
+
+    def test_bulk_evaluation_uses_paid_items_annotation(self):
+        """Test that annotated expenses skip the payments query"""
+        self._create_expense("Unpaid")
+        self._create_expense("Paid", paid=True)
+        expenses = list(Expense.objects.with_paid_items().order_by("title"))
+
+        # Most recent month lookup only
+        with self.assertNumQueries(1):
+            Expense.evaluate_edit_restrictions(expenses)
+
+        self.assertEqual(
+            [expense.can_be_deleted() for expense in expenses], [False, True]
+        )
+
+    def test_expense_list_query_count_does_not_grow_with_expenses(self):
+        """Test that per-row can_be_deleted checks do not query payments"""
+        self._create_expense("Rent", paid=True)
+        url = reverse("expense_list", args=[self.budget.id])
+        self.client.get(url)  # Warm up settings cache
+        with CaptureQueriesContext(connection) as few_expenses:
+            self.client.get(url)
+
+        for index in range(10):
+            self._create_expense(f"Expense {index}", paid=index % 2 == 0)
+
+        with self.assertNumQueries(len(few_expenses.captured_queries)):
+            self.client.get(url)
@@ -0,0 +1,206 @@
+from django.test import TestCase
+from django.core.management import call_command
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import patch
+from .models import Budget, BudgetMonth, Expense, ExpenseItem, Payee, Payment
+from .search import ExpenseSearchService
+
+
+class ExpenseSearchTest(TestCase):
+    """Test full-text expense search kept in sync by models."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(name="Home", start_date=date(2024, 1, 1))
+        self.other_budget = Budget.objects.create(
+            name="Office", start_date=date(2024, 1, 1)
+        )
+        self.month = BudgetMonth.objects.create(budget=self.budget, year=2024, month=1)
+        self.landlord = Payee.objects.create(name="Landlord Estates")
+        self.rent = self._create_expense(
+            "Monthly rent", payee=self.landlord, notes="Paid by transfer"
+        )
+        self.internet = self._create_expense("Internet", notes="Fibre contract")
+        self.office_rent = self._create_expense("Office rent", budget=self.other_budget)
+
+    def _create_expense(self, title, budget=None, payee=None, notes=None):
+        return Expense.objects.create(
+            budget=budget or self.budget,
+            title=title,
+            payee=payee,
+            notes=notes,
+            expense_type=Expense.TYPE_ENDLESS_RECURRING,
+            amount=Decimal("100.00"),
+            start_date=date(2024, 1, 1),
+            day_of_month=1,
+        )
+
+    def _search(self, query, **kwargs):
+        return [expense.pk for expense in ExpenseSearchService.search(query, **kwargs)]
+
+    def test_search_available_on_sqlite(self):
+        """Test that the FTS5 table is created by migrations"""
+        self.assertTrue(ExpenseSearchService.is_available())
+
+    def test_search_by_title_notes_and_payee(self):
+        """Test that all indexed fields are searched"""
+        self.assertEqual(self._search("internet"), [self.internet.pk])
+        self.assertEqual(self._search("fibre"), [self.internet.pk])
+        self.assertEqual(self._search("landlord"), [self.rent.pk])
+
+    def test_prefix_and_all_words(self):
+        """Test that words match by prefix and all of them are required"""
+        self.assertEqual(
+            sorted(self._search("ren")), sorted([self.rent.pk, self.office_rent.pk])
+        )
+        self.assertEqual(self._search("ren offi"), [self.office_rent.pk])
+
+    def test_title_ranked_above_notes(self):
+        """Test that title matches rank before notes matches"""
+        notes_match = self._create_expense("Water", notes="Internet bundle")
+
+        self.assertEqual(self._search("internet"), [self.internet.pk, notes_match.pk])
+
+    def test_budget_filter(self):
+        """Test that results can be limited to one budget"""
+        self.assertEqual(
+            self._search("rent", budget_id=self.other_budget.pk),
+            [self.office_rent.pk],
+        )
+
+    def test_query_syntax_is_escaped(self):
+        """Test that FTS5 operators in user input do not break the query"""
+        self.assertEqual(self._search('rent" OR "'), self._search("rent or"))
+        self.assertEqual(self._search("***"), [])
+
+    def test_expense_changes_update_index(self):
+        """Test that edited and deleted expenses are reindexed"""
+        self.internet.title = "Broadband"
+        self.internet.save()
+
+        self.assertEqual(self._search("internet"), [])
+        self.assertEqual(self._search("broadband"), [self.internet.pk])
+
+        self.internet.delete()
+        self.assertEqual(self._search("broadband"), [])
+
+    def test_payee_rename_updates_index(self):
+        """Test that renaming a payee reindexes its expenses"""
+        self.landlord.name = "Property Management"
+        self.landlord.save()
+
+        self.assertEqual(self._search("landlord"), [])
+        self.assertEqual(self._search("property"), [self.rent.pk])
+
+    def test_payment_transaction_ids_indexed(self):
+        """Test that payment transaction IDs are searchable"""
+        item = ExpenseItem.objects.create(
+            expense=self.rent,
+            month=self.month,
+            due_date=date(2024, 1, 1),
+            amount=Decimal("100.00"),
+        )
+        payment = Payment.objects.create(
+            expense_item=item,
+            amount=Decimal("100.00"),
+            payment_date=timezone.now(),
+            transaction_id="TRX-98765",
+        )
+
+        self.assertEqual(self._search("trx 98765"), [self.rent.pk])
+
+        payment.delete()
+        self.assertEqual(self._search("98765"), [])
+
+        Payment.objects.create(
+            expense_item=item,
+            amount=Decimal("100.00"),
+            payment_date=timezone.now(),
+            transaction_id="TRX-4321",
+        )
+        self.client.post(reverse("expense_item_unpay", args=[self.budget.pk, item.pk]))
+        self.assertEqual(self._search("4321"), [])
+
+    def test_bulk_writes_indexed(self):
+        """Test that bulk created and updated expenses are indexed on request"""
+        created = Expense.objects.bulk_create(
+            [
+                Expense(
+                    budget=self.budget,
+                    title=f"Imported {index}",
+                    expense_type=Expense.TYPE_ONE_TIME,
+                    amount=Decimal("1.00"),
+                    start_date=date(2024, 1, 1),
+                    day_of_month=1,
+                )
+                for index in range(3)
+            ]
+        )
+        ExpenseSearchService.index_expenses(expense.pk for expense in created)
+        self.assertEqual(len(self._search("imported")), 3)
+
+        Expense.objects.filter(title__startswith="Imported").update(notes="archived")
+        self.assertEqual(self._search("archived"), [])
+        ExpenseSearchService.index_expenses(expense.pk for expense in created)
+        self.assertEqual(len(self._search("archived")), 3)
+
+    def test_budget_deletion_drops_rows(self):
+        """Test that expenses deleted with their budget leave the index"""
+        self.other_budget.delete()
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT count(*) FROM {ExpenseSearchService.TABLE} WHERE rowid = %s",
+                [self.office_rent.pk],
+            )
+            self.assertEqual(cursor.fetchone()[0], 0)
+
+    def test_no_sync_triggers(self):
+        """Test that no database triggers are involved in keeping the index"""
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT count(*) FROM sqlite_master WHERE type = 'trigger'")
+            self.assertEqual(cursor.fetchone()[0], 0)
+
+    def test_rebuild_command(self):
+        """Test that the index can be rebuilt from scratch"""
+        out = StringIO()
+        call_command("rebuild_search_index", stdout=out)
+
+        self.assertIn("Indexed 3 expense(s)", out.getvalue())
+        self.assertEqual(self._search("landlord"), [self.rent.pk])
+
+    def test_fallback_without_fts(self):
+        """Test that other databases fall back to plain lookups"""
+        with patch.object(ExpenseSearchService, "is_available", return_value=False):
+            results = ExpenseSearchService.search("landlord")
+
+        self.assertEqual([expense.pk for expense in results], [self.rent.pk])
+        self.assertIsNone(results[0].search_rank)
+
+    def test_search_view(self):
+        """Test that the search page lists matches of all budgets"""
+        response = self.client.get(reverse("expense_search"), {"q": "rent"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(
+            response, reverse("expense_detail", args=[self.budget.pk, self.rent.pk])
+        )
+        self.assertContains(response, "Office")
+
+    def test_search_api(self):
+        """Test that the search API returns ranked JSON results"""
+        response = self.client.get(
+            reverse("expense_search_api"),
+            {"q": "rent", "budget": self.budget.pk},
+        )
+
+        data = response.json()
+        self.assertEqual(data["query"], "rent")
+        self.assertEqual([row["id"] for row in data["results"]], [self.rent.pk])
+        self.assertEqual(data["results"][0]["payee"], "Landlord Estates")
+        self.assertEqual(data["results"][0]["amount"], "100.00")
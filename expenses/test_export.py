@@ -0,0 +1,183 @@
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from datetime import date, datetime
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import patch
+import csv
+import gzip
+import json
+import os
+import tempfile
+from .models import Budget, BudgetMonth, Expense, ExpenseItem, Payee, Payment
+from .export import BudgetExportService
+
+
+class BudgetExportTest(TestCase):
+    """Test streaming exports of budget data."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget", start_date=date(2024, 1, 1)
+        )
+        self.other_budget = Budget.objects.create(
+            name="Other Budget", start_date=date(2024, 1, 1)
+        )
+        self.month = BudgetMonth.objects.create(budget=self.budget, year=2024, month=1)
+        self.payee = Payee.objects.create(name="Landlord")
+        self.expense = Expense.objects.create(
+            budget=self.budget,
+            title="Rent, flat",
+            payee=self.payee,
+            expense_type=Expense.TYPE_ENDLESS_RECURRING,
+            amount=Decimal("100.35"),
+            start_date=date(2024, 1, 1),
+            day_of_month=10,
+            notes='Says "hi"\nSecond line',
+        )
+        self.item = ExpenseItem.objects.create(
+            expense=self.expense,
+            month=self.month,
+            due_date=date(2024, 1, 10),
+            amount=Decimal("100.35"),
+        )
+        self.payment = Payment.objects.create(
+            expense_item=self.item,
+            amount=Decimal("40.07"),
+            payment_date=timezone.make_aware(datetime(2024, 1, 9, 12, 30)),
+            transaction_id="TX-1",
+        )
+        Expense.objects.create(
+            budget=self.other_budget,
+            title="Not exported",
+            expense_type=Expense.TYPE_ONE_TIME,
+            amount=Decimal("5.00"),
+            start_date=date(2024, 1, 1),
+            day_of_month=1,
+        )
+
+    def read_csv(self, content):
+        return list(csv.DictReader(StringIO(content)))
+
+    def test_csv_expenses(self):
+        """Test that CSV export quotes values and is scoped to the budget"""
+        content = "".join(BudgetExportService.stream(self.budget.pk, "expenses", "csv"))
+        rows = self.read_csv(content)
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["title"], "Rent, flat")
+        self.assertEqual(rows[0]["payee"], "Landlord")
+        self.assertEqual(rows[0]["amount"], "100.35")
+        self.assertEqual(rows[0]["start_date"], "2024-01-01")
+        self.assertEqual(rows[0]["end_date"], "")
+        self.assertEqual(rows[0]["notes"], 'Says "hi"\nSecond line')
+
+    def test_jsonl_payments(self):
+        """Test that JSON lines export has one object per row"""
+        content = "".join(
+            BudgetExportService.stream(self.budget.pk, "payments", "jsonl")
+        )
+        rows = [json.loads(line) for line in content.splitlines()]
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["amount"], "40.07")
+        self.assertEqual(rows[0]["expense_id"], self.expense.pk)
+        self.assertEqual(rows[0]["transaction_id"], "TX-1")
+        self.assertIsNone(rows[0]["payment_method"])
+        self.assertTrue(rows[0]["payment_date"].startswith("2024-01-09T"))
+
+    def test_rows_streamed_in_chunks(self):
+        """Test that rows are encoded and yielded chunk by chunk"""
+        for day in range(2, 6):
+            ExpenseItem.objects.create(
+                expense=self.expense,
+                month=self.month,
+                due_date=date(2024, 1, day),
+                amount=Decimal("1.00"),
+            )
+
+        with patch.object(BudgetExportService, "CHUNK_SIZE", 2):
+            chunks = list(BudgetExportService.stream(self.budget.pk, "items", "csv"))
+
+        self.assertEqual(len(chunks), 3)
+        rows = self.read_csv("".join(chunks))
+        self.assertEqual([row["id"] for row in rows], sorted(row["id"] for row in rows))
+        self.assertEqual(rows[0]["paid_total"], "40.07")
+
+    def test_unknown_dataset_rejected(self):
+        """Test that unsupported datasets raise an error before streaming"""
+        with self.assertRaises(ValueError):
+            BudgetExportService.stream(self.budget.pk, "budgets", "csv")
+
+    def test_view_streams_download(self):
+        """Test that export endpoint streams a CSV attachment"""
+        url = reverse("budget_export", args=[self.budget.pk, "items", "csv"])
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertIn(
+            f'filename="budget-{self.budget.pk}-items.csv"',
+            response["Content-Disposition"],
+        )
+        rows = self.read_csv(b"".join(response.streaming_content).decode())
+        self.assertEqual(rows[0]["expense"], "Rent, flat")
+
+    def test_view_gzip(self):
+        """Test that export endpoint compresses on request"""
+        url = reverse("budget_export", args=[self.budget.pk, "payments", "jsonl"])
+        response = self.client.get(url, {"gzip": "1"})
+
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        self.assertIn(".jsonl.gz", response["Content-Disposition"])
+        content = gzip.decompress(b"".join(response.streaming_content)).decode()
+        self.assertEqual(json.loads(content)["transaction_id"], "TX-1")
+
+    def test_view_unknown_export(self):
+        """Test that unknown datasets, formats and budgets return 404"""
+        for args in (
+            [self.budget.pk, "budgets", "csv"],
+            [self.budget.pk, "items", "xml"],
+            [9999, "items", "csv"],
+        ):
+            response = self.client.get(reverse("budget_export", args=args))
+            self.assertEqual(response.status_code, 404)
+
+    def test_command_writes_stdout(self):
+        """Test that export command writes to standard output"""
+        out = StringIO()
+        call_command("export_budget", self.budget.pk, stdout=out)
+
+        rows = self.read_csv(out.getvalue())
+        self.assertEqual([row["title"] for row in rows], ["Rent, flat"])
+
+    def test_command_writes_gzip_file(self):
+        """Test that export command writes a compressed file"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "payments.jsonl.gz")
+            out = StringIO()
+            call_command(
+                "export_budget",
+                self.budget.pk,
+                dataset="payments",
+                format="jsonl",
+                output=path,
+                gzip=True,
+                stdout=out,
+            )
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                rows = [json.loads(line) for line in file]
+
+        self.assertIn("Exported payments", out.getvalue())
+        self.assertEqual(rows[0]["amount"], "40.07")
+
+    def test_command_unknown_budget(self):
+        """Test that export command reports missing budgets"""
+        out = StringIO()
+        call_command("export_budget", 9999, stdout=out)
+
+        self.assertIn("does not exist", out.getvalue())
@@ -1,5 +1,12 @@
+import os
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+from django.core.cache import cache
+from django.core.management import call_command
 from django.test import TestCase, Client
 from django.urls import reverse
+from .help_docs import HelpDocsService, HelpSearchService
 
 
 class HelpViewsTest(TestCase):
@@ -65,3 +72,196 @@ class HelpViewsTest(TestCase):
         self.assertContains(response, "fas fa-exclamation-triangle")
         self.assertContains(response, "Go to Help Index")
         self.assertContains(response, "View All Documentation")
+
+
+class HelpDocsCacheTest(TestCase):
+    """Test rendering documentation pages once and serving them from memory."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        docs_dir = self.tmp_dir.name
+        self.path = os.path.join(docs_dir, "guide.md")
+        self._write("# Guide\n\n## Section\n\n```python\nprint(1)\n```\n", 1_000)
+
+        patcher = patch.object(HelpDocsService, "get_docs_dir", return_value=docs_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        HelpDocsService.clear_cache()
+        self.addCleanup(HelpDocsService.clear_cache)
+        cache.clear()
+
+    def _write(self, content, mtime):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.utime(self.path, ns=(mtime * 10**9, mtime * 10**9))
+
+    def test_page_rendered_once(self):
+        """Test that repeated requests reuse the rendered page."""
+        with patch.object(
+            HelpDocsService, "_render", wraps=HelpDocsService._render
+        ) as render:
+            first = self.client.get(reverse("help_page", args=["guide"]))
+            second = self.client.get(reverse("help_page", args=["guide"]))
+
+        self.assertEqual(render.call_count, 1)
+        self.assertContains(first, "codehilite")
+        self.assertEqual(first.context["title"], "Guide")
+        self.assertEqual(first.content, second.content)
+
+    def test_modified_file_rendered_again(self):
+        """Test that changing file mtime invalidates the cached page."""
+        first = HelpDocsService.get_doc("guide")
+        self.assertIs(HelpDocsService.get_doc("guide"), first)
+
+        self._write("# Updated guide\n", 2_000)
+
+        updated = HelpDocsService.get_doc("guide")
+        self.assertEqual(updated.heading, "Updated guide")
+        self.assertNotIn("Section", updated.html)
+
+    def test_shared_cache_used_by_new_process(self):
+        """Test that pages rendered elsewhere are read from the shared cache."""
+        HelpDocsService.get_doc("guide")
+        HelpDocsService.clear_cache()
+
+        with patch.object(HelpDocsService, "_render") as render:
+            doc = HelpDocsService.get_doc("guide")
+
+        render.assert_not_called()
+        self.assertEqual(doc.heading, "Guide")
+
+    def test_invalid_name_rejected(self):
+        """Test that page names cannot point outside of docs directory."""
+        with self.assertRaises(FileNotFoundError):
+            HelpDocsService.get_doc(os.path.join("..", "guide"))
+
+    def test_warm_command(self):
+        """Test that warm_help_docs renders all pages into the shared cache."""
+        out = StringIO()
+        call_command("warm_help_docs", stdout=out)
+        # Server process has not seen any page yet
+        HelpDocsService.clear_cache()
+
+        self.assertIn("Cached: guide (Guide)", out.getvalue())
+        self.assertIn("Cached 1 documentation page(s)", out.getvalue())
+        with patch.object(HelpDocsService, "_render") as render:
+            HelpDocsService.get_doc("guide")
+        render.assert_not_called()
+
+
+class HelpSearchTest(TestCase):
+    """Test full-text search over documentation pages."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.docs_dir = self.tmp_dir.name
+        self._write(
+            "payments.md",
+            "# Payments\n\nIntro text.\n\n## Recording payments\n\n"
+            "Open the item and record a payment.\n\n```bash\n# not a heading\n```\n",
+            1_000,
+        )
+        self._write(
+            "budgets.md",
+            "# Budgets\n\n## Overview\n\nBudgets group expenses. A payment "
+            "belongs to one budget.\n\n## Overview\n\nStarting balance.\n",
+            1_000,
+        )
+
+        patcher = patch.object(
+            HelpDocsService, "get_docs_dir", return_value=self.docs_dir
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        HelpDocsService.clear_cache()
+        HelpSearchService.clear_cache()
+        self.addCleanup(HelpDocsService.clear_cache)
+        self.addCleanup(HelpSearchService.clear_cache)
+        cache.clear()
+
+    def _write(self, filename, content, mtime):
+        path = os.path.join(self.docs_dir, filename)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.utime(path, ns=(mtime * 10**9, mtime * 10**9))
+
+    def test_results_ranked_by_relevance(self):
+        """Test that pages about the query rank first, with sections."""
+        results = HelpSearchService.search("payment")
+
+        self.assertEqual([r.page_name for r in results], ["payments", "budgets"])
+        best = results[0].sections[0]
+        self.assertEqual(best.section.heading, "Recording payments")
+        self.assertEqual(best.section.anchor, "recording-payments")
+        self.assertIn("record a payment", best.snippet)
+
+    def test_anchors_match_rendered_headings(self):
+        """Test that section anchors point at heading ids of rendered pages."""
+        index = HelpSearchService.get_index()
+
+        anchors = [s.anchor for s in index.sections if s.page_name == "budgets"]
+        self.assertEqual(anchors, ["budgets", "overview", "overview_1"])
+        html = HelpDocsService.get_doc("budgets").html
+        for anchor in anchors:
+            self.assertIn(f'id="{anchor}"', html)
+
+    def test_all_words_required(self):
+        """Test that pages must contain every query word."""
+        results = HelpSearchService.search("payment balance")
+
+        self.assertEqual([r.page_name for r in results], ["budgets"])
+
+    def test_prefix_matching(self):
+        """Test that words match longer words starting with them."""
+        results = HelpSearchService.search("budg")
+
+        self.assertEqual(results[0].page_name, "budgets")
+
+    def test_code_blocks_not_split(self):
+        """Test that comment lines in code blocks are not taken for headings."""
+        index = HelpSearchService.get_index()
+
+        headings = [s.heading for s in index.sections if s.page_name == "payments"]
+        self.assertEqual(headings, ["Payments", "Recording payments"])
+
+    def test_no_file_reads_per_query(self):
+        """Test that queries are answered from the index."""
+        HelpSearchService.search("payment")
+
+        with patch.object(HelpDocsService, "_render") as render, patch.object(
+            HelpSearchService, "_build"
+        ) as build:
+            HelpSearchService.search("budget")
+
+        render.assert_not_called()
+        build.assert_not_called()
+
+    def test_changed_file_rebuilds_index(self):
+        """Test that edited and new files are picked up."""
+        self.assertEqual(HelpSearchService.search("invoices"), [])
+
+        self._write("payments.md", "# Payments\n\nInvoices are paid.\n", 2_000)
+        self._write("payees.md", "# Payees\n\nWho sends invoices.\n", 2_000)
+
+        results = HelpSearchService.search("invoices")
+        self.assertEqual(sorted(r.page_name for r in results), ["payees", "payments"])
+
+    def test_search_view(self):
+        """Test that search page lists hits linking to page sections."""
+        response = self.client.get(reverse("help_search"), {"q": "recording"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["query"], "recording")
+        self.assertContains(
+            response, reverse("help_page", args=["payments"]) + "#recording-payments"
+        )
+
+    def test_search_view_no_results(self):
+        """Test that empty and unmatched queries render without results."""
+        response = self.client.get(reverse("help_search"))
+        self.assertEqual(response.context["results"], [])
+
+        response = self.client.get(reverse("help_search"), {"q": "nothing"})
+        self.assertContains(response, "No Results")
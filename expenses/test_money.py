@@ -0,0 +1,131 @@
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import Sum
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from datetime import date
+from decimal import Decimal
+from .fields import SanitizedDecimalField
+from .models import (
+    Budget,
+    BudgetMonth,
+    BudgetMonthSummary,
+    Expense,
+    ExpenseItem,
+    Payment,
+)
+from .money import Money, MoneyField, to_cents
+
+
+class MoneyTest(SimpleTestCase):
+    """Test the Money value type."""
+
+    def test_quantized_to_cents(self):
+        """Test that values are rounded half to even to whole cents"""
+        self.assertEqual(str(Money("10")), "10.00")
+        self.assertEqual(Money("0.125"), Decimal("0.12"))
+        self.assertEqual(Money("0.135"), Decimal("0.14"))
+        self.assertEqual(Money(0.1), Decimal("0.10"))
+
+    def test_cents_round_trip(self):
+        """Test conversion to and from minor units"""
+        self.assertEqual(Money("123.45").cents, 12345)
+        self.assertEqual(Money("-0.07").cents, -7)
+        self.assertEqual(Money.from_cents(12345), Decimal("123.45"))
+        self.assertIsInstance(Money.from_cents(Decimal("5")), Money)
+        self.assertEqual(to_cents(Decimal("19.99")), 1999)
+        self.assertEqual(to_cents(3), 300)
+
+    def test_sum(self):
+        """Test that sums are exact and return Money"""
+        total = Money.sum([Decimal("0.10")] * 10 + [Money("-0.05")])
+
+        self.assertIsInstance(total, Money)
+        self.assertEqual(total, Decimal("0.95"))
+        self.assertEqual(Money.sum([]), Decimal("0.00"))
+
+
+class MoneyFieldTest(TestCase):
+    """Test storing amounts as integer cents."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget",
+            start_date=date(2024, 1, 1),
+            initial_amount=Decimal("1000.10"),
+        )
+        self.month = BudgetMonth.objects.create(budget=self.budget, year=2024, month=1)
+        self.expense = Expense.objects.create(
+            budget=self.budget,
+            title="Rent",
+            expense_type=Expense.TYPE_ENDLESS_RECURRING,
+            amount=Decimal("100.35"),
+            start_date=date(2024, 1, 1),
+            day_of_month=10,
+        )
+        self.item = ExpenseItem.objects.create(
+            expense=self.expense,
+            month=self.month,
+            due_date=date(2024, 1, 10),
+            amount=Decimal("100.35"),
+        )
+
+    def test_stored_as_integer_cents(self):
+        """Test that the database column holds integer minor units"""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT amount FROM expenses_expenseitem WHERE id = %s", [self.item.pk]
+            )
+            self.assertEqual(cursor.fetchone()[0], 10035)
+
+        self.item.refresh_from_db()
+        self.assertIsInstance(self.item.amount, Money)
+        self.assertEqual(self.item.amount, Decimal("100.35"))
+
+    def test_lookups_use_major_units(self):
+        """Test that query values are converted to cents"""
+        self.assertTrue(ExpenseItem.objects.filter(amount=Decimal("100.35")).exists())
+        self.assertTrue(ExpenseItem.objects.filter(amount__gt=100).exists())
+        self.assertFalse(ExpenseItem.objects.filter(amount__gt="100.35").exists())
+
+    def test_aggregates_return_money(self):
+        """Test that integer sums are converted back to Money"""
+        for amount in ("0.10", "0.20", "40.07"):
+            Payment.objects.create(
+                expense_item=self.item,
+                amount=Decimal(amount),
+                payment_date=timezone.now(),
+            )
+
+        total = Payment.objects.aggregate(total=Sum("amount"))["total"]
+        self.assertIsInstance(total, Money)
+        self.assertEqual(total, Decimal("40.37"))
+
+        item = ExpenseItem.objects.with_payment_totals().get(pk=self.item.pk)
+        self.assertEqual(item.annotated_total_paid, Decimal("40.37"))
+        self.assertEqual(item.get_remaining_amount(), Decimal("-59.98"))
+
+        summary = BudgetMonthSummary.objects.get(month=self.month)
+        self.assertIsInstance(summary.pending_amount, Money)
+        self.assertEqual(summary.pending_amount, Decimal("59.98"))
+
+    def test_balance_annotation_is_money(self):
+        """Test that balance arithmetic on cents is converted back to Money"""
+        budget = Budget.objects.with_balances().get(pk=self.budget.pk)
+
+        self.assertIsInstance(budget.current_balance, Money)
+        self.assertEqual(budget.current_balance, Decimal("899.75"))
+        self.assertEqual(budget.committed_total, Decimal("100.35"))
+
+    def test_form_field_accepts_decimal_input(self):
+        """Test that model forms get a decimal input, not an integer one"""
+        form_field = ExpenseItem._meta.get_field("amount").formfield()
+
+        self.assertIsInstance(form_field, SanitizedDecimalField)
+        self.assertEqual(form_field.clean("10,50"), Decimal("10.50"))
+
+    def test_invalid_value_rejected(self):
+        """Test that non-numeric values raise a validation error"""
+        with self.assertRaises(ValidationError):
+            MoneyField().to_python("ten")
@@ -0,0 +1,102 @@
+import calendar
+import threading
+from datetime import date
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from .models import Budget, BudgetMonth
+from .month_calendar import get_month_grid
+
+
+class MonthGridTest(SimpleTestCase):
+    """Test precomputed, cached month calendar grids."""
+
+    def test_weeks_start_on_monday(self):
+        """Test that grids are Monday-first with padding cells"""
+        grid = get_month_grid(2024, 2, date(2024, 2, 15))
+
+        # February 2024 starts on Thursday and ends on Thursday
+        first_week = grid.weeks[0]
+        self.assertEqual(len(first_week), 7)
+        self.assertEqual([cell.day for cell in first_week], [0, 0, 0, 1, 2, 3, 4])
+        self.assertTrue(first_week[0].is_padding)
+        self.assertEqual(first_week[0].date, date(2024, 1, 29))
+        self.assertEqual(grid.weeks[-1][3].date, date(2024, 2, 29))
+        self.assertEqual(grid.month_name, "February")
+
+    def test_day_flags(self):
+        """Test today, past, future and weekend flags"""
+        grid = get_month_grid(2024, 1, date(2024, 1, 17))
+        cells = {cell.day: cell for week in grid.weeks for cell in week}
+
+        self.assertTrue(cells[17].is_today)
+        self.assertIn("calendar-day--today", cells[17].css_class)
+        self.assertTrue(cells[16].is_past)
+        self.assertEqual(cells[16].css_class, "calendar-day--past")
+        self.assertTrue(cells[18].is_future)
+        self.assertTrue(cells[20].is_weekend)
+        self.assertEqual(
+            cells[20].css_class, "calendar-day--future calendar-day--weekend"
+        )
+        self.assertTrue(grid.is_current_month)
+
+    def test_grid_is_cached(self):
+        """Test that the same grid is returned for the same month and day"""
+        today = date(2024, 3, 5)
+
+        self.assertIs(get_month_grid(2024, 3, today), get_month_grid(2024, 3, today))
+        self.assertIsNot(
+            get_month_grid(2024, 3, today), get_month_grid(2024, 3, date(2024, 3, 6))
+        )
+
+    def test_global_calendar_state_untouched(self):
+        """Test that building grids keeps the calendar module's first weekday"""
+        calendar.setfirstweekday(calendar.SUNDAY)
+        try:
+            grid = get_month_grid(2024, 9, date(2024, 9, 1))
+            self.assertEqual(calendar.firstweekday(), calendar.SUNDAY)
+        finally:
+            calendar.setfirstweekday(calendar.MONDAY)
+
+        self.assertEqual(grid.weeks[0][0].date.weekday(), calendar.MONDAY)
+
+    def test_concurrent_access(self):
+        """Test that grids built from many threads are consistent"""
+        today = date(2025, 5, 20)
+        grids = []
+
+        def build():
+            for month in range(1, 13):
+                grids.append(get_month_grid(2025, month, today))
+
+        threads = [threading.Thread(target=build) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for grid in grids:
+            self.assertEqual(grid.weeks[0][0].date.weekday(), calendar.MONDAY)
+            self.assertEqual(
+                max(cell.day for week in grid.weeks for cell in week),
+                calendar.monthrange(2025, grid.month)[1],
+            )
+
+
+class DashboardCalendarGridTest(TestCase):
+    """Test dashboard rendering of the precomputed calendar grid."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget", start_date=date(2024, 1, 1)
+        )
+        BudgetMonth.objects.create(budget=self.budget, year=2024, month=2)
+
+    def test_dashboard_renders_grid(self):
+        """Test that the dashboard shows the most recent month's grid"""
+        response = self.client.get(reverse("dashboard", args=[self.budget.id]))
+
+        weeks = response.context["calendar_weeks"]
+        self.assertEqual(weeks, get_month_grid(2024, 2, date.today()).weeks)
+        self.assertEqual(response.context["month_name"], "February")
+        self.assertContains(response, "calendar-day--empty", count=6)
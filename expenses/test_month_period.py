@@ -0,0 +1,86 @@
+from unittest import skipUnless
+from django.test import TestCase
+from django.db import connection
+from datetime import date
+from decimal import Decimal
+from .models import Budget, BudgetMonth, Expense, ExpenseItem
+from .services import process_months_until
+
+
+class BudgetMonthPeriodTest(TestCase):
+    """Test the stored period key of budget months."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget", start_date=date(2023, 11, 1)
+        )
+
+    def test_period_set_on_save(self):
+        """Test that period is computed from year and month"""
+        month = BudgetMonth.objects.create(budget=self.budget, year=2024, month=3)
+        self.assertEqual(month.period, 202403)
+
+        month.year, month.month = 2025, 11
+        month.save(update_fields=["year", "month"])
+
+        month.refresh_from_db()
+        self.assertEqual(month.period, 202511)
+
+    def test_period_set_for_bulk_created_months(self):
+        """Test that months created in bulk get their period"""
+        process_months_until(self.budget, 2024, 2)
+
+        self.assertEqual(
+            list(BudgetMonth.objects.values_list("period", flat=True)),
+            [202402, 202401, 202312, 202311],
+        )
+
+    def test_most_recent_month_across_year_boundary(self):
+        """Test that most recent month is ordered by period"""
+        BudgetMonth.objects.create(budget=self.budget, year=2024, month=1)
+        BudgetMonth.objects.create(budget=self.budget, year=2023, month=12)
+
+        most_recent = BudgetMonth.get_most_recent(self.budget)
+
+        self.assertEqual((most_recent.year, most_recent.month), (2024, 1))
+
+    def test_dashboard_overdue_items_use_period_range(self):
+        """Test that items of earlier months are found by period range"""
+        expense = Expense.objects.create(
+            budget=self.budget,
+            title="Rent",
+            expense_type=Expense.TYPE_ENDLESS_RECURRING,
+            amount=Decimal("100.00"),
+            start_date=date(2023, 11, 1),
+            day_of_month=1,
+        )
+        months = process_months_until(self.budget, 2024, 2)
+        for month in months:
+            ExpenseItem.objects.create(
+                expense=expense,
+                month=month,
+                due_date=date(month.year, month.month, 1),
+                amount=Decimal("100.00"),
+            )
+
+        response = self.client.get(f"/budgets/{self.budget.id}/dashboard/")
+
+        self.assertEqual(
+            list(response.context["grouped_expense_items"]),
+            ["2024-02", "2024-01", "2023-12", "2023-11"],
+        )
+
+    @skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN is SQLite specific")
+    def test_period_range_uses_index(self):
+        """Test that period range filters are served by one index range"""
+        queryset = ExpenseItem.objects.filter(
+            month__budget=self.budget, month__period__lt=202402
+        ).order_by("-month__period")
+        sql, params = queryset.query.sql_with_params()
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            plan = " ".join(row[3] for row in cursor.fetchall())
+
+        self.assertIn("budgetmonth_period_idx (budget_id=? AND period<?)", plan)
@@ -0,0 +1,244 @@
+from django.test import TestCase
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from .models import Budget, BudgetMonth, Expense, ExpenseItem
+from .services import (
+    create_expense_items_for_month_batch,
+    process_months_until,
+    process_new_month,
+)
+
+
+class BatchedMonthRolloverTest(TestCase):
+    """Test batched expense item generation during month rollover."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget",
+            start_date=date(2024, 1, 1),
+            initial_amount=Decimal("1000.00"),
+        )
+        self.month = BudgetMonth.objects.create(budget=self.budget, year=2024, month=1)
+
+    def _create_expense(self, expense_type, **kwargs):
+        defaults = {
+            "budget": self.budget,
+            "title": expense_type,
+            "expense_type": expense_type,
+            "amount": Decimal("100.00"),
+            "start_date": date(2024, 1, 1),
+            "day_of_month": 31,
+        }
+        defaults.update(kwargs)
+        return Expense.objects.create(**defaults)
+
+    def _create_mixed_expenses(self, count):
+        for _ in range(count):
+            self._create_expense(Expense.TYPE_ENDLESS_RECURRING)
+            self._create_expense(
+                Expense.TYPE_SPLIT_PAYMENT, total_parts=3, skip_parts=1
+            )
+            self._create_expense(Expense.TYPE_ONE_TIME)
+            self._create_expense(
+                Expense.TYPE_RECURRING_WITH_END, end_date=date(2024, 2, 15)
+            )
+
+    def test_batch_applies_expense_type_rules(self):
+        """Test that batched generation follows per-type business rules"""
+        endless = self._create_expense(Expense.TYPE_ENDLESS_RECURRING)
+        split = self._create_expense(
+            Expense.TYPE_SPLIT_PAYMENT, total_parts=3, skip_parts=1
+        )
+        one_time = self._create_expense(Expense.TYPE_ONE_TIME)
+        with_end = self._create_expense(
+            Expense.TYPE_RECURRING_WITH_END, end_date=date(2024, 2, 15)
+        )
+        future = self._create_expense(
+            Expense.TYPE_ENDLESS_RECURRING, start_date=date(2024, 6, 1)
+        )
+        expenses = [endless, split, one_time, with_end, future]
+
+        created_per_month = []
+        for month_number in range(1, 5):
+            month_obj, _ = BudgetMonth.objects.get_or_create(
+                budget=self.budget, year=2024, month=month_number
+            )
+            items = create_expense_items_for_month_batch(expenses, month_obj)
+            created_per_month.append(sorted(item.expense.title for item in items))
+
+        self.assertEqual(
+            created_per_month[0],
+            sorted(
+                [
+                    Expense.TYPE_ENDLESS_RECURRING,
+                    Expense.TYPE_SPLIT_PAYMENT,
+                    Expense.TYPE_ONE_TIME,
+                    Expense.TYPE_RECURRING_WITH_END,
+                ]
+            ),
+        )
+        self.assertEqual(
+            created_per_month[1],
+            sorted(
+                [
+                    Expense.TYPE_ENDLESS_RECURRING,
+                    Expense.TYPE_SPLIT_PAYMENT,
+                    Expense.TYPE_RECURRING_WITH_END,
+                ]
+            ),
+        )
+        self.assertEqual(created_per_month[2], [Expense.TYPE_ENDLESS_RECURRING])
+        self.assertEqual(ExpenseItem.objects.filter(expense=split).count(), 2)
+        self.assertFalse(ExpenseItem.objects.filter(expense=future).exists())
+
+    def test_batch_applies_due_date_fallback(self):
+        """Test that batched items get the month-length adjusted due date"""
+        self._create_expense(Expense.TYPE_ENDLESS_RECURRING)
+
+        month_obj = process_new_month(2024, 2, self.budget)
+
+        item = ExpenseItem.objects.get(month=month_obj)
+        self.assertEqual(item.due_date, date(2024, 2, 29))
+        self.assertEqual(item.amount, Decimal("100.00"))
+
+    def test_rollover_query_count_does_not_grow_with_expenses(self):
+        """Test that process_new_month costs the same queries for any expense count"""
+        self._create_mixed_expenses(2)
+        with CaptureQueriesContext(connection) as small_budget:
+            process_new_month(2024, 2, self.budget)
+
+        self._create_mixed_expenses(20)
+        with self.assertNumQueries(len(small_budget.captured_queries)):
+            process_new_month(2024, 3, self.budget)
+
+        self.assertEqual(
+            ExpenseItem.objects.filter(month__year=2024, month__month=3).count(),
+            # 22 endless recurring, 22 split payments and 20 fresh one-time expenses
+            22 + 22 + 20,
+        )
+
+
+class CatchUpMonthsTest(TestCase):
+    """Test multi-month catch-up processing."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget",
+            start_date=date(2023, 11, 5),
+            initial_amount=Decimal("1000.00"),
+        )
+        self.endless = Expense.objects.create(
+            budget=self.budget,
+            title="Rent",
+            expense_type=Expense.TYPE_ENDLESS_RECURRING,
+            amount=Decimal("100.00"),
+            start_date=date(2023, 11, 1),
+            day_of_month=10,
+        )
+        self.split = Expense.objects.create(
+            budget=self.budget,
+            title="Laptop",
+            expense_type=Expense.TYPE_SPLIT_PAYMENT,
+            amount=Decimal("50.00"),
+            start_date=date(2023, 11, 1),
+            day_of_month=10,
+            total_parts=4,
+            skip_parts=1,
+        )
+
+    def test_creates_months_from_budget_start(self):
+        """Test that catch-up starts at budget start date when no months exist"""
+        months = process_months_until(self.budget, 2024, 2)
+
+        self.assertEqual(
+            [str(month) for month in months],
+            ["2023-11", "2023-12", "2024-01", "2024-02"],
+        )
+        self.assertEqual(ExpenseItem.objects.filter(expense=self.endless).count(), 4)
+        # Split payment stops after remaining 3 installments
+        self.assertEqual(ExpenseItem.objects.filter(expense=self.split).count(), 3)
+        self.assertFalse(
+            ExpenseItem.objects.filter(
+                expense=self.split, month__year=2024, month__month=2
+            ).exists()
+        )
+
+    def test_continues_after_most_recent_month(self):
+        """Test that catch-up continues after the most recent month"""
+        process_new_month(2023, 11, self.budget)
+
+        months = process_months_until(self.budget, 2024, 1)
+
+        self.assertEqual([str(month) for month in months], ["2023-12", "2024-01"])
+        self.assertEqual(ExpenseItem.objects.filter(expense=self.split).count(), 3)
+
+    def test_matches_sequential_processing(self):
+        """Test that catch-up creates the same items as month-by-month processing"""
+        process_months_until(self.budget, 2024, 3)
+        caught_up = sorted(
+            ExpenseItem.objects.values_list(
+                "expense_id", "month__year", "month__month", "due_date", "amount"
+            )
+        )
+
+        ExpenseItem.objects.all().delete()
+        BudgetMonth.objects.all().delete()
+        for year, month in [(2023, 11), (2023, 12), (2024, 1), (2024, 2), (2024, 3)]:
+            process_new_month(year, month, self.budget)
+        sequential = sorted(
+            ExpenseItem.objects.values_list(
+                "expense_id", "month__year", "month__month", "due_date", "amount"
+            )
+        )
+
+        self.assertEqual(caught_up, sequential)
+
+    def test_target_already_reached_creates_nothing(self):
+        """Test that nothing is created when the budget is up to date"""
+        process_months_until(self.budget, 2024, 1)
+
+        self.assertEqual(process_months_until(self.budget, 2023, 12), [])
+        self.assertEqual(BudgetMonth.objects.filter(budget=self.budget).count(), 3)
+
+    def test_invalid_target_raises(self):
+        """Test that invalid target month is rejected"""
+        with self.assertRaises(ValueError):
+            process_months_until(self.budget, 2024, 13)
+
+    def test_query_count_does_not_grow_with_months(self):
+        """Test that catching up 24 months takes a fixed number of queries"""
+        # Savepoint, most recent month lookup, months insert, expenses fetch,
+        # existing item counts, items insert, month summaries refresh (3),
+        # budget data version bump, savepoint release
+        with self.assertNumQueries(11):
+            process_months_until(self.budget, 2025, 10)
+
+        self.assertEqual(BudgetMonth.objects.filter(budget=self.budget).count(), 24)
+        self.assertEqual(ExpenseItem.objects.count(), 24 + 3)
+
+    def test_command_catches_up_budget(self):
+        """Test that catch_up_months command creates missing months"""
+        out = StringIO()
+        call_command(
+            "catch_up_months",
+            "--budget",
+            str(self.budget.pk),
+            "--year",
+            "2024",
+            "--month",
+            "1",
+            stdout=out,
+        )
+
+        self.assertIn("created 3 month(s) (2023-11 to 2024-01)", out.getvalue())
+        self.assertEqual(BudgetMonth.objects.filter(budget=self.budget).count(), 3)
+
+        out = StringIO()
+        call_command("catch_up_months", "--year", "2024", "--month", "1", stdout=out)
+        self.assertIn("already up to date", out.getvalue())
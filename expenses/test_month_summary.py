@@ -0,0 +1,166 @@
+from django.test import TestCase
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from .models import (
+    Budget,
+    BudgetMonth,
+    BudgetMonthSummary,
+    Expense,
+    ExpenseItem,
+    Payment,
+)
+from .services import process_new_month
+
+
+class BudgetMonthSummaryTest(TestCase):
+    """Test materialized per-month summaries."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget",
+            start_date=date(2024, 1, 1),
+            initial_amount=Decimal("1000.00"),
+        )
+        self.month = BudgetMonth.objects.create(budget=self.budget, year=2024, month=1)
+        self.expense = Expense.objects.create(
+            budget=self.budget,
+            title="Rent",
+            expense_type=Expense.TYPE_ENDLESS_RECURRING,
+            amount=Decimal("100.00"),
+            start_date=date(2024, 1, 1),
+            day_of_month=10,
+        )
+
+    def _create_item(self, amount, month=None, expense=None):
+        return ExpenseItem.objects.create(
+            expense=expense or self.expense,
+            month=month or self.month,
+            due_date=date(2024, 1, 10),
+            amount=Decimal(amount),
+        )
+
+    def _pay(self, item, amount):
+        return Payment.objects.create(
+            expense_item=item, amount=Decimal(amount), payment_date=timezone.now()
+        )
+
+    def _summary(self, month=None):
+        return BudgetMonthSummary.objects.get(month=month or self.month)
+
+    def test_item_create_and_delete_update_summary(self):
+        """Test that creating and deleting items keeps summary in sync"""
+        first = self._create_item("100.00")
+        self._create_item("50.00")
+
+        summary = self._summary()
+        self.assertEqual(summary.total_amount, Decimal("150.00"))
+        self.assertEqual(summary.pending_amount, Decimal("150.00"))
+        self.assertEqual(summary.item_count, 2)
+        self.assertEqual(summary.pending_count, 2)
+
+        first.delete()
+
+        summary = self._summary()
+        self.assertEqual(summary.total_amount, Decimal("50.00"))
+        self.assertEqual(summary.item_count, 1)
+
+    def test_item_amount_change_updates_summary(self):
+        """Test that editing item amount keeps summary in sync"""
+        item = self._create_item("100.00")
+        item.amount = Decimal("80.00")
+        item.save()
+
+        self.assertEqual(self._summary().total_amount, Decimal("80.00"))
+
+    def test_payments_update_summary(self):
+        """Test that payments move amounts from pending to paid"""
+        paid = self._create_item("100.00")
+        partial = self._create_item("50.00")
+        self._pay(paid, "100.00")
+        payment = self._pay(partial, "20.00")
+
+        summary = self._summary()
+        self.assertEqual(summary.paid_amount, Decimal("120.00"))
+        self.assertEqual(summary.pending_amount, Decimal("30.00"))
+        self.assertEqual(summary.paid_count, 1)
+        self.assertEqual(summary.pending_count, 1)
+
+        payment.delete()
+
+        summary = self._summary()
+        self.assertEqual(summary.paid_amount, Decimal("100.00"))
+        self.assertEqual(summary.pending_amount, Decimal("50.00"))
+
+    def test_expense_delete_updates_summary(self):
+        """Test that deleting expense refreshes summaries of its items' months"""
+        self._create_item("100.00")
+
+        self.expense.delete()
+
+        summary = self._summary()
+        self.assertEqual(summary.total_amount, Decimal("0.00"))
+        self.assertEqual(summary.item_count, 0)
+
+    def test_month_rollover_creates_summary(self):
+        """Test that processing a new month stores its summary"""
+        month_obj = process_new_month(2024, 2, self.budget)
+
+        summary = self._summary(month_obj)
+        self.assertEqual(summary.total_amount, Decimal("100.00"))
+        self.assertEqual(summary.item_count, 1)
+
+    def test_for_month_calculates_missing_summary(self):
+        """Test that for_month() calculates summary when it is missing"""
+        self._create_item("100.00")
+        BudgetMonthSummary.objects.all().delete()
+        month = BudgetMonth.objects.get(pk=self.month.pk)
+
+        summary = BudgetMonthSummary.for_month(month)
+
+        self.assertEqual(summary.total_amount, Decimal("100.00"))
+        self.assertEqual(month.summary, summary)
+
+    def test_month_views_read_summary(self):
+        """Test that month list and detail show totals from summary"""
+        item = self._create_item("100.00")
+        self._pay(item, "40.00")
+
+        response = self.client.get(reverse("month_list", args=[self.budget.id]))
+        self.assertEqual(response.context["months"][0].balance, Decimal("-100.00"))
+
+        response = self.client.get(
+            reverse("month_detail", args=[self.budget.id, 2024, 1])
+        )
+        self.assertEqual(
+            response.context["month_summary"],
+            {
+                "total": Decimal("100.00"),
+                "paid": Decimal("40.00"),
+                "pending": Decimal("60.00"),
+            },
+        )
+
+    def test_rebuild_command(self):
+        """Test that rebuild_month_summaries detects and repairs stale summaries"""
+        self._create_item("100.00")
+        BudgetMonthSummary.objects.filter(month=self.month).update(
+            total_amount=Decimal("1.00")
+        )
+
+        out = StringIO()
+        call_command("rebuild_month_summaries", "--check", stdout=out)
+        self.assertIn("Found 1 month(s) with out-of-sync summaries", out.getvalue())
+
+        out = StringIO()
+        call_command("rebuild_month_summaries", stdout=out)
+        self.assertIn("1 were out of sync", out.getvalue())
+        self.assertEqual(self._summary().total_amount, Decimal("100.00"))
+
+        out = StringIO()
+        call_command("rebuild_month_summaries", "--check", stdout=out)
+        self.assertIn("All month summaries are in sync", out.getvalue())
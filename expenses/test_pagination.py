@@ -0,0 +1,167 @@
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+from .models import Budget, BudgetMonth, Expense, ExpenseItem, Payee
+from .pagination import KeysetPaginator
+
+
+class KeysetPaginationTest(TestCase):
+    """Test keyset pagination of expenses, months and expense items."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget", start_date=date(2024, 1, 1)
+        )
+        self.payee = Payee.objects.create(name="Landlord")
+        self.expenses = [
+            self._create_expense(f"Expense {i}", date(2024, 1 + i // 3, 1 + i))
+            for i in range(7)
+        ]
+        # Same created_at everywhere, so only the id keeps positions unique
+        Expense.objects.update(created_at=timezone.now())
+
+    def _create_expense(self, title, start_date, **kwargs):
+        return Expense.objects.create(
+            budget=self.budget,
+            title=title,
+            expense_type=Expense.TYPE_ONE_TIME,
+            amount=Decimal("10.00"),
+            start_date=start_date,
+            day_of_month=1,
+            **kwargs,
+        )
+
+    def _paginator(self, per_page=3):
+        return KeysetPaginator(
+            Expense.objects.filter(budget=self.budget),
+            ("-start_date", "-created_at", "-id"),
+            per_page,
+        )
+
+    def _titles(self, page):
+        return [expense.title for expense in page]
+
+    def test_pages_forward_and_back(self):
+        """Test that next and previous cursors walk through every row once"""
+        paginator = self._paginator()
+        expected = [e.title for e in sorted(self.expenses, key=lambda e: e.start_date)]
+        expected.reverse()
+
+        pages = [paginator.get_page()]
+        while pages[-1].has_next:
+            pages.append(paginator.get_page({"after": pages[-1].next_cursor}))
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertFalse(pages[0].has_previous)
+        self.assertEqual(sum((self._titles(page) for page in pages), []), expected)
+
+        previous = paginator.get_page({"before": pages[-1].previous_cursor})
+        self.assertEqual(self._titles(previous), self._titles(pages[1]))
+        self.assertTrue(previous.has_previous)
+        self.assertTrue(previous.has_next)
+
+    def test_short_previous_page_returns_first_page(self):
+        """Test that paging back to the start shows a full first page"""
+        paginator = self._paginator()
+        second = paginator.get_page({"after": paginator.get_page().next_cursor})
+        self.expenses[5].delete()
+
+        page = paginator.get_page({"before": second.previous_cursor})
+
+        self.assertEqual(self._titles(page), ["Expense 6", "Expense 4", "Expense 3"])
+        self.assertFalse(page.has_previous)
+
+    def test_invalid_cursor_returns_first_page(self):
+        """Test that malformed cursors fall back to the first page"""
+        paginator = self._paginator()
+        first = self._titles(paginator.get_page())
+
+        for cursor in ("!!!", "bm90IGpzb24", "WzFd", "WyJ4IiwieSIsInoiXQ"):
+            self.assertEqual(self._titles(paginator.get_page({"after": cursor})), first)
+
+    def test_page_links_keep_filters(self):
+        """Test that page links keep other GET parameters"""
+        page = self._paginator().get_page({"type": "one_time", "after": "stale"})
+
+        self.assertTrue(page.next_query.startswith("?type=one_time&after="))
+        self.assertEqual(page.previous_query, "")
+
+    def test_expense_list_keeps_month_grouping(self):
+        """Test that a month split across pages is marked as continued"""
+        url = reverse("expense_list", args=[self.budget.id])
+        with patch("expenses.views.expense.EXPENSES_PER_PAGE", 2):
+            first = self.client.get(url, {"type": Expense.TYPE_ONE_TIME})
+            page = first.context["page"]
+            second = self.client.get(url + page.next_query)
+
+        self.assertEqual(
+            list(first.context["grouped_expenses"]), ["2024-03", "2024-02"]
+        )
+        self.assertIsNone(first.context["continued_month"])
+        self.assertIn("type=one_time&amp;after=", first.content.decode())
+        self.assertEqual(list(second.context["grouped_expenses"]), ["2024-02"])
+        self.assertEqual(second.context["continued_month"], "2024-02")
+        self.assertContains(second, "(continued)", count=1)
+        # Count covers all pages of the filtered list
+        self.assertEqual(second.context["expense_count"], 7)
+        self.assertContains(second, "Expenses (7 found)")
+
+    def test_expense_list_month_boundary_not_continued(self):
+        """Test that a page starting a new month is not marked as continued"""
+        url = reverse("expense_list", args=[self.budget.id])
+        with patch("expenses.views.expense.EXPENSES_PER_PAGE", 1):
+            first = self.client.get(url)
+            second = self.client.get(url + first.context["page"].next_query)
+
+        self.assertEqual(list(second.context["grouped_expenses"]), ["2024-02"])
+        self.assertIsNone(second.context["continued_month"])
+
+    def test_month_list_paginated(self):
+        """Test that months are paged newest first"""
+        for month in (1, 2, 3):
+            BudgetMonth.objects.create(budget=self.budget, year=2024, month=month)
+        url = reverse("month_list", args=[self.budget.id])
+
+        with patch("expenses.views.month.MONTHS_PER_PAGE", 2):
+            first = self.client.get(url)
+            second = self.client.get(url + first.context["page"].next_query)
+
+        self.assertEqual(
+            [str(m) for m in first.context["months"]], ["2024-03", "2024-02"]
+        )
+        self.assertEqual([str(m) for m in second.context["months"]], ["2024-01"])
+        self.assertEqual(second.context["month_count"], 3)
+        self.assertContains(first, "Months (3)")
+
+    def test_expense_detail_items_paginated(self):
+        """Test that expense item history is paged by due date"""
+        expense = self.expenses[0]
+        for month in (1, 2, 3):
+            budget_month = BudgetMonth.objects.create(
+                budget=self.budget, year=2025, month=month
+            )
+            ExpenseItem.objects.create(
+                expense=expense,
+                month=budget_month,
+                due_date=date(2025, month, 1),
+                amount=Decimal("10.00"),
+            )
+        url = reverse("expense_detail", args=[self.budget.id, expense.pk])
+
+        with patch("expenses.views.expense.EXPENSE_ITEMS_PER_PAGE", 2):
+            first = self.client.get(url)
+            second = self.client.get(url + first.context["page"].next_query)
+
+        self.assertEqual(
+            [item.due_date.month for item in first.context["expense_items"]], [1, 2]
+        )
+        self.assertEqual(
+            [item.due_date.month for item in second.context["expense_items"]], [3]
+        )
+        self.assertContains(second, "Expense Items (3)")
+        self.assertContains(second, 'rel="prev"')
+        self.assertNotContains(second, 'rel="next"')
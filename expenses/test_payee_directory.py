@@ -0,0 +1,137 @@
+from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from datetime import date
+from decimal import Decimal
+from .forms import ExpenseForm, QuickExpenseForm
+from .models import Budget, Expense, Payee
+from .services import PayeeDirectoryService
+
+
+class PayeeDirectoryTest(TestCase):
+    """Test annotated payee expense counts and the cached payee directory."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(name="Test Budget", start_date=date.today())
+        self.busy = Payee.objects.create(name="Busy Payee")
+        self.idle = Payee.objects.create(name="Idle Payee")
+        self.hidden = Payee.objects.create(
+            name="Hidden Payee", hidden_at=timezone.now()
+        )
+        for index in range(3):
+            self._create_expense(f"Expense {index}", self.busy)
+
+    def _create_expense(self, title, payee):
+        return Expense.objects.create(
+            budget=self.budget,
+            title=title,
+            payee=payee,
+            expense_type=Expense.TYPE_ENDLESS_RECURRING,
+            amount=Decimal("10.00"),
+            start_date=date.today(),
+            day_of_month=1,
+        )
+
+    def test_with_expense_counts(self):
+        """Test that expense counts are annotated in one query"""
+        with self.assertNumQueries(1):
+            counts = {
+                payee.name: payee.expense_count
+                for payee in Payee.objects.with_expense_counts()
+            }
+
+        self.assertEqual(counts, {"Busy Payee": 3, "Hidden Payee": 0, "Idle Payee": 0})
+
+    def test_can_be_deleted_uses_annotation(self):
+        """Test that can_be_deleted() uses annotated expense count"""
+        payees = {payee.name: payee for payee in Payee.objects.with_expense_counts()}
+
+        with self.assertNumQueries(0):
+            self.assertFalse(payees["Busy Payee"].can_be_deleted())
+            self.assertTrue(payees["Idle Payee"].can_be_deleted())
+            self.assertFalse(payees["Hidden Payee"].can_be_deleted())
+
+    def test_directory_is_cached(self):
+        """Test that repeated directory reads only look up the data version"""
+        PayeeDirectoryService.get_payees()
+
+        with self.assertNumQueries(2):
+            payees = PayeeDirectoryService.get_payees()
+            choices = PayeeDirectoryService.get_choices()
+
+        self.assertEqual([payee.name for payee in payees], ["Busy Payee", "Idle Payee"])
+        self.assertEqual(
+            choices, [(self.busy.pk, "Busy Payee"), (self.idle.pk, "Idle Payee")]
+        )
+
+    def test_directory_includes_hidden_on_request(self):
+        """Test that hidden payees are listed only when requested"""
+        names = [payee.name for payee in PayeeDirectoryService.get_payees(True)]
+
+        self.assertEqual(names, ["Busy Payee", "Hidden Payee", "Idle Payee"])
+
+    def test_payee_changes_invalidate_directory(self):
+        """Test that creating and hiding payees invalidates the directory"""
+        PayeeDirectoryService.get_payees()
+
+        new_payee = Payee.objects.create(name="New Payee")
+        self.assertIn(new_payee, PayeeDirectoryService.get_payees())
+
+        new_payee.hidden_at = timezone.now()
+        new_payee.save()
+        self.assertNotIn(new_payee, PayeeDirectoryService.get_payees())
+
+        self.idle.delete()
+        self.assertNotIn(self.idle, PayeeDirectoryService.get_payees())
+
+    def test_expense_changes_invalidate_counts(self):
+        """Test that creating and deleting expenses refreshes expense counts"""
+        PayeeDirectoryService.get_payees()
+
+        expense = self._create_expense("Another", self.idle)
+        counts = {p.name: p.expense_count for p in PayeeDirectoryService.get_payees()}
+        self.assertEqual(counts["Idle Payee"], 1)
+
+        expense.delete()
+        counts = {p.name: p.expense_count for p in PayeeDirectoryService.get_payees()}
+        self.assertEqual(counts["Idle Payee"], 0)
+
+    def test_forms_use_directory_choices(self):
+        """Test that payee dropdowns are rendered from the directory"""
+        expected = [
+            ("", "Select payee (optional)"),
+            (self.busy.pk, "Busy Payee"),
+            (self.idle.pk, "Idle Payee"),
+        ]
+
+        self.assertEqual(
+            list(ExpenseForm(budget=self.budget).fields["payee"].choices), expected
+        )
+        self.assertEqual(list(QuickExpenseForm().fields["payee"].choices), expected)
+
+    def test_forms_validate_against_visible_payees(self):
+        """Test that hidden payees are still rejected on submission"""
+        form = QuickExpenseForm(
+            data={"title": "Coffee", "amount": "5.00", "payee": self.hidden.pk}
+        )
+
+        self.assertFalse(form.is_valid())
+        self.assertIn("payee", form.errors)
+
+    def test_payee_list_query_count_does_not_grow_with_payees(self):
+        """Test that payee list costs the same queries for any payee count"""
+        url = reverse("payee_list")
+        self.client.get(url)  # Warm up settings cache
+        with CaptureQueriesContext(connection) as few_payees:
+            self.client.get(url + "?show_hidden=true")
+
+        for index in range(10):
+            payee = Payee.objects.create(name=f"Payee {index}")
+            self._create_expense(f"Payee {index} expense", payee)
+
+        with self.assertNumQueries(len(few_payees.captured_queries)):
+            response = self.client.get(url + "?show_hidden=true")
+        self.assertEqual(len(response.context["payees"]), 13)
@@ -0,0 +1,256 @@
+from django.test import TestCase
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from .models import Budget, BudgetMonth, Expense, ExpenseItem, Payment
+
+
+class PaymentTotalsTest(TestCase):
+    """Test denormalized paid_total and payment_count on ExpenseItem."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget",
+            start_date=date(2024, 1, 1),
+            initial_amount=Decimal("1000.00"),
+        )
+        self.month = BudgetMonth.objects.create(budget=self.budget, year=2024, month=1)
+        self.expense = Expense.objects.create(
+            budget=self.budget,
+            title="Rent",
+            expense_type=Expense.TYPE_ENDLESS_RECURRING,
+            amount=Decimal("100.00"),
+            start_date=date(2024, 1, 1),
+            day_of_month=1,
+        )
+        self.item = ExpenseItem.objects.create(
+            expense=self.expense,
+            month=self.month,
+            due_date=date(2024, 1, 1),
+            amount=Decimal("100.00"),
+        )
+
+    def _pay(self, amount, item=None):
+        return Payment.objects.create(
+            expense_item=item or self.item,
+            amount=Decimal(amount),
+            payment_date=timezone.now(),
+        )
+
+    def test_new_item_has_zero_totals(self):
+        """Test that a new expense item starts with no payments"""
+        self.assertEqual(self.item.paid_total, Decimal("0.00"))
+        self.assertEqual(self.item.payment_count, 0)
+        self.assertEqual(self.item.status, ExpenseItem.STATUS_PENDING)
+
+    def test_payment_create_updates_totals(self):
+        """Test that creating payments updates stored totals"""
+        self._pay("30.00")
+        self._pay("70.00")
+
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.paid_total, Decimal("100.00"))
+        self.assertEqual(self.item.payment_count, 2)
+        self.assertEqual(self.item.status, ExpenseItem.STATUS_PAID)
+
+    def test_payment_create_updates_cached_instance(self):
+        """Test that the in-memory expense item reflects the new payment"""
+        self._pay("40.00")
+
+        self.assertEqual(self.item.get_total_paid(), Decimal("40.00"))
+        self.assertEqual(self.item.get_remaining_amount(), Decimal("-60.00"))
+        self.assertEqual(self.item.get_payment_count(), 1)
+
+    def test_payment_amount_change_updates_totals(self):
+        """Test that editing payment amount updates stored totals"""
+        payment = self._pay("40.00")
+        payment.amount = Decimal("100.00")
+        payment.save()
+
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.paid_total, Decimal("100.00"))
+        self.assertEqual(self.item.payment_count, 1)
+
+    def test_payment_move_updates_both_items(self):
+        """Test that moving payment to another item updates both items"""
+        other_item = ExpenseItem.objects.create(
+            expense=self.expense,
+            month=self.month,
+            due_date=date(2024, 1, 15),
+            amount=Decimal("50.00"),
+        )
+        payment = self._pay("50.00")
+        payment.expense_item = other_item
+        payment.save()
+
+        self.item.refresh_from_db()
+        other_item.refresh_from_db()
+        self.assertEqual(self.item.paid_total, Decimal("0.00"))
+        self.assertEqual(self.item.payment_count, 0)
+        self.assertEqual(other_item.paid_total, Decimal("50.00"))
+        self.assertEqual(other_item.payment_count, 1)
+
+    def test_payment_delete_updates_totals(self):
+        """Test that deleting payment updates stored totals"""
+        payment = self._pay("40.00")
+        self._pay("10.00")
+        payment.delete()
+
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.paid_total, Decimal("10.00"))
+        self.assertEqual(self.item.payment_count, 1)
+
+    def test_item_save_does_not_overwrite_totals(self):
+        """Test that saving a stale item instance keeps stored totals intact"""
+        stale_item = ExpenseItem.objects.get(pk=self.item.pk)
+        self._pay("40.00")
+
+        stale_item.due_date = date(2024, 1, 20)
+        stale_item.save()
+
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.due_date, date(2024, 1, 20))
+        self.assertEqual(self.item.paid_total, Decimal("40.00"))
+        self.assertEqual(self.item.payment_count, 1)
+
+    def test_status_does_not_query(self):
+        """Test that status and remaining amount read stored values"""
+        self._pay("100.00")
+        item = ExpenseItem.objects.get(pk=self.item.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(item.status, ExpenseItem.STATUS_PAID)
+            self.assertEqual(item.get_remaining_amount(), Decimal("0.00"))
+            self.assertEqual(item.get_payment_count(), 1)
+
+    def test_unpay_view_resets_totals(self):
+        """Test that removing all payments via the view resets totals"""
+        self._pay("60.00")
+        self._pay("40.00")
+
+        response = self.client.post(
+            reverse("expense_item_unpay", args=[self.budget.id, self.item.pk])
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.paid_total, Decimal("0.00"))
+        self.assertEqual(self.item.payment_count, 0)
+
+    def test_rebuild_command_fixes_out_of_sync_totals(self):
+        """Test that rebuild_payment_totals command repairs corrupted totals"""
+        self._pay("60.00")
+        ExpenseItem.objects.filter(pk=self.item.pk).update(
+            paid_total=Decimal("5.00"), payment_count=7
+        )
+
+        out = StringIO()
+        call_command("rebuild_payment_totals", "--check", stdout=out)
+        self.assertIn("1 expense item(s) with out-of-sync", out.getvalue())
+
+        out = StringIO()
+        call_command("rebuild_payment_totals", stdout=out)
+        self.assertIn("1 were out of sync", out.getvalue())
+
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.paid_total, Decimal("60.00"))
+        self.assertEqual(self.item.payment_count, 1)
+
+    def test_rebuild_command_check_reports_in_sync(self):
+        """Test that --check reports success when totals are in sync"""
+        self._pay("60.00")
+
+        out = StringIO()
+        call_command("rebuild_payment_totals", "--check", stdout=out)
+        self.assertIn("All payment totals are in sync", out.getvalue())
+
+
+class ExpenseItemPaymentAnnotationsTest(TestCase):
+    """Test ExpenseItem.objects.with_payment_totals() annotations."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget",
+            start_date=date(2024, 1, 1),
+            initial_amount=Decimal("1000.00"),
+        )
+        self.month = BudgetMonth.objects.create(budget=self.budget, year=2024, month=1)
+
+    def _create_items(self, count):
+        items = []
+        for index in range(count):
+            expense = Expense.objects.create(
+                budget=self.budget,
+                title=f"Expense {index}",
+                expense_type=Expense.TYPE_ENDLESS_RECURRING,
+                amount=Decimal("100.00"),
+                start_date=date(2024, 1, 1),
+                day_of_month=1,
+            )
+            items.append(
+                ExpenseItem.objects.create(
+                    expense=expense,
+                    month=self.month,
+                    due_date=date(2024, 1, 1),
+                    amount=Decimal("100.00"),
+                )
+            )
+        return items
+
+    def test_annotations_match_payments(self):
+        """Test that annotations reflect payment totals and status"""
+        paid, partial, unpaid = self._create_items(3)
+        Payment.objects.create(
+            expense_item=paid, amount=Decimal("100.00"), payment_date=timezone.now()
+        )
+        Payment.objects.create(
+            expense_item=partial, amount=Decimal("30.00"), payment_date=timezone.now()
+        )
+        Payment.objects.create(
+            expense_item=partial, amount=Decimal("20.00"), payment_date=timezone.now()
+        )
+
+        items = {item.pk: item for item in ExpenseItem.objects.with_payment_totals()}
+
+        with self.assertNumQueries(0):
+            self.assertEqual(items[paid.pk].status, ExpenseItem.STATUS_PAID)
+            self.assertEqual(items[paid.pk].get_payment_count(), 1)
+            self.assertEqual(items[partial.pk].status, ExpenseItem.STATUS_PENDING)
+            self.assertEqual(items[partial.pk].get_total_paid(), Decimal("50.00"))
+            self.assertEqual(items[partial.pk].get_payment_count(), 2)
+            self.assertEqual(items[unpaid.pk].get_total_paid(), Decimal("0.00"))
+            self.assertEqual(
+                items[unpaid.pk].get_remaining_amount(), Decimal("-100.00")
+            )
+
+    def test_annotations_dropped_after_new_payment(self):
+        """Test that recording a payment invalidates stale annotations"""
+        (item,) = self._create_items(1)
+        annotated_item = ExpenseItem.objects.with_payment_totals().get(pk=item.pk)
+
+        Payment.objects.create(
+            expense_item=annotated_item,
+            amount=Decimal("100.00"),
+            payment_date=timezone.now(),
+        )
+
+        self.assertEqual(annotated_item.status, ExpenseItem.STATUS_PAID)
+        self.assertEqual(annotated_item.get_payment_count(), 1)
+
+    def test_month_detail_query_count_does_not_grow_with_rows(self):
+        """Test that month detail costs the same number of queries for any row count"""
+        url = reverse("month_detail", args=[self.budget.id, 2024, 1])
+        self._create_items(2)
+        self.client.get(url)  # Warm up settings cache
+        with CaptureQueriesContext(connection) as small_page:
+            self.client.get(url)
+        self._create_items(10)
+        with self.assertNumQueries(len(small_page.captured_queries)):
+            self.client.get(url)
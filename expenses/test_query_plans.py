@@ -0,0 +1,169 @@
+import re
+from unittest import skipUnless
+from unittest.mock import patch
+from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from datetime import date
+from decimal import Decimal
+from .models import Budget, BudgetMonth, Expense, ExpenseItem, Payee, Payment
+from .services import process_months_until
+
+# Plan rows like "SCAN expenses_payee" read the whole table; with an index
+# the row reads "SEARCH ... USING INDEX" or "SCAN ... USING [COVERING] INDEX"
+FULL_SCAN_RE = re.compile(r"^SCAN (?!CONSTANT ROW)(\S+)$")
+
+
+@skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN is SQLite specific")
+class QueryPlanTest(TestCase):
+    """Test that hot queries are served by indexes instead of table scans."""
+
+    def setUp(self):
+        """Set up test data"""
+        cache.clear()
+        self.budget = Budget.objects.create(
+            name="Test Budget", start_date=date(2024, 1, 1)
+        )
+        self.payee = Payee.objects.create(name="Landlord")
+        Payee.objects.create(name="Old Payee", hidden_at=timezone.now())
+        self.months = [
+            BudgetMonth.objects.create(budget=self.budget, year=2024, month=month)
+            for month in (1, 2)
+        ]
+        self.expense = Expense.objects.create(
+            budget=self.budget,
+            payee=self.payee,
+            title="Rent",
+            expense_type=Expense.TYPE_ENDLESS_RECURRING,
+            amount=Decimal("100.00"),
+            start_date=date(2024, 1, 1),
+            day_of_month=1,
+        )
+        for month in self.months:
+            item = ExpenseItem.objects.create(
+                expense=self.expense,
+                month=month,
+                due_date=date(month.year, month.month, 1),
+                amount=Decimal("100.00"),
+            )
+        Payment.objects.create(
+            expense_item=item, amount=Decimal("50.00"), payment_date=timezone.now()
+        )
+
+    def _capture_plans(self, flow):
+        """Run flow and return (sql, plan rows) of each SELECT it executed."""
+        with CaptureQueriesContext(connection) as context:
+            flow()
+
+        plans = []
+        for query in context.captured_queries:
+            sql = query["sql"]
+            if not sql.startswith("SELECT"):
+                continue
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+                plans.append((sql, [row[3] for row in cursor.fetchall()]))
+        return plans
+
+    def _assert_no_full_scans(self, flow, expected_indexes=()):
+        plans = self._capture_plans(flow)
+        self.assertTrue(plans)
+
+        full_scans = [
+            f"{sql}\n  -> {detail}"
+            for sql, rows in plans
+            for detail in rows
+            if FULL_SCAN_RE.match(detail)
+        ]
+        self.assertEqual(full_scans, [], "Queries fall back to full table scans")
+
+        used = " ".join(detail for _sql, rows in plans for detail in rows)
+        for index_name in expected_indexes:
+            self.assertIn(f"INDEX {index_name} ", used)
+
+    def test_dashboard(self):
+        """Test dashboard queries"""
+        self._assert_no_full_scans(
+            lambda: self.client.get(reverse("dashboard", args=[self.budget.id])),
+            ["payee_hidden_name_idx"],
+        )
+
+    def test_month_list(self):
+        """Test month list queries"""
+        self._assert_no_full_scans(
+            lambda: self.client.get(reverse("month_list", args=[self.budget.id]))
+        )
+
+    def test_month_detail(self):
+        """Test month detail queries"""
+        self._assert_no_full_scans(
+            lambda: self.client.get(
+                reverse("month_detail", args=[self.budget.id, 2024, 2])
+            )
+        )
+
+    def test_expense_list(self):
+        """Test expense list queries"""
+        self._assert_no_full_scans(
+            lambda: self.client.get(reverse("expense_list", args=[self.budget.id])),
+            ["expense_budget_start_idx"],
+        )
+
+    def test_expense_list_next_page(self):
+        """Test expense list queries of a later keyset page"""
+        Expense.objects.create(
+            budget=self.budget,
+            title="Phone",
+            expense_type=Expense.TYPE_ONE_TIME,
+            amount=Decimal("10.00"),
+            start_date=date(2024, 2, 1),
+            day_of_month=1,
+        )
+        url = reverse("expense_list", args=[self.budget.id])
+        with patch("expenses.views.expense.EXPENSES_PER_PAGE", 1):
+            page = self.client.get(url).context["page"]
+            self._assert_no_full_scans(
+                lambda: self.client.get(url + page.next_query),
+                ["expense_budget_start_idx"],
+            )
+
+    def test_payee_list(self):
+        """Test visible payee list queries"""
+        self._assert_no_full_scans(
+            lambda: self.client.get(reverse("payee_list")), ["payee_hidden_name_idx"]
+        )
+
+    def test_month_rollover(self):
+        """Test queries creating new months and their expense items"""
+        self._assert_no_full_scans(
+            lambda: process_months_until(self.budget, 2024, 4),
+            ["expense_budget_start_idx"],
+        )
+
+    def test_no_redundant_foreign_key_indexes(self):
+        """Test that foreign keys leading a composite index have no own index"""
+        for model, column in (
+            (Expense, "budget_id"),
+            (ExpenseItem, "expense_id"),
+            (ExpenseItem, "month_id"),
+            (Payment, "expense_item_id"),
+        ):
+            with connection.cursor() as cursor:
+                constraints = connection.introspection.get_constraints(
+                    cursor, model._meta.db_table
+                )
+            single_column = [
+                name
+                for name, info in constraints.items()
+                if info["index"] and info["columns"] == [column]
+            ]
+            leading = [
+                name
+                for name, info in constraints.items()
+                if info["index"] and info["columns"][:1] == [column]
+            ]
+            self.assertEqual(single_column, [], model._meta.db_table)
+            self.assertTrue(leading, model._meta.db_table)
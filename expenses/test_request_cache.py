@@ -0,0 +1,150 @@
+from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from datetime import date
+from decimal import Decimal
+from . import request_cache
+from .models import Budget, BudgetMonth, Expense, ExpenseItem
+from .services import process_months_until
+
+
+class RequestCacheTest(TestCase):
+    """Test request-scoped memoization of budget and month lookups."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget",
+            start_date=date(2024, 1, 1),
+            initial_amount=Decimal("1000.00"),
+        )
+        self.month = BudgetMonth.objects.create(budget=self.budget, year=2024, month=1)
+        self.token = request_cache.activate()
+
+    def tearDown(self):
+        """Drop request cache"""
+        request_cache.deactivate(self.token)
+
+    def test_get_or_set_without_active_cache_always_calls_factory(self):
+        """Test that nothing is memoized outside of a request"""
+        request_cache.deactivate(self.token)
+        calls = []
+        try:
+            request_cache.get_or_set("key", lambda: calls.append(1))
+            request_cache.get_or_set("key", lambda: calls.append(1))
+            self.assertFalse(request_cache.is_active())
+        finally:
+            self.token = request_cache.activate()
+
+        self.assertEqual(len(calls), 2)
+
+    def test_get_most_recent_is_memoized(self):
+        """Test that most recent month is fetched once per request"""
+        with self.assertNumQueries(1):
+            first = BudgetMonth.get_most_recent(budget=self.budget)
+            second = BudgetMonth.get_most_recent(budget=self.budget.pk)
+
+        self.assertEqual(first, self.month)
+        self.assertIs(first, second)
+
+    def test_month_save_and_delete_invalidate_most_recent(self):
+        """Test that creating or deleting months drops memoized lookup"""
+        BudgetMonth.get_most_recent(budget=self.budget)
+
+        february = BudgetMonth.objects.create(budget=self.budget, year=2024, month=2)
+        self.assertEqual(BudgetMonth.get_most_recent(budget=self.budget), february)
+
+        february.delete()
+        self.assertEqual(BudgetMonth.get_most_recent(budget=self.budget), self.month)
+
+    def test_catch_up_invalidates_most_recent(self):
+        """Test that bulk-created months drop memoized lookup"""
+        BudgetMonth.get_most_recent(budget=self.budget)
+
+        process_months_until(self.budget, 2024, 3)
+
+        most_recent = BudgetMonth.get_most_recent(budget=self.budget)
+        self.assertEqual((most_recent.year, most_recent.month), (2024, 3))
+
+    def test_get_budget_is_memoized(self):
+        """Test that budget is fetched once per request"""
+        with self.assertNumQueries(1):
+            self.assertEqual(request_cache.get_budget(self.budget.pk), self.budget)
+            self.assertEqual(request_cache.get_budget(str(self.budget.pk)), self.budget)
+
+        self.assertIsNone(request_cache.get_budget(9999))
+
+    def test_budget_save_invalidates_budget(self):
+        """Test that saving a budget drops memoized lookup"""
+        request_cache.get_budget(self.budget.pk)
+
+        self.budget.name = "Renamed"
+        self.budget.save()
+
+        self.assertEqual(request_cache.get_budget(self.budget.pk).name, "Renamed")
+
+
+class RequestCacheMiddlewareTest(TestCase):
+    """Test that views share memoized lookups within a request."""
+
+    def setUp(self):
+        """Set up test data"""
+        self.budget = Budget.objects.create(
+            name="Test Budget",
+            start_date=date(2024, 1, 1),
+            initial_amount=Decimal("1000.00"),
+        )
+        self.month = BudgetMonth.objects.create(budget=self.budget, year=2024, month=1)
+        self.expense = Expense.objects.create(
+            budget=self.budget,
+            title="Groceries",
+            expense_type=Expense.TYPE_ONE_TIME,
+            amount=Decimal("10.00"),
+            start_date=date(2024, 1, 1),
+            day_of_month=10,
+        )
+        self.url = reverse("month_detail", args=[self.budget.id, 2024, 1])
+
+    def _create_items(self, count):
+        for _ in range(count):
+            ExpenseItem.objects.create(
+                expense=self.expense,
+                month=self.month,
+                due_date=date(2024, 1, 10),
+                amount=Decimal("10.00"),
+            )
+
+    def _budget_queries(self, queries):
+        table = Budget._meta.db_table
+        return [
+            query
+            for query in queries
+            if f'FROM "{table}"' in query["sql"] and "JOIN" not in query["sql"]
+        ]
+
+    def test_cache_is_not_shared_between_requests(self):
+        """Test that each request starts with an empty cache"""
+        self.client.get(self.url)
+
+        self.assertFalse(request_cache.is_active())
+
+    def test_budget_fetched_once_per_request(self):
+        """Test that view and current_budget context processor share budget"""
+        self.client.get(self.url)  # Warm up settings cache
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.context["current_budget"], self.budget)
+        self.assertEqual(len(self._budget_queries(queries.captured_queries)), 1)
+
+    def test_query_count_does_not_grow_with_deletable_rows(self):
+        """Test that per-row can_be_deleted checks share most recent month"""
+        self._create_items(1)
+        self.client.get(self.url)  # Warm up settings cache
+        with CaptureQueriesContext(connection) as few_items:
+            self.client.get(self.url)
+
+        self._create_items(10)
+        with self.assertNumQueries(len(few_items.captured_queries)):
+            self.client.get(self.url)
@@ -75,6 +75,38 @@ urlpatterns = [
         views.expense_item_delete,
         name="expense_item_delete",
     ),
+    # Import and Export (budget-scoped)
+    path(
+        "budgets/<int:budget_id>/import/",
+        views.expense_import,
+        name="expense_import",
+    ),
+    path(
+        "budgets/<int:budget_id>/export/<slug:dataset>.<slug:fmt>",
+        views.budget_export,
+        name="budget_export",
+    ),
+    # Read-only JSON API (budget-scoped, versioned)
+    path(
+        "budgets/<int:budget_id>/api/v1/summary/",
+        views.api_summary,
+        name="api_summary",
+    ),
+    path(
+        "budgets/<int:budget_id>/api/v1/months/",
+        views.api_months,
+        name="api_months",
+    ),
+    path(
+        "budgets/<int:budget_id>/api/v1/items/",
+        views.api_items,
+        name="api_items",
+    ),
+    path(
+        "budgets/<int:budget_id>/api/v1/payments/",
+        views.api_payments,
+        name="api_payments",
+    ),
     # Reference Data (no budget context needed)
     path("payees/", views.payee_list, name="payee_list"),
     path("payees/create/", views.payee_create, name="payee_create"),
@@ -98,7 +130,11 @@ urlpatterns = [
         views.payment_method_delete,
         name="payment_method_delete",
     ),
+    # Search (across all budgets)
+    path("search/", views.expense_search, name="expense_search"),
+    path("api/search/", views.expense_search_api, name="expense_search_api"),
     # Help System
     path("help/", views.help_index, name="help_index"),
+    path("help/search/", views.help_search, name="help_search"),
     path("help/<str:page_name>/", views.help_page, name="help_page"),
 ]
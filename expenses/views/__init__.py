@@ -34,7 +34,11 @@ from .payment_method import (
     payment_method_delete,
 )
 from .budget import budget_list, budget_create, budget_edit, budget_delete
-from .help import help_index, help_page
+from .search import expense_search, expense_search_api
+from .export import budget_export
+from .csv_import import expense_import
+from .api import api_summary, api_months, api_items, api_payments
+from .help import help_index, help_page, help_search
 from .error_handlers import custom_404
 
 # Make all view functions available when importing from expenses.views
@@ -75,9 +79,21 @@ __all__ = [
     "budget_create",
     "budget_edit",
     "budget_delete",
+    # Search views
+    "expense_search",
+    "expense_search_api",
+    # Export and import views
+    "budget_export",
+    "expense_import",
+    # JSON API views
+    "api_summary",
+    "api_months",
+    "api_items",
+    "api_payments",
     # Help views
     "help_index",
     "help_page",
+    "help_search",
     # Error handlers
     "custom_404",
 ]
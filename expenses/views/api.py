@@ -0,0 +1,54 @@
+from django.http import HttpResponse
+from ..request_cache import get_budget_or_404
+from ..api import BudgetApiService
+from .decorators import budget_conditional_get
+
+
+def _json_response(data, status=200):
+    return HttpResponse(
+        BudgetApiService.dumps(data), content_type="application/json", status=status
+    )
+
+
+def _page_response(request, budget_id, get_page):
+    """Respond with a keyset page of rows, linking to neighbouring pages."""
+    budget = get_budget_or_404(budget_id)
+    try:
+        page = get_page(budget.pk, request.GET)
+    except ValueError as e:
+        return _json_response({"error": str(e)}, status=400)
+
+    return _json_response(
+        {
+            "results": page.items,
+            "next": request.path + page.next_query if page.has_next else None,
+            "previous": (
+                request.path + page.previous_query if page.has_previous else None
+            ),
+        }
+    )
+
+
+@budget_conditional_get
+def api_summary(request, budget_id):
+    """Return balance, most recent month totals and overdue items of a budget."""
+    budget = get_budget_or_404(budget_id)
+    return _json_response(BudgetApiService.get_summary(budget))
+
+
+@budget_conditional_get
+def api_months(request, budget_id):
+    """Return months of a budget with their totals, newest first."""
+    return _page_response(request, budget_id, BudgetApiService.get_months)
+
+
+@budget_conditional_get
+def api_items(request, budget_id):
+    """Return expense items of a budget with paid, remaining and status."""
+    return _page_response(request, budget_id, BudgetApiService.get_items)
+
+
+@budget_conditional_get
+def api_payments(request, budget_id):
+    """Return payments of a budget in the order they were recorded."""
+    return _page_response(request, budget_id, BudgetApiService.get_payments)
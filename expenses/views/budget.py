@@ -7,11 +7,8 @@ from ..forms import BudgetForm
 
 def budget_list(request):
     """List all budgets with current balance calculations"""
-    budgets = list(Budget.objects.all())
-
-    # Add balance calculation for each budget
-    for budget in budgets:
-        budget.current_balance = budget.get_current_balance()  # type: ignore[attr-defined]
+    # Balances are summed from month summaries for all budgets in one query
+    budgets = Budget.objects.with_balances(from_summaries=True)
 
     context = {
         "budgets": budgets,
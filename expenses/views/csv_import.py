@@ -0,0 +1,46 @@
+from django.contrib import messages
+from django.shortcuts import render
+import csv
+import io
+from ..forms import CsvImportForm
+from ..request_cache import get_budget_or_404
+from ..csv_import import CsvExpenseImporter
+
+
+def expense_import(request, budget_id):
+    """Import historical expenses and payments of a budget from a CSV upload"""
+    budget = get_budget_or_404(budget_id)
+    result = None
+
+    if request.method == "POST":
+        form = CsvImportForm(request.POST, request.FILES)
+        if form.is_valid():
+            # Decode the upload while reading, without loading it into memory
+            lines = io.TextIOWrapper(
+                form.cleaned_data["file"].file, encoding="utf-8-sig", newline=""
+            )
+            try:
+                result = CsvExpenseImporter(budget).run(
+                    lines, dry_run=form.cleaned_data["dry_run"]
+                )
+            except (ValueError, csv.Error) as e:
+                # Also covers files that are not UTF-8 (UnicodeDecodeError)
+                form.add_error("file", str(e))
+            else:
+                action = "checked" if result.dry_run else "imported"
+                messages.success(
+                    request,
+                    f"{result.expenses} of {result.rows} row(s) {action}, "
+                    f"{result.error_count} skipped.",
+                )
+    else:
+        form = CsvImportForm()
+
+    context = {
+        "budget": budget,
+        "form": form,
+        "result": result,
+        "columns": CsvExpenseImporter.REQUIRED_COLUMNS
+        + CsvExpenseImporter.OPTIONAL_COLUMNS,
+    }
+    return render(request, "expenses/expense_import.html", context)
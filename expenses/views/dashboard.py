@@ -1,19 +1,28 @@
-from django.shortcuts import render, get_object_or_404, redirect
+from django.shortcuts import render, redirect
 from django.contrib import messages
-from django.db.models import Q as QueryFilter
 from django.db import transaction
 from datetime import date, datetime
 from collections import OrderedDict
-from ..models import ExpenseItem, BudgetMonth, Budget, Expense, Payment
+from ..models import (
+    ExpenseItem,
+    BudgetMonth,
+    BudgetMonthSummary,
+    Expense,
+    Payment,
+)
 from ..forms import QuickExpenseForm
+from ..month_calendar import get_month_grid
+from ..money import Money
+from ..request_cache import get_budget_or_404
+from .decorators import budget_conditional_get, cache_budget_page
 from ..services import SettingsService
 
 
+@budget_conditional_get
+@cache_budget_page()
 def dashboard(request, budget_id):
     """Display most recent active month summary with pending and paid payments for a specific budget"""
-    import calendar
-
-    budget = get_object_or_404(Budget, id=budget_id)
+    budget = get_budget_or_404(budget_id)
     current_date = date.today()
 
     # Handle quick expense form submission
@@ -28,7 +37,10 @@ def dashboard(request, budget_id):
 
     # Get the most recent month from database for this budget
     current_month = (
-        BudgetMonth.objects.filter(budget=budget).order_by("-year", "-month").first()
+        BudgetMonth.objects.filter(budget=budget)
+        .select_related("summary")
+        .order_by("-period")
+        .first()
     )
 
     if current_month:
@@ -36,26 +48,17 @@ def dashboard(request, budget_id):
         current_month_items = (
             ExpenseItem.objects.filter(month=current_month)
             .select_related("expense", "expense__payee")
+            .with_payment_totals()
             .order_by("due_date")
         )
 
-        # Get all pending expense items from past months
-        all_past_items = (
-            ExpenseItem.objects.filter(
-                QueryFilter(month__budget=budget, month__year__lt=current_month.year)
-                | QueryFilter(
-                    month__budget=budget,
-                    month__year=current_month.year,
-                    month__month__lt=current_month.month,
-                )
-            )
+        # Get pending expense items from past months, filtered in the database
+        past_pending_items = list(
+            ExpenseItem.objects.pending()
+            .filter(month__budget=budget, month__period__lt=current_month.period)
             .select_related("expense", "expense__payee", "month")
-            .order_by("-month__year", "-month__month", "due_date")
+            .order_by("-month__period", "due_date")
         )
-        # Filter to only pending items using property
-        past_pending_items = [
-            item for item in all_past_items if item.status == ExpenseItem.STATUS_PENDING
-        ]
 
         # Group all items by month for display with totals
         grouped_expense_items = OrderedDict()
@@ -65,44 +68,40 @@ def dashboard(request, budget_id):
         if current_month_items:
             current_month_key = f"{current_month.year}-{current_month.month:02d}"
             grouped_expense_items[current_month_key] = list(current_month_items)
-            month_totals[current_month_key] = sum(
+            month_totals[current_month_key] = Money.sum(
                 item.get_remaining_amount() for item in current_month_items
             )
 
-        # Add past months with pending items (already ordered by year/month desc)
+        # Add past months with pending items (already ordered by year/month desc),
+        # totalling remaining amounts as integer cents
+        month_cents = {}
         for item in past_pending_items:
             month_key = f"{item.month.year}-{item.month.month:02d}"
             if month_key not in grouped_expense_items:
                 grouped_expense_items[month_key] = []
-                month_totals[month_key] = 0
+                month_cents[month_key] = 0
             grouped_expense_items[month_key].append(item)
-            month_totals[month_key] += item.get_remaining_amount()
+            month_cents[month_key] += item.paid_total.cents - item.amount.cents
+        for month_key, cents in month_cents.items():
+            month_totals[month_key] = Money.from_cents(cents)
 
         # Keep as QuerySet for backward compatibility with template
         all_expense_items = current_month_items
 
-        # Separate current month items for counting and totals
-        pending_items = [
-            item
-            for item in current_month_items
-            if item.status == ExpenseItem.STATUS_PENDING
-        ]
-        paid_items = [
-            item
-            for item in current_month_items
-            if item.status == ExpenseItem.STATUS_PAID
-        ]
-
-        total_pending = sum(item.get_remaining_amount() for item in pending_items)
-        total_paid = sum(item.get_remaining_amount() for item in paid_items)
-        total_month = total_pending + total_paid
+        # Current month totals come from the materialized month summary
+        # (remaining amounts: negative = still owed, positive = overpaid)
+        summary = BudgetMonthSummary.for_month(current_month)
+        total_pending = -summary.pending_amount
+        total_month = summary.paid_amount - summary.total_amount
+        total_paid = total_month - total_pending
+        paid_count = summary.paid_count
+        pending_count = summary.pending_count
 
         # Calendar data
         # Get days with unpaid items in current month
-        all_current_items = current_month.expenseitem_set.filter(due_date__isnull=False)
         unpaid_days = [
             item.due_date.day
-            for item in all_current_items
+            for item in current_month_items
             if item.due_date and item.status == ExpenseItem.STATUS_PENDING
         ]
         due_days = set(unpaid_days)
@@ -120,8 +119,8 @@ def dashboard(request, budget_id):
     else:
         # No months exist in the system
         all_expense_items = ExpenseItem.objects.none()
-        pending_items = []
-        paid_items = []
+        paid_count = 0
+        pending_count = 0
         total_pending = 0
         total_paid = 0
         total_month = 0
@@ -129,25 +128,22 @@ def dashboard(request, budget_id):
         grouped_expense_items = OrderedDict()
         month_totals = {}
 
-    # Build calendar weeks (Monday start) - show most recent month if available
-    calendar.setfirstweekday(calendar.MONDAY)
+    # Calendar of the most recent month if available, current month otherwise
     if current_month:
-        cal = calendar.monthcalendar(current_month.year, current_month.month)
         display_year = current_month.year
         display_month = current_month.month
     else:
-        # Fallback to current calendar month if no months exist
-        cal = calendar.monthcalendar(current_date.year, current_date.month)
         display_year = current_date.year
         display_month = current_date.month
+    month_grid = get_month_grid(display_year, display_month, current_date)
 
     # Create normalized summary data for the include
     dashboard_summary = {
         "total": total_month,
         "paid": total_paid,
         "pending": total_pending,
-        "paid_count": len(paid_items),
-        "pending_count": len(pending_items),
+        "paid_count": paid_count,
+        "pending_count": pending_count,
     }
 
     # Get current weekday (0=Monday, 6=Sunday)
@@ -190,10 +186,10 @@ def dashboard(request, budget_id):
         "not_has_any_months": not has_any_months,
         "not_current_month": current_month is None,
         # Calendar context
-        "calendar_weeks": cal,
+        "calendar_weeks": month_grid.weeks,
         "due_days": due_days,
         "today": current_date,
-        "month_name": calendar.month_name[display_month],
+        "month_name": month_grid.month_name,
         "year": display_year,
         "current_weekday": current_weekday,
         # Display month context for proper date highlighting
@@ -209,7 +205,7 @@ def dashboard(request, budget_id):
 
 def handle_quick_expense(request, budget_id):
     """Handle quick expense form submission"""
-    budget = get_object_or_404(Budget, id=budget_id)
+    budget = get_budget_or_404(budget_id)
     form = QuickExpenseForm(request.POST)
 
     if form.is_valid():
@@ -0,0 +1,145 @@
+"""Decorators shared by budget-scoped views."""
+
+import hashlib
+import re
+from datetime import date, datetime, time, timezone as dt_timezone
+from functools import wraps
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+
+from .. import request_cache
+from ..services import DataVersionService
+
+
+def _get_data_versions(request, budget_id) -> Optional[Tuple[int, int]]:
+    """
+    Get (budget version, global version) the response would be built from.
+
+    Returns None when the response must not be answered conditionally.
+    """
+    if request.method not in ("GET", "HEAD"):
+        return None
+    # Pending flash messages are rendered once, so the page must be built
+    if len(get_messages(request)):
+        return None
+
+    def fetch() -> Tuple[int, int]:
+        # The view needs the budget row anyway, so read its version from it
+        budget = request_cache.get_budget(budget_id)
+        return (
+            budget.data_version if budget is not None else 0,
+            DataVersionService.get_global_version(),
+        )
+
+    return request_cache.get_or_set(  # type: ignore[no-any-return]
+        ("data_version", budget_id), fetch
+    )
+
+
+def _budget_etag(request, budget_id, *args, **kwargs) -> Optional[str]:
+    versions = _get_data_versions(request, budget_id)
+    if versions is None:
+        return None
+
+    # Pages highlight today and overdue items, so they change daily as well
+    key = (
+        f"{budget_id}:{versions[0]}:{versions[1]}:{date.today()}:{settings.APP_VERSION}"
+    )
+    return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
+def _budget_last_modified(request, budget_id, *args, **kwargs) -> Optional[datetime]:
+    versions = _get_data_versions(request, budget_id)
+    if versions is None:
+        return None
+
+    changed_at = datetime.fromtimestamp(max(versions) / 1000, tz=dt_timezone.utc)
+    today_start = timezone.make_aware(datetime.combine(date.today(), time.min))
+    return max(changed_at, today_start)
+
+
+def budget_conditional_get(view_func):
+    """
+    Answer unchanged GET requests of budget-scoped views with 304 Not Modified.
+
+    ETag and Last-Modified are derived from DataVersionService versions,
+    so unchanged requests are answered after looking up the budget and
+    settings rows, before the view runs any of its own queries.
+    """
+    conditional_view = condition(
+        etag_func=_budget_etag, last_modified_func=_budget_last_modified
+    )(view_func)
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        response = conditional_view(request, *args, **kwargs)
+        if request.method in ("GET", "HEAD"):
+            # Always revalidate, so data changes show up on the next request
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    return wrapper
+
+
+# Per-request CSRF tokens are swapped for this placeholder in cached pages
+CSRF_PLACEHOLDER = b"__csrf_token_placeholder__"
+CSRF_TOKEN_RE = re.compile(rb'(name="csrfmiddlewaretoken" value=")[A-Za-z0-9]+(")')
+
+
+def cache_budget_page(timeout: int = 86400):
+    """
+    Cache rendered GET responses of a budget-scoped view server-side.
+
+    Cache key combines the budget and global data versions, read from the
+    database, with today's date, so entries become unreachable as soon as
+    budget data changes in any process or the day rolls over, and renders
+    are shared by all browsers. CSRF tokens
+    are stored as a placeholder and filled in for each request.
+
+    Args:
+        timeout: Seconds to keep rendered pages (default: one day)
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, budget_id, *args, **kwargs):
+            versions = _get_data_versions(request, budget_id)
+            if versions is None:
+                return view_func(request, budget_id, *args, **kwargs)
+
+            key = ":".join(
+                str(part)
+                for part in (
+                    "page",
+                    view_func.__name__,
+                    budget_id,
+                    *versions,
+                    date.today(),
+                    settings.APP_VERSION,
+                )
+            )
+            cached = cache.get(key)
+            if cached is not None:
+                content, content_type = cached
+                content = content.replace(CSRF_PLACEHOLDER, get_token(request).encode())
+                return HttpResponse(content, content_type=content_type)
+
+            response = view_func(request, budget_id, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming:
+                content = CSRF_TOKEN_RE.sub(
+                    rb"\1" + CSRF_PLACEHOLDER + rb"\2", response.content
+                )
+                cache.set(key, (content, response["Content-Type"]), timeout)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -1,21 +1,28 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
-from datetime import date
+from datetime import date, timedelta
 from collections import OrderedDict
 from typing import List
-from ..models import Expense, ExpenseItem, BudgetMonth, Payee, Budget
+from ..models import Expense, ExpenseItem, BudgetMonth, Payee
+from ..pagination import KeysetPaginator
+from ..request_cache import get_budget_or_404
+from .decorators import budget_conditional_get
 from ..forms import ExpenseForm
 
+EXPENSES_PER_PAGE = 50
+EXPENSE_ITEMS_PER_PAGE = 24
 
+
+@budget_conditional_get
 def expense_list(request, budget_id):
     """List active expenses with filtering options for a specific budget"""
-    budget = get_object_or_404(Budget, id=budget_id)
+    budget = get_budget_or_404(budget_id)
 
     # Get expenses that belong directly to this budget, ordered by start_date desc
     expenses = (
         Expense.objects.filter(closed_at__isnull=True, budget=budget)
         .select_related("payee")
-        .order_by("-start_date", "-created_at")
+        .with_paid_items()
     )
 
     # Simple filtering
@@ -27,21 +34,40 @@ def expense_list(request, budget_id):
     if payee_id:
         expenses = expenses.filter(payee_id=payee_id)
 
+    # Page through expenses by (start_date, created_at), id breaks ties
+    paginator = KeysetPaginator(
+        expenses, ("-start_date", "-created_at", "-id"), EXPENSES_PER_PAGE
+    )
+    page = paginator.get_page(request.GET)
+
     # Group expenses by year-month
     grouped_expenses: OrderedDict[str, List[Expense]] = OrderedDict()
-    for expense in expenses:
+    for expense in page:
         year_month = expense.start_date.strftime("%Y-%m")
         if year_month not in grouped_expenses:
             grouped_expenses[year_month] = []
         grouped_expenses[year_month].append(expense)
 
+    # First month group may continue one started on the previous page
+    continued_month = None
+    if page.has_previous:
+        first = page.items[0]
+        next_month_start = (
+            first.start_date.replace(day=1) + timedelta(days=32)
+        ).replace(day=1)
+        if paginator.preceding(first).filter(start_date__lt=next_month_start).exists():
+            continued_month = first.start_date.strftime("%Y-%m")
+
     # Only show non-hidden payees in the filter dropdown
     payees = Payee.objects.filter(hidden_at__isnull=True)
 
     context = {
         "budget": budget,
-        "expenses": expenses,
+        "expenses": page.items,
+        "expense_count": expenses.count(),
+        "page": page,
         "grouped_expenses": grouped_expenses,
+        "continued_month": continued_month,
         "payees": payees,
         "expense_types": Expense.EXPENSE_TYPES,
         "selected_type": expense_type,
@@ -52,7 +78,7 @@ def expense_list(request, budget_id):
 
 def expense_create(request, budget_id):
     """Create new expense with form validation"""
-    budget = get_object_or_404(Budget, id=budget_id)
+    budget = get_budget_or_404(budget_id)
 
     if request.method == "POST":
         form = ExpenseForm(request.POST, budget=budget)
@@ -71,9 +97,7 @@ def expense_create(request, budget_id):
     else:
         # Set default start date to current month's first day for this budget
         most_recent_month = (
-            BudgetMonth.objects.filter(budget=budget)
-            .order_by("-year", "-month")
-            .first()
+            BudgetMonth.objects.filter(budget=budget).order_by("-period").first()
         )
         if most_recent_month:
             default_date = date(most_recent_month.year, most_recent_month.month, 1)
@@ -90,15 +114,18 @@ def expense_create(request, budget_id):
 
 def expense_detail(request, budget_id, pk):
     """Display expense details and related items"""
-    budget = get_object_or_404(Budget, id=budget_id)
+    budget = get_budget_or_404(budget_id)
     expense = get_object_or_404(Expense, pk=pk, budget=budget)
 
-    # Get all expense items for this expense
+    # Page through expense items of this expense by due date
     expense_items = (
         ExpenseItem.objects.filter(expense=expense)
         .select_related("month")
-        .order_by("due_date")
+        .with_payment_totals()
     )
+    page = KeysetPaginator(
+        expense_items, ("due_date", "id"), EXPENSE_ITEMS_PER_PAGE
+    ).get_page(request.GET)
 
     # Get edit restrictions for the template
     edit_restrictions = expense.get_edit_restrictions()
@@ -106,7 +133,9 @@ def expense_detail(request, budget_id, pk):
     context = {
         "budget": budget,
         "expense": expense,
-        "expense_items": expense_items,
+        "expense_items": page.items,
+        "expense_item_count": ExpenseItem.objects.filter(expense=expense).count(),
+        "page": page,
         "edit_restrictions": edit_restrictions,
     }
     return render(request, "expenses/expense_detail.html", context)
@@ -114,14 +143,13 @@ def expense_detail(request, budget_id, pk):
 
 def expense_edit(request, budget_id, pk):
     """Edit existing expense"""
-    budget = get_object_or_404(Budget, id=budget_id)
+    budget = get_budget_or_404(budget_id)
     expense = get_object_or_404(Expense, pk=pk, budget=budget)
 
     # Check if expense can be edited
     if not expense.can_be_edited():
         restrictions = expense.get_edit_restrictions()
-        reasons = restrictions["reasons"]
-        reason_text = " ".join(reasons) if isinstance(reasons, list) else str(reasons)
+        reason_text = " ".join(restrictions.reasons)
         messages.error(request, f"This expense cannot be edited. {reason_text}")
         return redirect("expense_detail", budget_id=budget_id, pk=expense.pk)
 
@@ -157,7 +185,7 @@ def expense_edit(request, budget_id, pk):
 
 def expense_delete(request, budget_id, pk):
     """Delete expense with confirmation"""
-    budget = get_object_or_404(Budget, id=budget_id)
+    budget = get_budget_or_404(budget_id)
     expense = get_object_or_404(Expense, pk=pk, budget=budget)
 
     if request.method == "POST":
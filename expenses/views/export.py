@@ -0,0 +1,34 @@
+from django.http import Http404, StreamingHttpResponse
+from django.utils.text import compress_sequence
+from ..request_cache import get_budget_or_404
+from ..export import BudgetExportService
+
+
+def budget_export(request, budget_id, dataset, fmt):
+    """
+    Stream expenses, expense items or payments of a budget as a file download.
+
+    Pass gzip=1 to get the file gzip-compressed on the fly.
+    """
+    budget = get_budget_or_404(budget_id)
+    if (
+        dataset not in BudgetExportService.DATASETS
+        or fmt not in BudgetExportService.FORMATS
+    ):
+        raise Http404("Unknown export")
+
+    compressed = request.GET.get("gzip") == "1"
+    chunks = BudgetExportService.stream(budget.pk, dataset, fmt)
+    if compressed:
+        response = StreamingHttpResponse(
+            compress_sequence(chunk.encode() for chunk in chunks),
+            content_type="application/gzip",
+        )
+    else:
+        response = StreamingHttpResponse(
+            chunks, content_type=f"{BudgetExportService.FORMATS[fmt]}; charset=utf-8"
+        )
+
+    filename = BudgetExportService.get_filename(budget.pk, dataset, fmt, compressed)
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
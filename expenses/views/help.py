@@ -1,12 +1,11 @@
 import os
-import markdown
 from django.shortcuts import render
-from django.conf import settings
+from ..help_docs import HelpDocsService, HelpSearchService
 
 
 def help_index(request):
     """Display README.md if exists, otherwise list of available documentation files."""
-    docs_dir = os.path.join(settings.BASE_DIR, "docs")
+    docs_dir = HelpDocsService.get_docs_dir()
 
     if not os.path.exists(docs_dir):
         return render(
@@ -22,25 +21,15 @@ def help_index(request):
     readme_path = os.path.join(docs_dir, "README.md")
     if not force_list and os.path.exists(readme_path) and os.path.isfile(readme_path):
         try:
-            with open(readme_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Convert markdown to HTML
-            md = markdown.Markdown(extensions=["extra", "codehilite", "toc"])
-            html_content = md.convert(content)
-
-            # Extract title from first h1 or use default
-            title = "Documentation"
-            if content.startswith("# "):
-                first_line = content.split("\n")[0]
-                title = first_line[2:].strip()
+            # Rendered once and served from memory until the file changes
+            doc = HelpDocsService.get_doc("README")
 
             return render(
                 request,
                 "expenses/help_page.html",
                 {
-                    "title": title,
-                    "content": html_content,
+                    "title": doc.heading or "Documentation",
+                    "content": doc.html,
                     "page_name": "README",
                     "is_readme": True,
                 },
@@ -82,7 +71,7 @@ def help_index(request):
 
 def help_page(request, page_name):
     """Display a specific documentation page."""
-    docs_dir = os.path.join(settings.BASE_DIR, "docs")
+    docs_dir = HelpDocsService.get_docs_dir()
     file_path = os.path.join(docs_dir, f"{page_name}.md")
 
     # Security check: ensure the file is within docs directory
@@ -113,23 +102,16 @@ def help_page(request, page_name):
         )
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Convert markdown to HTML
-        md = markdown.Markdown(extensions=["extra", "codehilite", "toc"])
-        html_content = md.convert(content)
+        # Rendered once and served from memory until the file changes
+        doc = HelpDocsService.get_doc(page_name)
 
-        # Extract title from first h1 or use filename
-        title = page_name.replace("_", " ").replace("-", " ").title()
-        if content.startswith("# "):
-            first_line = content.split("\n")[0]
-            title = first_line[2:].strip()
+        # Use first h1 as title or fall back to filename
+        title = doc.heading or page_name.replace("_", " ").replace("-", " ").title()
 
         return render(
             request,
             "expenses/help_page.html",
-            {"title": title, "content": html_content, "page_name": page_name},
+            {"title": title, "content": doc.html, "page_name": page_name},
         )
 
     except (OSError, UnicodeDecodeError) as e:
@@ -141,6 +123,26 @@ def help_page(request, page_name):
         )
 
 
+def help_search(request):
+    """Search documentation pages and sections."""
+    query = request.GET.get("q", "").strip()
+    results = []
+    error = None
+
+    if query:
+        try:
+            # Served from an in-memory index, rebuilt only when docs change
+            results = HelpSearchService.search(query)
+        except (OSError, UnicodeDecodeError) as e:
+            error = f"Error searching documentation: {e}"
+
+    return render(
+        request,
+        "expenses/help_search.html",
+        {"query": query, "results": results, "error": error},
+    )
+
+
 def _render_help_error(request, page_name, error_title, error_message):
     """Render a user-friendly error page for help system."""
     error_content = f"""
@@ -1,47 +1,61 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
-from ..models import BudgetMonth, ExpenseItem, Budget
+from ..models import BudgetMonth, BudgetMonthSummary, ExpenseItem
+from ..pagination import KeysetPaginator
+from ..request_cache import get_budget_or_404
+from .decorators import budget_conditional_get
 
+MONTHS_PER_PAGE = 24
 
+
+@budget_conditional_get
 def month_list(request, budget_id):
     """List all months for a specific budget"""
-    budget = get_object_or_404(Budget, id=budget_id)
-    months = BudgetMonth.objects.filter(budget=budget)
+    budget = get_budget_or_404(budget_id)
+    months = BudgetMonth.objects.filter(budget=budget).select_related("summary")
 
-    # Calculate balance for each month (expenses as negative impact)
-    from django.db.models import Sum
-    from decimal import Decimal
+    # Page through months newest first; period orders like (year, month)
+    page = KeysetPaginator(months, ("-period",), MONTHS_PER_PAGE).get_page(request.GET)
 
-    for month in months:
-        # Sum all expense items for this month
-        total_expenses = month.expenseitem_set.aggregate(total=Sum("amount"))[
-            "total"
-        ] or Decimal("0.00")
+    # Calculate balance for each month (expenses as negative impact)
+    for month in page:
+        summary = BudgetMonthSummary.for_month(month)
 
         # Balance shows financial impact (negative for expenses)
-        month.balance = -total_expenses  # type: ignore[attr-defined]
+        month.balance = -summary.total_amount  # type: ignore[attr-defined]
 
     # Get next allowed month for this budget
     next_allowed = BudgetMonth.get_next_allowed_month(budget=budget)
 
     context = {
         "budget": budget,
-        "months": months,
+        "months": page.items,
+        "month_count": months.count(),
+        "page": page,
         "next_allowed_month": next_allowed,
     }
     return render(request, "expenses/month_list.html", context)
 
 
+@budget_conditional_get
 def month_detail(request, budget_id, year, month):
     """Display month details with expense items"""
-    budget = get_object_or_404(Budget, id=budget_id)
-    month_obj = get_object_or_404(BudgetMonth, year=year, month=month, budget=budget)
-    expense_items = ExpenseItem.objects.filter(month=month_obj).select_related(
-        "expense", "expense__payee"
+    budget = get_budget_or_404(budget_id)
+    month_obj = get_object_or_404(
+        BudgetMonth.objects.select_related("summary"),
+        year=year,
+        month=month,
+        budget=budget,
+    )
+    expense_items = (
+        ExpenseItem.objects.filter(month=month_obj)
+        .select_related("expense", "expense__payee")
+        .with_payment_totals()
     )
 
-    total_amount = sum(item.amount for item in expense_items)
-    paid_amount = sum(item.get_total_paid() for item in expense_items)
+    summary = BudgetMonthSummary.for_month(month_obj)
+    total_amount = summary.total_amount
+    paid_amount = summary.paid_amount
     pending_amount = total_amount - paid_amount
 
     # Create normalized summary data for the include
@@ -67,7 +81,7 @@ def month_detail(request, budget_id, year, month):
 
 def month_delete(request, budget_id, year, month):
     """Delete month with validation"""
-    budget = get_object_or_404(Budget, id=budget_id)
+    budget = get_budget_or_404(budget_id)
     month_obj = get_object_or_404(BudgetMonth, year=year, month=month, budget=budget)
 
     # Check if this is the most recent month for this budget
@@ -103,7 +117,7 @@ def month_delete(request, budget_id, year, month):
 
 def month_process(request, budget_id):
     """Process new month generation for a specific budget"""
-    budget = get_object_or_404(Budget, id=budget_id)
+    budget = get_budget_or_404(budget_id)
 
     # Determine next month to create automatically
     next_allowed = BudgetMonth.get_next_allowed_month(budget=budget)
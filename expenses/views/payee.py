@@ -3,20 +3,15 @@ from django.contrib import messages
 from django.utils import timezone
 from ..models import Payee, Expense
 from ..forms import PayeeForm
+from ..services import PayeeDirectoryService
 
 
 def payee_list(request):
     """List all payees"""
     show_hidden = request.GET.get("show_hidden", "false") == "true"
 
-    if show_hidden:
-        payees = Payee.objects.all()
-    else:
-        payees = Payee.objects.filter(hidden_at__isnull=True)
-
-    # Add expense count for each payee
-    for payee in payees:
-        payee.expense_count = Expense.objects.filter(payee=payee).count()  # type: ignore[attr-defined]
+    # Payees with annotated expense counts, served from the payee directory cache
+    payees = PayeeDirectoryService.get_payees(include_hidden=show_hidden)
 
     context = {
         "payees": payees,
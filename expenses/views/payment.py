@@ -1,13 +1,16 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
+from django.db import transaction
 from datetime import datetime
-from ..models import ExpenseItem, Budget
+from ..models import ExpenseItem
+from ..request_cache import get_budget_or_404
+from ..search import ExpenseSearchService
 from ..forms import PaymentForm, ExpenseItemEditForm
 
 
 def expense_item_pay(request, budget_id, pk):
     """Record payment for expense item"""
-    budget = get_object_or_404(Budget, id=budget_id)
+    budget = get_budget_or_404(budget_id)
     expense_item = get_object_or_404(ExpenseItem, pk=pk, month__budget=budget)
 
     if request.method == "POST":
@@ -56,12 +59,17 @@ def expense_item_pay(request, budget_id, pk):
 
 def expense_item_unpay(request, budget_id, pk):
     """Mark expense item as unpaid by removing all payments"""
-    budget = get_object_or_404(Budget, id=budget_id)
+    budget = get_budget_or_404(budget_id)
     expense_item = get_object_or_404(ExpenseItem, pk=pk, month__budget=budget)
 
     if request.method == "POST":
-        payment_count = expense_item.payment_set.count()
-        expense_item.payment_set.all().delete()
+        payment_count = expense_item.payment_count
+        with transaction.atomic():
+            expense_item.payment_set.all().delete()
+            # Bulk delete bypasses Payment.delete(), so refresh totals and
+            # the search index explicitly
+            ExpenseItem.refresh_payment_totals([expense_item.pk])
+            ExpenseSearchService.index_expenses([expense_item.expense_id])
         messages.success(
             request, f"All payments ({payment_count}) removed successfully."
         )
@@ -76,7 +84,7 @@ def expense_item_unpay(request, budget_id, pk):
 
 def expense_item_edit(request, budget_id, pk):
     """Edit expense item due date with month validation"""
-    budget = get_object_or_404(Budget, id=budget_id)
+    budget = get_budget_or_404(budget_id)
     expense_item = get_object_or_404(ExpenseItem, pk=pk, month__budget=budget)
 
     if request.method == "POST":
@@ -101,7 +109,7 @@ def expense_item_edit(request, budget_id, pk):
 
 def expense_item_payments(request, budget_id, pk):
     """List all payments for a specific expense item"""
-    budget = get_object_or_404(Budget, id=budget_id)
+    budget = get_budget_or_404(budget_id)
     expense_item = get_object_or_404(ExpenseItem, pk=pk, month__budget=budget)
 
     # Get all payments for this expense item, ordered by payment date
@@ -120,7 +128,7 @@ def expense_item_payments(request, budget_id, pk):
 
 def expense_item_delete(request, budget_id, pk):
     """Delete expense item and its parent one-time expense if allowed"""
-    budget = get_object_or_404(Budget, id=budget_id)
+    budget = get_budget_or_404(budget_id)
     expense_item = get_object_or_404(ExpenseItem, pk=pk, month__budget=budget)
 
     # Check if item can be deleted
@@ -0,0 +1,57 @@
+from django.http import JsonResponse
+from django.shortcuts import render
+from django.urls import reverse
+from ..models import Budget
+from ..search import ExpenseSearchService
+
+
+def _get_search_params(request):
+    """Read query, optional budget id and limit from GET parameters."""
+    query = request.GET.get("q", "").strip()
+    try:
+        budget_id = int(request.GET["budget"]) if request.GET.get("budget") else None
+    except ValueError:
+        budget_id = None
+    try:
+        limit = int(request.GET.get("limit", ExpenseSearchService.DEFAULT_LIMIT))
+    except ValueError:
+        limit = ExpenseSearchService.DEFAULT_LIMIT
+    limit = max(1, min(limit, ExpenseSearchService.DEFAULT_LIMIT))
+    return query, budget_id, limit
+
+
+def expense_search(request):
+    """Search expenses of all budgets by title, notes, payee or transaction ID."""
+    query, budget_id, limit = _get_search_params(request)
+    expenses = ExpenseSearchService.search(query, budget_id, limit) if query else []
+
+    context = {
+        "query": query,
+        "expenses": expenses,
+        "budgets": Budget.objects.order_by("name"),
+        "selected_budget": budget_id,
+    }
+    return render(request, "expenses/expense_search.html", context)
+
+
+def expense_search_api(request):
+    """Return expense search results as JSON."""
+    query, budget_id, limit = _get_search_params(request)
+    expenses = ExpenseSearchService.search(query, budget_id, limit) if query else []
+
+    results = [
+        {
+            "id": expense.pk,
+            "budget_id": expense.budget_id,
+            "budget": expense.budget.name,
+            "title": expense.title,
+            "payee": expense.payee.name if expense.payee else None,
+            "expense_type": expense.expense_type,
+            "amount": str(expense.amount),
+            "start_date": expense.start_date.isoformat(),
+            "rank": expense.search_rank,
+            "url": reverse("expense_detail", args=[expense.budget_id, expense.pk]),
+        }
+        for expense in expenses
+    ]
+    return JsonResponse({"query": query, "results": results})
@@ -74,6 +74,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "expenses.middleware.RequestCacheMiddleware",
 ]
 
 ROOT_URLCONF = "pyggy.urls"
@@ -180,6 +181,24 @@ TESTING = (
     "test" in sys.argv or "pytest" in sys.modules or "GITHUB_ACTIONS" in os.environ
 )
 
+# Cache shared by the web server and management commands (rendered pages,
+# payee directory, help pages, settings). Entries are keyed by data versions
+# stored in the database, so they never go stale across processes.
+if TESTING:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": BASE_DIR / "cache",
+            "OPTIONS": {"MAX_ENTRIES": 2000},
+        }
+    }
+
 # Configure SASS processor for different environments
 if TESTING:
     # In test environments, disable SASS processor to avoid file not found errors
@@ -199,3 +218,7 @@ if DEBUG:
 else:
     # Production settings
     SASS_PROCESSOR_OUTPUT_STYLE = "compressed"
+
+# Number of formatted amounts kept per compiled currency formatter (LRU),
+# 0 disables caching of formatted values
+CURRENCY_FORMAT_CACHE_SIZE = 1024